@@ -0,0 +1,62 @@
+"""create export jobs
+
+Revision ID: 7d3e9a41c2b5
+Revises: 0f42a934865d
+Create Date: 2025-03-03 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql as pg
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7d3e9a41c2b5"
+down_revision: Union[str, None] = "0f42a934865d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+export_job_format_enum = sa.Enum("json", "csv", name="export_job_format")
+export_job_status_enum = sa.Enum(
+    "pending", "running", "completed", "failed", name="export_job_status"
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "export_jobs",
+        sa.Column("id", pg.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", pg.UUID(as_uuid=True), nullable=False),
+        sa.Column("format", export_job_format_enum, nullable=False),
+        sa.Column("status", export_job_status_enum, nullable=False),
+        sa.Column("watermark", sa.String(length=255), nullable=False),
+        sa.Column("storage_key", sa.String(length=500), nullable=True),
+        sa.Column("size_bytes", sa.BigInteger(), nullable=True),
+        sa.Column("error", sa.String(length=500), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_export_jobs_user_format_watermark",
+        "export_jobs",
+        ["user_id", "format", "watermark"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_export_jobs_user_format_watermark", table_name="export_jobs")
+    op.drop_table("export_jobs")
+
+    export_job_status_enum.drop(op.get_bind(), checkfirst=True)
+    export_job_format_enum.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,127 @@
+"""add sync change feed
+
+Revision ID: a6c4f2d8e913
+Revises: 7d3e9a41c2b5
+Create Date: 2025-03-10 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql as pg
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a6c4f2d8e913"
+down_revision: Union[str, None] = "7d3e9a41c2b5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SYNC_TOMBSTONE_ENTITIES = {
+    "spots": "spot",
+    "spot_images": "spot_image",
+    "goshuin_records": "goshuin_record",
+    "goshuin_images": "goshuin_image",
+}
+
+
+def upgrade() -> None:
+    # The goshuin tables revision omitted the owner column the Spot model declares
+    op.execute(
+        'ALTER TABLE spots ADD COLUMN IF NOT EXISTS user_id UUID REFERENCES "user" (id)'
+    )
+
+    for table in ("spot_images", "goshuin_images"):
+        op.add_column(
+            table,
+            sa.Column(
+                "updated_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.text("now()"),
+                server_onupdate=sa.text("now()"),
+                nullable=False,
+            ),
+        )
+
+    op.create_index(
+        "ix_spots_user_id_updated_at", "spots", ["user_id", "updated_at"], unique=False
+    )
+    op.create_index(
+        "ix_goshuin_records_user_id_updated_at",
+        "goshuin_records",
+        ["user_id", "updated_at"],
+        unique=False,
+    )
+    op.create_index("ix_spot_images_updated_at", "spot_images", ["updated_at"], unique=False)
+    op.create_index(
+        "ix_goshuin_images_updated_at", "goshuin_images", ["updated_at"], unique=False
+    )
+
+    op.create_table(
+        "sync_tombstones",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("user_id", pg.UUID(as_uuid=True), nullable=False),
+        sa.Column("entity_type", sa.String(length=32), nullable=False),
+        sa.Column("entity_id", pg.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "deleted_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_sync_tombstones_user_id_deleted_at",
+        "sync_tombstones",
+        ["user_id", "deleted_at"],
+        unique=False,
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION record_sync_tombstone() RETURNS trigger AS $$
+        DECLARE
+            owner_id uuid;
+        BEGIN
+            IF TG_TABLE_NAME = 'spot_images' THEN
+                SELECT user_id INTO owner_id FROM spots WHERE id = OLD.spot_id;
+            ELSIF TG_TABLE_NAME = 'goshuin_images' THEN
+                SELECT user_id INTO owner_id FROM goshuin_records
+                WHERE id = OLD.goshuin_record_id;
+            ELSE
+                owner_id := OLD.user_id;
+            END IF;
+            IF owner_id IS NOT NULL THEN
+                INSERT INTO sync_tombstones (user_id, entity_type, entity_id)
+                VALUES (owner_id, TG_ARGV[0], OLD.id);
+            END IF;
+            RETURN OLD;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table, entity_type in SYNC_TOMBSTONE_ENTITIES.items():
+        op.execute(
+            f"CREATE TRIGGER {table}_sync_tombstone AFTER DELETE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION record_sync_tombstone('{entity_type}')"
+        )
+
+
+def downgrade() -> None:
+    for table in SYNC_TOMBSTONE_ENTITIES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_sync_tombstone ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS record_sync_tombstone()")
+
+    op.drop_index("ix_sync_tombstones_user_id_deleted_at", table_name="sync_tombstones")
+    op.drop_table("sync_tombstones")
+
+    op.drop_index("ix_goshuin_images_updated_at", table_name="goshuin_images")
+    op.drop_index("ix_spot_images_updated_at", table_name="spot_images")
+    op.drop_index("ix_goshuin_records_user_id_updated_at", table_name="goshuin_records")
+    op.drop_index("ix_spots_user_id_updated_at", table_name="spots")
+
+    op.drop_column("goshuin_images", "updated_at")
+    op.drop_column("spot_images", "updated_at")
@@ -0,0 +1,32 @@
+"""add spot location index
+
+Revision ID: a7d3f9b2c648
+Revises: f2a6d8c4e157
+Create Date: 2025-04-14 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7d3f9b2c648"
+down_revision: Union[str, None] = "f2a6d8c4e157"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_spots_location",
+        "spots",
+        [sa.text("point(longitude, latitude)")],
+        unique=False,
+        postgresql_using="gist",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_spots_location", table_name="spots")
@@ -0,0 +1,28 @@
+"""add spot image thumbnail url
+
+Revision ID: b3e8f1d5a926
+Revises: a7d3f9b2c648
+Create Date: 2025-04-21 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3e8f1d5a926"
+down_revision: Union[str, None] = "a7d3f9b2c648"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "spot_images", sa.Column("thumbnail_url", sa.String(length=500), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("spot_images", "thumbnail_url")
@@ -0,0 +1,62 @@
+"""add spot search
+
+Revision ID: c1e7b3f05a22
+Revises: a6c4f2d8e913
+Create Date: 2025-03-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql as pg
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c1e7b3f05a22"
+down_revision: Union[str, None] = "a6c4f2d8e913"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SPOT_SEARCH_TEXT = (
+    "coalesce(name, '') || ' ' || coalesce(address, '') || ' ' || coalesce(description, '')"
+)
+SPOT_SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(address, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column(
+        "spots",
+        sa.Column("search_text", sa.Text(), sa.Computed(SPOT_SEARCH_TEXT, persisted=True)),
+    )
+    op.add_column(
+        "spots",
+        sa.Column(
+            "search_vector", pg.TSVECTOR(), sa.Computed(SPOT_SEARCH_VECTOR, persisted=True)
+        ),
+    )
+    op.create_index(
+        "ix_spots_search_vector", "spots", ["search_vector"], postgresql_using="gin"
+    )
+    op.create_index(
+        "ix_spots_search_text_trgm",
+        "spots",
+        ["search_text"],
+        postgresql_using="gin",
+        postgresql_ops={"search_text": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_spots_search_text_trgm", table_name="spots")
+    op.drop_index("ix_spots_search_vector", table_name="spots")
+    op.drop_column("spots", "search_vector")
+    op.drop_column("spots", "search_text")
+    # pg_trgm is left installed; other objects may have come to depend on it
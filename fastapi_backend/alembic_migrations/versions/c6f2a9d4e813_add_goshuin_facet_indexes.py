@@ -0,0 +1,41 @@
+"""add goshuin facet indexes
+
+Revision ID: c6f2a9d4e813
+Revises: b3e8f1d5a926
+Create Date: 2025-04-28 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c6f2a9d4e813"
+down_revision: Union[str, None] = "b3e8f1d5a926"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The spot type filter of the goshuin list is scoped to one user like the
+    # prefecture filter, so (user_id, spot_type) replaces the global index
+    op.create_index(
+        "ix_spots_user_id_spot_type", "spots", ["user_id", "spot_type"], unique=False
+    )
+    op.drop_index("ix_spots_spot_type", table_name="spots")
+    # Status filters, such as the planned visits, keep the visit date order
+    op.create_index(
+        "ix_goshuin_records_user_id_status_visit_date",
+        "goshuin_records",
+        ["user_id", "status", "visit_date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_goshuin_records_user_id_status_visit_date", table_name="goshuin_records"
+    )
+    op.create_index("ix_spots_spot_type", "spots", ["spot_type"], unique=False)
+    op.drop_index("ix_spots_user_id_spot_type", table_name="spots")
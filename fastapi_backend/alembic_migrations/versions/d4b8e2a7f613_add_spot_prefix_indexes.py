@@ -0,0 +1,39 @@
+"""add spot prefix indexes
+
+Revision ID: d4b8e2a7f613
+Revises: c1e7b3f05a22
+Create Date: 2025-03-24 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d4b8e2a7f613"
+down_revision: Union[str, None] = "c1e7b3f05a22"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_spots_user_id_lower_name",
+        "spots",
+        ["user_id", sa.text("lower(name) text_pattern_ops")],
+        unique=False,
+    )
+    op.create_index(
+        "ix_spots_user_id_slug",
+        "spots",
+        ["user_id", "slug"],
+        unique=False,
+        postgresql_ops={"slug": "text_pattern_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_spots_user_id_slug", table_name="spots")
+    op.drop_index("ix_spots_user_id_lower_name", table_name="spots")
@@ -0,0 +1,171 @@
+"""add prefecture counters
+
+Revision ID: d8a4c7e2f519
+Revises: c6f2a9d4e813
+Create Date: 2025-05-02 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql as pg
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d8a4c7e2f519"
+down_revision: Union[str, None] = "c6f2a9d4e813"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+PREFECTURE_COUNTER_TRIGGERS = {
+    "spots_prefecture_counter_insert": (
+        "AFTER INSERT ON spots FOR EACH ROW EXECUTE FUNCTION count_spot_prefecture()"
+    ),
+    "spots_prefecture_counter_update": (
+        "AFTER UPDATE OF user_id, prefecture ON spots FOR EACH ROW "
+        "WHEN (OLD.user_id IS DISTINCT FROM NEW.user_id "
+        "OR OLD.prefecture IS DISTINCT FROM NEW.prefecture) "
+        "EXECUTE FUNCTION count_spot_prefecture()"
+    ),
+    "spots_prefecture_counter_delete": (
+        "BEFORE DELETE ON spots FOR EACH ROW EXECUTE FUNCTION count_spot_prefecture()"
+    ),
+    "goshuin_records_prefecture_counter": (
+        "AFTER INSERT OR DELETE ON goshuin_records "
+        "FOR EACH ROW EXECUTE FUNCTION count_goshuin_prefecture()"
+    ),
+    "goshuin_records_prefecture_counter_update": (
+        "AFTER UPDATE OF spot_id, user_id ON goshuin_records FOR EACH ROW "
+        "WHEN (OLD.spot_id IS DISTINCT FROM NEW.spot_id "
+        "OR OLD.user_id IS DISTINCT FROM NEW.user_id) "
+        "EXECUTE FUNCTION count_goshuin_prefecture()"
+    ),
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "prefecture_counters",
+        sa.Column("user_id", pg.UUID(as_uuid=True), nullable=False),
+        sa.Column("prefecture", sa.String(length=100, collation="C"), nullable=False),
+        sa.Column("spot_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("goshuin_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.PrimaryKeyConstraint("user_id", "prefecture"),
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_prefecture_counter(
+            owner_id uuid, counted_prefecture varchar, spots integer, records integer
+        ) RETURNS void AS $$
+        BEGIN
+            IF spots = 0 AND records = 0 THEN
+                RETURN;
+            END IF;
+            INSERT INTO prefecture_counters AS counter
+                (user_id, prefecture, spot_count, goshuin_count)
+            VALUES (owner_id, counted_prefecture, spots, records)
+            ON CONFLICT (user_id, prefecture) DO UPDATE
+            SET spot_count = counter.spot_count + EXCLUDED.spot_count,
+                goshuin_count = counter.goshuin_count + EXCLUDED.goshuin_count;
+            IF spots < 0 OR records < 0 THEN
+                DELETE FROM prefecture_counters
+                WHERE user_id = owner_id AND prefecture = counted_prefecture
+                    AND spot_count = 0 AND goshuin_count = 0;
+            END IF;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION count_spot_prefecture() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                PERFORM bump_prefecture_counter(
+                    OLD.user_id,
+                    OLD.prefecture,
+                    -1,
+                    -(SELECT count(*) FROM goshuin_records
+                      WHERE spot_id = OLD.id AND user_id = OLD.user_id)::integer
+                );
+            END IF;
+            IF TG_OP = 'INSERT' THEN
+                PERFORM bump_prefecture_counter(NEW.user_id, NEW.prefecture, 1, 0);
+            ELSIF TG_OP = 'UPDATE' THEN
+                PERFORM bump_prefecture_counter(
+                    NEW.user_id,
+                    NEW.prefecture,
+                    1,
+                    (SELECT count(*) FROM goshuin_records
+                     WHERE spot_id = NEW.id AND user_id = NEW.user_id)::integer
+                );
+            END IF;
+            IF TG_OP = 'DELETE' THEN
+                RETURN OLD;
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION count_goshuin_prefecture() RETURNS trigger AS $$
+        DECLARE
+            spot_owner uuid;
+            spot_prefecture varchar;
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                SELECT user_id, prefecture INTO spot_owner, spot_prefecture
+                FROM spots WHERE id = OLD.spot_id;
+                IF spot_owner = OLD.user_id THEN
+                    PERFORM bump_prefecture_counter(spot_owner, spot_prefecture, 0, -1);
+                END IF;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                SELECT user_id, prefecture INTO spot_owner, spot_prefecture
+                FROM spots WHERE id = NEW.spot_id;
+                IF spot_owner = NEW.user_id THEN
+                    PERFORM bump_prefecture_counter(spot_owner, spot_prefecture, 0, 1);
+                END IF;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for trigger, definition in PREFECTURE_COUNTER_TRIGGERS.items():
+        op.execute(f"CREATE TRIGGER {trigger} {definition}")
+
+    # Count the existing rows; the triggers take over from here
+    op.execute(
+        """
+        INSERT INTO prefecture_counters (user_id, prefecture, spot_count, goshuin_count)
+        SELECT spots.user_id, spots.prefecture, count(*), coalesce(sum(records.goshuin_count), 0)
+        FROM spots
+        LEFT OUTER JOIN (
+            SELECT spot_id, user_id, count(*) AS goshuin_count
+            FROM goshuin_records
+            GROUP BY spot_id, user_id
+        ) AS records ON records.spot_id = spots.id AND records.user_id = spots.user_id
+        GROUP BY spots.user_id, spots.prefecture
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS spots_prefecture_counter_insert ON spots")
+    op.execute("DROP TRIGGER IF EXISTS spots_prefecture_counter_update ON spots")
+    op.execute("DROP TRIGGER IF EXISTS spots_prefecture_counter_delete ON spots")
+    op.execute("DROP TRIGGER IF EXISTS goshuin_records_prefecture_counter ON goshuin_records")
+    op.execute(
+        "DROP TRIGGER IF EXISTS goshuin_records_prefecture_counter_update ON goshuin_records"
+    )
+    op.execute("DROP FUNCTION IF EXISTS count_goshuin_prefecture()")
+    op.execute("DROP FUNCTION IF EXISTS count_spot_prefecture()")
+    op.execute("DROP FUNCTION IF EXISTS bump_prefecture_counter(uuid, varchar, integer, integer)")
+
+    op.drop_table("prefecture_counters")
@@ -0,0 +1,34 @@
+"""add keyset pagination indexes
+
+Revision ID: e5c9a3f1b824
+Revises: d4b8e2a7f613
+Create Date: 2025-03-31 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5c9a3f1b824"
+down_revision: Union[str, None] = "d4b8e2a7f613"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_spots_user_id_name_id", "spots", ["user_id", "name", "id"], unique=False
+    )
+    op.create_index(
+        "ix_goshuin_records_user_id_visit_date_id",
+        "goshuin_records",
+        ["user_id", "visit_date", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_goshuin_records_user_id_visit_date_id", table_name="goshuin_records")
+    op.drop_index("ix_spots_user_id_name_id", table_name="spots")
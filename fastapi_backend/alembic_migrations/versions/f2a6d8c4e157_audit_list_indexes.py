@@ -0,0 +1,37 @@
+"""audit list indexes
+
+Revision ID: f2a6d8c4e157
+Revises: e5c9a3f1b824
+Create Date: 2025-04-07 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a6d8c4e157"
+down_revision: Union[str, None] = "e5c9a3f1b824"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Every spot query is scoped to one user; the prefecture filter and the
+    # prefecture statistics read (user_id, prefecture) instead of a global index
+    op.create_index(
+        "ix_spots_user_id_prefecture", "spots", ["user_id", "prefecture"], unique=False
+    )
+    op.drop_index("ix_spots_prefecture", table_name="spots")
+    # Covered by ix_goshuin_records_user_id_visit_date_id and
+    # uq_goshuin_records_unique_visit, which both lead with user_id
+    op.drop_index("ix_goshuin_records_user_id", table_name="goshuin_records")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_goshuin_records_user_id", "goshuin_records", ["user_id"], unique=False
+    )
+    op.create_index("ix_spots_prefecture", "spots", ["prefecture"], unique=False)
+    op.drop_index("ix_spots_user_id_prefecture", table_name="spots")
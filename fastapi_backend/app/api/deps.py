@@ -1,15 +1,25 @@
 """Reusable FastAPI dependencies for API routes."""
 
+from collections.abc import Callable
 from typing import Annotated
+from uuid import UUID
 
-from fastapi import Depends, Query
+from fastapi import Depends, HTTPException, Query, status
 from fastapi_pagination import Params
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_async_session
+from app.fields import FieldSelectionError, FieldSet
 from app.models import User
+from app.pagination import TotalMode
+from app.schemas import GoshuinImageRead, GoshuinRead, SpotImageRead, SpotListItem, SpotRead
 from app.users import current_active_user
 from app.services import StorageService, get_storage_service
+from app.services.clusters import SpotClusterService, get_spot_cluster_service
+from app.services.counts import TotalCountService, get_total_count_service
+from app.services.nearby import SpotLocationService, get_spot_location_service
+from app.services.suggest import SpotSuggestionService, get_spot_suggestion_service
 
 
 DatabaseSession = Annotated[AsyncSession, Depends(get_async_session)]
@@ -32,6 +42,77 @@ def get_pagination_params(
 
 
 PaginationParams = Annotated[Params, Depends(get_pagination_params)]
+CursorParam = Annotated[
+    str | None,
+    Query(
+        description=(
+            "Cursor taken from `next_cursor` of the previous page. Pages are then read "
+            "by key instead of by offset, `page` is ignored and no total is computed."
+        ),
+    ),
+]
+TotalModeParam = Annotated[
+    TotalMode,
+    Query(
+        description=(
+            "`exact` counts the matching items, `estimated` returns a cached or "
+            "planner estimate of the count and `none` skips it"
+        ),
+    ),
+]
+
+
+def sparse_fields(schema: type[BaseModel]) -> Callable[[str | None], FieldSet | None]:
+    """Return a dependency parsing the ``fields`` query parameter against ``schema``."""
+
+    def dependency(
+        fields: str | None = Query(
+            default=None,
+            description=(
+                "Comma separated fields to return, `id` is always included: "
+                + ", ".join(schema.model_fields)
+            ),
+        ),
+    ) -> FieldSet | None:
+        if fields is None:
+            return None
+        try:
+            return FieldSet.parse(schema, fields)
+        except FieldSelectionError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
+            ) from exc
+
+    return dependency
+
+
+SpotListFieldsParam = Annotated[FieldSet | None, Depends(sparse_fields(SpotListItem))]
+SpotFieldsParam = Annotated[FieldSet | None, Depends(sparse_fields(SpotRead))]
+GoshuinFieldsParam = Annotated[FieldSet | None, Depends(sparse_fields(GoshuinRead))]
+SpotImageFieldsParam = Annotated[FieldSet | None, Depends(sparse_fields(SpotImageRead))]
+GoshuinImageFieldsParam = Annotated[FieldSet | None, Depends(sparse_fields(GoshuinImageRead))]
+
+
+class SpotCaches:
+    """Per-user caches derived from a user's spots, dropped together on writes."""
+
+    def __init__(
+        self,
+        suggestions: SpotSuggestionService = Depends(get_spot_suggestion_service),
+        totals: TotalCountService = Depends(get_total_count_service),
+        clusters: SpotClusterService = Depends(get_spot_cluster_service),
+        locations: SpotLocationService = Depends(get_spot_location_service),
+    ) -> None:
+        self._caches = (suggestions, totals, clusters, locations)
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Forget everything cached about the spots of ``user_id``."""
+
+        for cache in self._caches:
+            cache.invalidate(user_id)
+
+
+SpotCachesDependency = Annotated[SpotCaches, Depends()]
 
 
 CurrentUser = Annotated[User, Depends(get_current_user)]
@@ -2,16 +2,71 @@
 
 from __future__ import annotations
 
+import logging
 from datetime import datetime
+from tempfile import SpooledTemporaryFile
+from typing import IO, Annotated, AsyncGenerator, AsyncIterator
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
+from starlette.background import BackgroundTask
 
-from app.api.deps import CurrentUser, DatabaseSession
-from app.services import ExportBundle, ExportService, get_export_service
+from app.api.deps import (
+    CurrentUser,
+    DatabaseSession,
+    PaginationParams,
+    SpotCachesDependency,
+    StorageDependency,
+)
+from app.models import ExportJobFormat, ExportJobStatus
+from app.schemas.export import ExportJobCreate, ExportJobRead
+from app.serialization import json_dumps
+from app.services import (
+    ExportBundle,
+    ExportEngine,
+    ExportJobService,
+    ExportService,
+    ImportFormatError,
+    ImportResult,
+    ReactPdfDocumentPage,
+    StorageServiceError,
+    decompress_stream,
+    get_export_job_service,
+    get_export_service,
+    iter_json_bundle_entries,
+    iter_ndjson_entries,
+)
+from app.services.compression import (
+    COMPRESSION_MEDIA_TYPES,
+    COMPRESSION_SUFFIXES,
+    ExportCompression,
+    compress_stream,
+    negotiate_compression,
+)
+from app.services.export_jobs import EXPORT_JOB_CONTENT_TYPES
+from app.services.parquet import PARQUET_AVAILABLE, PARQUET_MEDIA_TYPE, ParquetTable
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/export", tags=["export"])
 
+# Request bodies larger than this are spooled to disk in progress mode
+IMPORT_SPOOL_MAX_MEMORY = 1024 * 1024
+IMPORT_SPOOL_READ_SIZE = 64 * 1024
+IMPORT_CONFLICT_DETAIL = "Unable to import the export with the existing data"
+
 
 def _build_attachment_filename(extension: str) -> str:
     """Return a timestamped filename for download responses."""
@@ -20,21 +75,74 @@ def _build_attachment_filename(extension: str) -> str:
     return f"goshuin-export-{timestamp}.{extension}"
 
 
+CompressionQuery = Annotated[
+    ExportCompression | None,
+    Query(description="Download a compressed file (.gz or .zst) instead of plain text"),
+]
+AcceptEncodingHeader = Annotated[str | None, Header()]
+
+
+def _export_response(
+    chunks: AsyncIterator[bytes],
+    *,
+    media_type: str,
+    extension: str,
+    compression: ExportCompression | None,
+    accept_encoding: str | None,
+) -> StreamingResponse:
+    """Stream an export, compressed as requested or as negotiated with the client.
+
+    ``compression`` downloads a compressed file such as ``.csv.zst``. Otherwise the
+    body is sent with a ``Content-Encoding`` picked from ``Accept-Encoding``.
+    """
+
+    headers = {"Vary": "Accept-Encoding"}
+    if compression is not None:
+        chunks = compress_stream(chunks, compression)
+        media_type = COMPRESSION_MEDIA_TYPES[compression]
+        extension = f"{extension}.{COMPRESSION_SUFFIXES[compression]}"
+    elif (encoding := negotiate_compression(accept_encoding)) is not None:
+        chunks = compress_stream(chunks, encoding)
+        headers["Content-Encoding"] = encoding.value
+    headers["Content-Disposition"] = (
+        f'attachment; filename="{_build_attachment_filename(extension)}"'
+    )
+    return StreamingResponse(chunks, media_type=media_type, headers=headers)
+
+
 @router.get("/json", response_class=StreamingResponse)
 async def export_json(
     session: DatabaseSession,
     user: CurrentUser,
+    include_pdf: bool = Query(
+        default=False, description="Include the React-PDF layout as `pdf_document`"
+    ),
+    engine: ExportEngine = Query(
+        default=ExportEngine.PYTHON,
+        description="Build the document in Python or let PostgreSQL render it",
+    ),
+    compression: CompressionQuery = None,
+    accept_encoding: AcceptEncodingHeader = None,
     service: ExportService = Depends(get_export_service),
 ) -> StreamingResponse:
     """Return the authenticated user's data as JSON."""
 
-    headers = {
-        "Content-Disposition": f'attachment; filename="{_build_attachment_filename("json")}"'
-    }
-    return StreamingResponse(
-        service.stream_json_export(session, user),
+    if engine is ExportEngine.DATABASE:
+        if include_pdf:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="The database export engine does not build the PDF layout",
+            )
+        chunks = service.stream_database_json_export(session, user)
+    else:
+        chunks = service.stream_json_export(session, user, include_pdf=include_pdf)
+
+    return _export_response(
+        chunks,
         media_type="application/json",
-        headers=headers,
+        extension="json",
+        compression=compression,
+        accept_encoding=accept_encoding,
     )
 
 
@@ -42,25 +150,202 @@ async def export_json(
 async def export_csv(
     session: DatabaseSession,
     user: CurrentUser,
+    compression: CompressionQuery = None,
+    accept_encoding: AcceptEncodingHeader = None,
     service: ExportService = Depends(get_export_service),
 ) -> StreamingResponse:
     """Return the authenticated user's data as CSV."""
 
-    headers = {
-        "Content-Disposition": f'attachment; filename="{_build_attachment_filename("csv")}"'
-    }
-    return StreamingResponse(
+    return _export_response(
         service.stream_csv_export(session, user),
         media_type="text/csv",
+        extension="csv",
+        compression=compression,
+        accept_encoding=accept_encoding,
+    )
+
+
+@router.get("/ndjson", response_class=StreamingResponse)
+async def export_ndjson(
+    session: DatabaseSession,
+    user: CurrentUser,
+    compression: CompressionQuery = None,
+    accept_encoding: AcceptEncodingHeader = None,
+    service: ExportService = Depends(get_export_service),
+) -> StreamingResponse:
+    """Return the authenticated user's data as newline delimited JSON."""
+
+    return _export_response(
+        service.stream_ndjson_export(session, user),
+        media_type="application/x-ndjson",
+        extension="ndjson",
+        compression=compression,
+        accept_encoding=accept_encoding,
+    )
+
+
+@router.get("/pdf", response_model=ReactPdfDocumentPage)
+async def export_pdf_document(
+    session: DatabaseSession,
+    user: CurrentUser,
+    pagination: PaginationParams,
+    service: ExportService = Depends(get_export_service),
+) -> ReactPdfDocumentPage:
+    """Return a page of the React-PDF document, one section per spot."""
+
+    return await service.build_pdf_document_page(session, user, pagination)
+
+
+@router.get("/parquet", response_class=StreamingResponse)
+async def export_parquet(
+    session: DatabaseSession,
+    user: CurrentUser,
+    table: ParquetTable = Query(
+        default=ParquetTable.SPOTS, description="Exported table written to the file"
+    ),
+    service: ExportService = Depends(get_export_service),
+) -> StreamingResponse:
+    """Return one of the authenticated user's tables as a typed Parquet file."""
+
+    if not PARQUET_AVAILABLE:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Parquet export is not available on this server",
+        )
+
+    filename = _build_attachment_filename(f"{table.value}.parquet")
+    return StreamingResponse(
+        service.stream_parquet_export(session, user, table),
+        media_type=PARQUET_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.post(
+    "/jobs", response_model=ExportJobRead, status_code=status.HTTP_202_ACCEPTED
+)
+async def create_export_job(
+    payload: ExportJobCreate,
+    background_tasks: BackgroundTasks,
+    session: DatabaseSession,
+    user: CurrentUser,
+    storage: StorageDependency,
+    service: ExportJobService = Depends(get_export_job_service),
+) -> ExportJobRead:
+    """Start a background export, or return the job for unchanged data.
+
+    While the user's data is unchanged the existing job (and its artifact) is
+    returned, so repeated requests do not rebuild the export.
+    """
+
+    job, created = await service.request_export(session, user, payload.format)
+    if created:
+        background_tasks.add_task(service.run_job, session, storage, job.id)
+    return ExportJobRead.model_validate(job)
+
+
+@router.get("/jobs/{job_id}", response_model=ExportJobRead)
+async def get_export_job(
+    job_id: UUID,
+    session: DatabaseSession,
+    user: CurrentUser,
+    service: ExportJobService = Depends(get_export_job_service),
+) -> ExportJobRead:
+    """Return the status of an export job."""
+
+    job = await service.get_job(session, user, job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export job not found")
+    return ExportJobRead.model_validate(job)
+
+
+@router.get("/jobs/{job_id}/download")
+async def download_export_job(
+    job_id: UUID,
+    session: DatabaseSession,
+    user: CurrentUser,
+    storage: StorageDependency,
+    service: ExportJobService = Depends(get_export_job_service),
+    range_header: str | None = Header(default=None, alias="Range"),
+    if_range: str | None = Header(default=None),
+) -> Response:
+    """Download a completed export artifact, honouring single ``Range`` requests."""
+
+    job = await service.get_job(session, user, job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export job not found")
+    if job.status != ExportJobStatus.COMPLETED or job.storage_key is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Export job has not completed"
+        )
+
+    export_format = ExportJobFormat(job.format)
+    etag = f'"{job.id}"'
+    size = job.size_bytes or 0
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        "Content-Disposition": (
+            f'attachment; filename="{_build_attachment_filename(export_format.value)}"'
+        ),
+    }
+    byte_range = None
+    if if_range is None or if_range == etag:
+        byte_range = _parse_range(range_header, size)
+
+    try:
+        data = await storage.download_bytes(job.storage_key, byte_range=byte_range)
+    except StorageServiceError as exc:
+        logger.exception("Failed to read export artifact", exc_info=exc)
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Unable to read export from storage backend",
+        ) from exc
+
+    if byte_range is None:
+        return Response(data, media_type=EXPORT_JOB_CONTENT_TYPES[export_format], headers=headers)
+    headers["Content-Range"] = f"bytes {byte_range[0]}-{byte_range[1]}/{size}"
+    return Response(
+        data,
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=EXPORT_JOB_CONTENT_TYPES[export_format],
         headers=headers,
     )
 
 
+def _parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Return the inclusive byte range of a single-range ``Range`` header.
+
+    Malformed and multi-range headers are ignored so the whole artifact is sent;
+    ranges outside the artifact are rejected with 416.
+    """
+
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, _, last = header.removeprefix("bytes=").strip().partition("-")
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+        else:
+            start, end = max(size - int(last), 0), size - 1
+    except ValueError:
+        return None
+    if start >= size or end < start:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range is not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, min(end, size - 1)
+
+
 @router.post("/json", status_code=status.HTTP_201_CREATED)
 async def import_json(
     payload: ExportBundle,
     session: DatabaseSession,
     user: CurrentUser,
+    caches: SpotCachesDependency,
     service: ExportService = Depends(get_export_service),
 ) -> dict[str, int]:
     """Import data from a previously exported JSON bundle."""
@@ -72,5 +357,108 @@ async def import_json(
         )
 
     result = await service.import_from_bundle(session, user, payload)
+    caches.invalidate(user.id)
     return result.as_dict()
 
+
+@router.post("/import", status_code=status.HTTP_201_CREATED)
+async def import_stream(
+    request: Request,
+    session: DatabaseSession,
+    user: CurrentUser,
+    caches: SpotCachesDependency,
+    service: ExportService = Depends(get_export_service),
+    progress: bool = Query(
+        default=False,
+        description="Stream NDJSON progress events instead of returning the final counts",
+    ),
+):
+    """Import a JSON bundle or NDJSON export incrementally, optionally gzip'd.
+
+    The body is parsed as it arrives and written in batches, so large backups are
+    never materialised in memory. The format is selected from ``Content-Type``
+    (``application/x-ndjson`` or ``application/json``) and gzip is detected from
+    ``Content-Encoding`` or the payload itself. With ``progress=true`` the body is
+    spooled to a temporary file first and the import runs while the progress
+    events are streamed.
+    """
+
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type in {"application/x-ndjson", "application/ndjson"}:
+        read_entries = iter_ndjson_entries
+    elif content_type == "application/json":
+        read_entries = iter_json_bundle_entries
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Expected application/json or application/x-ndjson",
+        )
+
+    encoding = request.headers.get("content-encoding")
+
+    if progress:
+        # The body has to be consumed before the streaming response starts, so it
+        # is spooled to a temporary file that the progress stream then reads.
+        spool = await _spool_body(request)
+        body = decompress_stream(_read_spool(spool), encoding)
+        return StreamingResponse(
+            _progress_events(service.import_entries(session, user, read_entries(body))),
+            media_type="application/x-ndjson",
+            background=BackgroundTask(caches.invalidate, user.id),
+        )
+
+    body = decompress_stream(request.stream(), encoding)
+    final: ImportResult | None = None
+    try:
+        async for result in service.import_entries(session, user, read_entries(body)):
+            final = result
+    except ImportFormatError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except IntegrityError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=IMPORT_CONFLICT_DETAIL
+        ) from exc
+    assert final is not None
+    caches.invalidate(user.id)
+    return final.as_dict()
+
+
+async def _spool_body(request: Request) -> IO[bytes]:
+    """Copy the request body into a temporary file and rewind it."""
+
+    spool = SpooledTemporaryFile(max_size=IMPORT_SPOOL_MAX_MEMORY)
+    async for chunk in request.stream():
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
+
+
+async def _read_spool(spool: IO[bytes]) -> AsyncGenerator[bytes, None]:
+    """Yield a spooled body in chunks and close the file once exhausted."""
+
+    try:
+        while chunk := spool.read(IMPORT_SPOOL_READ_SIZE):
+            yield chunk
+    finally:
+        spool.close()
+
+
+async def _progress_events(
+    results: AsyncGenerator[ImportResult, None],
+) -> AsyncGenerator[bytes, None]:
+    """Render import progress as NDJSON ``progress``/``result``/``error`` events."""
+
+    previous: ImportResult | None = None
+    try:
+        async for result in results:
+            if previous is not None:
+                yield json_dumps({"type": "progress", "data": previous.as_dict()}) + b"\n"
+            previous = result
+    except ImportFormatError as exc:
+        yield json_dumps({"type": "error", "detail": str(exc)}) + b"\n"
+        return
+    except IntegrityError:
+        yield json_dumps({"type": "error", "detail": IMPORT_CONFLICT_DETAIL}) + b"\n"
+        return
+    if previous is not None:
+        yield json_dumps({"type": "result", "data": previous.as_dict()}) + b"\n"
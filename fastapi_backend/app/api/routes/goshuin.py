@@ -2,40 +2,103 @@
 
 from __future__ import annotations
 
+from datetime import date
 from enum import Enum
-from typing import Callable
+from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi_pagination.ext.sqlalchemy import apaginate
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import CurrentUser, DatabaseSession, PaginationParams
-from app.models import GoshuinRecord, Spot, User
+from app.api.deps import (
+    CurrentUser,
+    CursorParam,
+    DatabaseSession,
+    GoshuinFieldsParam,
+    PaginationParams,
+    TotalModeParam,
+)
+from app.fields import sparse_response
+from app.models import GoshuinAcquisitionMethod, GoshuinRecord, GoshuinStatus, Spot, User
+from app.models.spots import SpotType
+from app.pagination import (
+    CursorError,
+    TotalMode,
+    encode_cursor,
+    keyset_paginate,
+    offset_paginate,
+)
 from app.schemas import (
+    BulkRequest,
+    GoshuinBulkResponse,
     GoshuinCreate,
     GoshuinRead,
     GoshuinUpdate,
     PaginatedGoshuinResponse,
 )
+from app.services.bulk import create_goshuin_records, update_goshuin_records
+from app.services.counts import TotalCountService, get_total_count_service
+from app.services.facets import GoshuinFilters, goshuin_facets
 
 router = APIRouter(tags=["goshuin"])
 
+# Unique together and served by ``ix_goshuin_records_user_id_visit_date_id``
+GOSHUIN_CURSOR_KEYS = (GoshuinRecord.visit_date, GoshuinRecord.id)
+
 
 class SortOrder(str, Enum):
     ASC = "asc"
     DESC = "desc"
 
 
-def _goshuin_transformer() -> Callable[[list[GoshuinRecord]], list[GoshuinRead]]:
-    """Return a transformer function for pagination results."""
-
-    def transform(records: list[GoshuinRecord]) -> list[GoshuinRead]:
-        return [GoshuinRead.model_validate(record) for record in records]
+def _goshuin_filters(
+    spot_id: UUID | None = Query(
+        default=None,
+        description="Optional filter to only include records for a specific spot",
+    ),
+    status_: list[GoshuinStatus] | None = Query(
+        default=None, alias="status", description="Only records with one of these statuses"
+    ),
+    acquisition_method: list[GoshuinAcquisitionMethod] | None = Query(
+        default=None, description="Only records obtained in one of these ways"
+    ),
+    min_rating: int | None = Query(default=None, ge=1, le=5, description="Lowest rating"),
+    max_rating: int | None = Query(default=None, ge=1, le=5, description="Highest rating"),
+    visited_from: date | None = Query(default=None, description="Earliest visit date"),
+    visited_to: date | None = Query(default=None, description="Latest visit date"),
+    prefecture: list[str] | None = Query(
+        default=None, description="Only records of spots in one of these prefectures"
+    ),
+    spot_type: list[SpotType] | None = Query(
+        default=None, description="Only records of spots of one of these types"
+    ),
+) -> GoshuinFilters:
+    """Collect the filters of the goshuin record list."""
 
-    return transform
+    if min_rating is not None and max_rating is not None and min_rating > max_rating:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="min_rating must not exceed max_rating",
+        )
+    if visited_from is not None and visited_to is not None and visited_from > visited_to:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="visited_from must not be after visited_to",
+        )
+    return GoshuinFilters(
+        spot_id=spot_id,
+        statuses=tuple(status_ or ()),
+        acquisition_methods=tuple(acquisition_method or ()),
+        min_rating=min_rating,
+        max_rating=max_rating,
+        visited_from=visited_from,
+        visited_to=visited_to,
+        prefectures=tuple(prefecture or ()),
+        spot_types=tuple(spot_type or ()),
+    )
 
 
 async def _get_spot_for_user(spot_id: UUID, db: AsyncSession, user: User) -> Spot:
@@ -50,7 +113,9 @@ async def _get_spot_for_user(spot_id: UUID, db: AsyncSession, user: User) -> Spo
     return spot
 
 
-async def _get_record_for_user(record_id: UUID, db: AsyncSession, user: User) -> GoshuinRecord:
+async def _get_record_for_user(
+    record_id: UUID, db: AsyncSession, user: User, *options: Any
+) -> GoshuinRecord:
     """Return the user's goshuin record or raise 404 if not found."""
 
     result = await db.execute(
@@ -61,6 +126,7 @@ async def _get_record_for_user(record_id: UUID, db: AsyncSession, user: User) ->
             GoshuinRecord.user_id == user.id,
             Spot.user_id == user.id,
         )
+        .options(*options)
     )
     record = result.scalar_one_or_none()
     if record is None:
@@ -79,12 +145,26 @@ async def list_goshuin_records(
         default=SortOrder.DESC,
         description="Sort records by visit date ascending or descending",
     ),
-    spot_id: UUID | None = Query(
-        default=None,
-        description="Optional filter to only include records for a specific spot",
+    filters: GoshuinFilters = Depends(_goshuin_filters),
+    cursor: CursorParam = None,
+    include_total: TotalModeParam = TotalMode.EXACT,
+    include_facets: bool = Query(
+        default=False,
+        description="Count the matching records by status, acquisition method, rating, "
+        "prefecture and spot type",
     ),
-) -> PaginatedGoshuinResponse:
-    """Return a paginated list of the authenticated user's goshuin records."""
+    fields: GoshuinFieldsParam = None,
+    totals: TotalCountService = Depends(get_total_count_service),
+) -> PaginatedGoshuinResponse | Response:
+    """Return a paginated list of the authenticated user's goshuin records.
+
+    Pages can be read by offset with ``page`` or by key with the ``next_cursor``
+    of the previous page; a cursor only continues the sort order it came from.
+    ``include_total`` selects how offset pages compute ``total`` and ``fields``
+    narrows the columns loaded and the items returned. ``include_facets`` adds
+    the counts of the filtered records by each filterable dimension, read in
+    one grouped query.
+    """
 
     query = (
         select(GoshuinRecord)
@@ -95,22 +175,64 @@ async def list_goshuin_records(
         )
     )
 
-    if spot_id is not None:
-        query = query.where(GoshuinRecord.spot_id == spot_id)
-
-    if sort_order is SortOrder.ASC:
-        query = query.order_by(GoshuinRecord.visit_date.asc())
+    query = filters.apply(query)
+    facets = await goshuin_facets(db, query) if include_facets else None
+    schema: type[Any] = GoshuinRead
+    if fields is not None:
+        query = query.options(fields.load_only(GoshuinRecord, *GOSHUIN_CURSOR_KEYS))
+        schema = fields.model
+
+    descending = sort_order is SortOrder.DESC
+    total: int | None = None
+    if cursor:
+        try:
+            keyset = await keyset_paginate(
+                db,
+                query,
+                GOSHUIN_CURSOR_KEYS,
+                size=pagination.size,
+                cursor=cursor,
+                descending=descending,
+            )
+        except CursorError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+            ) from exc
+        records = keyset.items
+        has_next = keyset.next_cursor is not None
     else:
-        query = query.order_by(GoshuinRecord.visit_date.desc())
-
-    page = await apaginate(db, query, pagination, transformer=_goshuin_transformer())
-
-    return PaginatedGoshuinResponse(
-        items=page.items,
-        total=page.total,
-        page=page.page,
-        size=page.size,
-    )
+        ordered = query.order_by(
+            *(key.desc() if descending else key.asc() for key in GOSHUIN_CURSOR_KEYS)
+        )
+        if include_total is TotalMode.EXACT:
+            page = await apaginate(db, ordered, pagination)
+            records = list(page.items)
+            total = page.total
+            has_next = total is not None and pagination.page * pagination.size < total
+        else:
+            window = await offset_paginate(
+                db, ordered, page=pagination.page, size=pagination.size
+            )
+            records = window.items
+            has_next = window.has_next
+            if include_total is TotalMode.ESTIMATED:
+                total = await totals.estimate(db, user.id, ("goshuin", filters), query)
+
+    envelope = {
+        "total": total,
+        "page": None if cursor else pagination.page,
+        "size": pagination.size,
+        "next_cursor": (
+            encode_cursor(GOSHUIN_CURSOR_KEYS, records[-1], descending=descending)
+            if has_next and records
+            else None
+        ),
+        "facets": facets,
+    }
+    items = [schema.model_validate(record) for record in records]
+    if fields is not None:
+        return sparse_response(PaginatedGoshuinResponse.model_construct(items=items, **envelope))
+    return PaginatedGoshuinResponse(items=items, **envelope)
 
 
 @router.post(
@@ -123,6 +245,7 @@ async def create_goshuin_record(
     record_in: GoshuinCreate,
     db: DatabaseSession,
     user: CurrentUser,
+    totals: TotalCountService = Depends(get_total_count_service),
 ) -> GoshuinRead:
     """Create a goshuin record for the authenticated user's spot."""
 
@@ -144,18 +267,63 @@ async def create_goshuin_record(
             detail="Unable to create goshuin record with provided data",
         ) from exc
 
+    totals.invalidate(user.id)
     await db.refresh(record)
     return GoshuinRead.model_validate(record)
 
 
+@router.post("/goshuin/bulk", response_model=GoshuinBulkResponse)
+async def create_goshuin_records_in_bulk(
+    request: BulkRequest,
+    db: DatabaseSession,
+    user: CurrentUser,
+    totals: TotalCountService = Depends(get_total_count_service),
+) -> GoshuinBulkResponse:
+    """Create many goshuin records, possibly of different spots, in one transaction.
+
+    Each item is a goshuin record creation payload plus its ``spot_id``. Items
+    that are invalid, name an unknown spot or repeat a visit are listed in
+    ``errors`` while the others are created.
+    """
+
+    result = await create_goshuin_records(db, user.id, request.items)
+    await db.commit()
+    totals.invalidate(user.id)
+    return result
+
+
+@router.patch("/goshuin/bulk", response_model=GoshuinBulkResponse)
+async def update_goshuin_records_in_bulk(
+    request: BulkRequest,
+    db: DatabaseSession,
+    user: CurrentUser,
+) -> GoshuinBulkResponse:
+    """Update many goshuin records in one transaction.
+
+    Each item holds the ``id`` of a record and the fields to change. Items that
+    are invalid, unknown or conflicting are listed in ``errors`` while the
+    others are applied.
+    """
+
+    result = await update_goshuin_records(db, user.id, request.items)
+    await db.commit()
+    return result
+
+
 @router.get("/goshuin/{record_id}", response_model=GoshuinRead)
 async def get_goshuin_record(
     record_id: UUID,
     db: DatabaseSession,
     user: CurrentUser,
-) -> GoshuinRead:
+    fields: GoshuinFieldsParam = None,
+) -> GoshuinRead | Response:
     """Retrieve a single goshuin record owned by the authenticated user."""
 
+    if fields is not None:
+        record = await _get_record_for_user(
+            record_id, db, user, fields.load_only(GoshuinRecord)
+        )
+        return sparse_response(fields.model.model_validate(record))
     record = await _get_record_for_user(record_id, db, user)
     return GoshuinRead.model_validate(record)
 
@@ -193,10 +361,12 @@ async def delete_goshuin_record(
     record_id: UUID,
     db: DatabaseSession,
     user: CurrentUser,
+    totals: TotalCountService = Depends(get_total_count_service),
 ):
     """Delete a goshuin record owned by the authenticated user."""
 
     record = await _get_record_for_user(record_id, db, user)
     await db.delete(record)
     await db.commit()
+    totals.invalidate(user.id)
     return None
@@ -8,15 +8,23 @@ from uuid import UUID, uuid4
 from fastapi import (
     APIRouter,
     BackgroundTasks,
+    Depends,
     File,
     HTTPException,
+    Response,
     UploadFile,
     status,
 )
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import CurrentUser, DatabaseSession, StorageDependency
+from app.api.deps import (
+    CurrentUser,
+    DatabaseSession,
+    GoshuinImageFieldsParam,
+    StorageDependency,
+)
+from app.fields import sparse_response
 from app.models import GoshuinImage, GoshuinImageType, GoshuinRecord, Spot, User
 from app.schemas import (
     GoshuinImageMetadataUpdate,
@@ -26,6 +34,7 @@ from app.schemas import (
     ImageUploadResponse,
 )
 from app.services import ImageValidationError, StorageServiceError
+from app.services.nearby import SpotLocationService, get_spot_location_service
 
 logger = logging.getLogger(__name__)
 
@@ -89,14 +98,18 @@ async def list_goshuin_images(
     record_id: UUID,
     db: DatabaseSession,
     user: CurrentUser,
-) -> list[GoshuinImageRead]:
+    fields: GoshuinImageFieldsParam = None,
+) -> list[GoshuinImageRead] | Response:
     await _get_record_for_user(record_id, db, user)
-    result = await db.execute(
+    query = (
         select(GoshuinImage)
         .where(GoshuinImage.goshuin_record_id == record_id)
         .order_by(GoshuinImage.display_order.asc(), GoshuinImage.created_at.asc())
     )
-    images = result.scalars().all()
+    if fields is not None:
+        images = (await db.execute(query.options(fields.load_only(GoshuinImage)))).scalars().all()
+        return sparse_response([fields.model.model_validate(image) for image in images])
+    images = (await db.execute(query)).scalars().all()
     return [GoshuinImageRead.model_validate(image) for image in images]
 
 
@@ -112,6 +125,7 @@ async def initiate_goshuin_image_upload(
     user: CurrentUser,
     storage: StorageDependency,
     file: UploadFile = File(...),
+    locations: SpotLocationService = Depends(get_spot_location_service),
 ) -> ImageUploadResponse:
     record = await _get_record_for_user(record_id, db, user)
 
@@ -164,6 +178,7 @@ async def initiate_goshuin_image_upload(
             if upload_result.metadata
             else None
         ),
+        nearby_spots=await locations.for_photo(db, user.id, upload_result.metadata),
     )
 
 
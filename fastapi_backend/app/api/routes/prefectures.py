@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 from fastapi import APIRouter
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import CurrentUser, DatabaseSession
-from app.models import GoshuinRecord, Spot, User
+from app.models import PrefectureCounter
 from app.schemas import PrefectureStats, PrefectureStatsResponse
 
 router = APIRouter(tags=["prefectures"])
@@ -21,46 +21,27 @@ async def get_prefecture_statistics(
     """Get aggregated statistics grouped by prefecture for the current user.
 
     Returns spot counts and goshuin record counts for each prefecture
-    where the user has activity.
+    where the user has activity. The counts are read from the user's
+    prefecture counters, kept current by database triggers, so this is a
+    single range scan of their primary key.
     """
-    # Query to get spot counts by prefecture
-    spot_stats_query = (
+    counters = await db.execute(
         select(
-            Spot.prefecture,
-            func.count(Spot.id).label("spot_count")
+            PrefectureCounter.prefecture,
+            PrefectureCounter.spot_count,
+            PrefectureCounter.goshuin_count,
         )
-        .where(Spot.user_id == user.id)
-        .group_by(Spot.prefecture)
+        .where(PrefectureCounter.user_id == user.id)
+        .order_by(PrefectureCounter.prefecture)
     )
-    spot_stats_result = await db.execute(spot_stats_query)
-    spot_stats = {row.prefecture: row.spot_count for row in spot_stats_result}
-
-    # Query to get goshuin counts by prefecture (via spot relationship)
-    goshuin_stats_query = (
-        select(
-            Spot.prefecture,
-            func.count(GoshuinRecord.id).label("goshuin_count")
-        )
-        .join(GoshuinRecord, GoshuinRecord.spot_id == Spot.id)
-        .where(
-            Spot.user_id == user.id,
-            GoshuinRecord.user_id == user.id
-        )
-        .group_by(Spot.prefecture)
-    )
-    goshuin_stats_result = await db.execute(goshuin_stats_query)
-    goshuin_stats = {row.prefecture: row.goshuin_count for row in goshuin_stats_result}
-
-    # Combine statistics for all prefectures
-    all_prefectures = set(spot_stats.keys()) | set(goshuin_stats.keys())
 
     prefecture_list = [
         PrefectureStats(
-            prefecture=prefecture,
-            spot_count=spot_stats.get(prefecture, 0),
-            goshuin_count=goshuin_stats.get(prefecture, 0)
+            prefecture=row.prefecture,
+            spot_count=row.spot_count,
+            goshuin_count=row.goshuin_count,
         )
-        for prefecture in sorted(all_prefectures)
+        for row in counters
     ]
 
     # Calculate totals
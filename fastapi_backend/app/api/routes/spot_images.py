@@ -8,15 +8,23 @@ from uuid import UUID, uuid4
 from fastapi import (
     APIRouter,
     BackgroundTasks,
+    Depends,
     File,
     HTTPException,
+    Response,
     UploadFile,
     status,
 )
 from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import CurrentUser, DatabaseSession, StorageDependency
+from app.api.deps import (
+    CurrentUser,
+    DatabaseSession,
+    SpotImageFieldsParam,
+    StorageDependency,
+)
+from app.fields import sparse_response
 from app.models import Spot, SpotImage, SpotImageType, User
 from app.schemas import (
     ImageExifMetadata,
@@ -26,6 +34,7 @@ from app.schemas import (
     SpotImageRead,
 )
 from app.services import ImageValidationError, StorageServiceError
+from app.services.nearby import SpotLocationService, get_spot_location_service
 
 logger = logging.getLogger(__name__)
 
@@ -79,14 +88,18 @@ async def list_spot_images(
     spot_id: UUID,
     db: DatabaseSession,
     user: CurrentUser,
-) -> list[SpotImageRead]:
+    fields: SpotImageFieldsParam = None,
+) -> list[SpotImageRead] | Response:
     await _get_spot_for_user(spot_id, db, user)
-    result = await db.execute(
+    query = (
         select(SpotImage)
         .where(SpotImage.spot_id == spot_id)
         .order_by(SpotImage.display_order.asc(), SpotImage.created_at.asc())
     )
-    images = result.scalars().all()
+    if fields is not None:
+        images = (await db.execute(query.options(fields.load_only(SpotImage)))).scalars().all()
+        return sparse_response([fields.model.model_validate(image) for image in images])
+    images = (await db.execute(query)).scalars().all()
     return [SpotImageRead.model_validate(image) for image in images]
 
 
@@ -102,6 +115,7 @@ async def initiate_spot_image_upload(
     user: CurrentUser,
     storage: StorageDependency,
     file: UploadFile = File(...),
+    locations: SpotLocationService = Depends(get_spot_location_service),
 ) -> ImageUploadResponse:
     spot = await _get_spot_for_user(spot_id, db, user)
 
@@ -142,6 +156,7 @@ async def initiate_spot_image_upload(
         id=image_id,
         spot_id=spot.id,
         image_url=upload_result.original_url,
+        thumbnail_url=upload_result.thumbnail_url,
         image_type=SpotImageType.OTHER,
         is_primary=not has_primary,
         display_order=display_order,
@@ -158,6 +173,7 @@ async def initiate_spot_image_upload(
             if upload_result.metadata
             else None
         ),
+        nearby_spots=await locations.for_photo(db, user.id, upload_result.metadata),
     )
 
 
@@ -182,6 +198,9 @@ async def update_spot_image_metadata(
             .values(is_primary=False)
         )
 
+    if "image_url" in update_data:
+        # The stored thumbnail was rendered from the previous image
+        image.thumbnail_url = None
     for field, value in update_data.items():
         setattr(image, field, value)
 
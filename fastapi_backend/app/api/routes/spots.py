@@ -2,35 +2,79 @@
 
 from __future__ import annotations
 
-from typing import Callable
+from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi_pagination.ext.sqlalchemy import apaginate
-from sqlalchemy import or_, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import CurrentUser, DatabaseSession, PaginationParams
+from app.api.deps import (
+    CurrentUser,
+    CursorParam,
+    DatabaseSession,
+    PaginationParams,
+    SpotCachesDependency,
+    SpotFieldsParam,
+    SpotListFieldsParam,
+    TotalModeParam,
+)
+from app.fields import sparse_response
 from app.models import Spot, User
-from app.schemas import PaginatedSpotsResponse, SpotCreate, SpotRead, SpotUpdate
+from app.pagination import (
+    CursorError,
+    TotalMode,
+    encode_cursor,
+    keyset_paginate,
+    offset_paginate,
+)
+from app.schemas import (
+    BulkRequest,
+    PaginatedSpotSearchResponse,
+    PaginatedSpotsResponse,
+    SpotBulkResponse,
+    SpotClustersResponse,
+    SpotCreate,
+    SpotListItem,
+    SpotRead,
+    SpotSearchResult,
+    SpotSuggestion,
+    SpotUpdate,
+    SpotWithinResult,
+    SpotsWithinResponse,
+)
+from app.services.bulk import create_spots, update_spots
+from app.services.clusters import (
+    CLUSTER_MAX_ZOOM,
+    SpotClusterService,
+    cell_size,
+    get_spot_cluster_service,
+)
+from app.services.counts import TotalCountService, get_total_count_service
+from app.services.geo import (
+    distance_m,
+    parse_bbox,
+    parse_point,
+    within_bbox,
+    within_radius,
+)
+from app.services.search import build_snippet, spot_search_condition, spot_search_rank
+from app.services.suggest import SpotSuggestionService, get_spot_suggestion_service
+from app.services.summaries import load_spot_summaries
 
 router = APIRouter(tags=["spots"])
 
-
-def _spot_transformer() -> Callable[[list[Spot]], list[SpotRead]]:
-    """Return a transformer function for pagination results."""
-
-    def transform(spots: list[Spot]) -> list[SpotRead]:
-        return [SpotRead.model_validate(spot) for spot in spots]
-
-    return transform
+# Unique together and served by ``ix_spots_user_id_name_id``
+SPOT_CURSOR_KEYS = (Spot.name, Spot.id)
+MAX_WITHIN_RADIUS_M = 100_000
 
 
 async def _get_spot_for_user(
-    spot_id: UUID, db: AsyncSession, user: User
+    spot_id: UUID, db: AsyncSession, user: User, *options: Any
 ) -> Spot:
     result = await db.execute(
-        select(Spot).where(Spot.id == spot_id, Spot.user_id == user.id)
+        select(Spot).where(Spot.id == spot_id, Spot.user_id == user.id).options(*options)
     )
     spot = result.scalar_one_or_none()
     if spot is None:
@@ -52,28 +96,145 @@ async def list_spots(
     keyword: str | None = Query(
         default=None, description="Filter spots by keyword in name, description or address"
     ),
-) -> PaginatedSpotsResponse:
-    """Return a paginated list of the authenticated user's spots with optional filters."""
+    cursor: CursorParam = None,
+    include_total: TotalModeParam = TotalMode.EXACT,
+    include_summary: bool = Query(
+        default=False,
+        description="Embed each spot's primary image, goshuin count and last visit date",
+    ),
+    fields: SpotListFieldsParam = None,
+    totals: TotalCountService = Depends(get_total_count_service),
+) -> PaginatedSpotsResponse | Response:
+    """Return a paginated list of the authenticated user's spots with optional filters.
+
+    Spots are ordered by name. Every page but the last carries ``next_cursor``;
+    passing it back as ``cursor`` reads the following page by key, which stays
+    fast however deep the page is. Keyword results are ranked and only paged by
+    offset. ``include_total`` trades the exact ``COUNT(*)`` of offset pages for
+    an estimate or no total at all. ``include_summary`` adds what a list row
+    shows besides the spot itself, read for the whole page in one more query.
+    ``fields`` narrows both the columns loaded and the items returned.
+    """
 
     query = select(Spot).where(Spot.user_id == user.id)
+    schema: type[Any] = SpotListItem
+    if fields is not None:
+        if include_summary:
+            fields = fields.including("summary")
+        query = query.options(fields.load_only(Spot, *SPOT_CURSOR_KEYS))
+        schema = fields.model
 
     if prefecture:
         query = query.where(Spot.prefecture == prefecture)
     if category:
         query = query.where(Spot.category == category)
-    if keyword:
-        pattern = f"%{keyword}%"
-        query = query.where(
-            or_(
-                Spot.name.ilike(pattern),
-                Spot.description.ilike(pattern),
-                Spot.address.ilike(pattern),
+    searching = bool(keyword and keyword.strip())
+    if searching:
+        if cursor:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor pagination is not available with keyword",
+            )
+        query = query.where(spot_search_condition(keyword))
+        ordered = query.order_by(spot_search_rank(keyword).desc(), *SPOT_CURSOR_KEYS)
+    else:
+        ordered = query.order_by(*SPOT_CURSOR_KEYS)
+
+    total: int | None = None
+    if cursor:
+        try:
+            keyset = await keyset_paginate(
+                db, query, SPOT_CURSOR_KEYS, size=pagination.size, cursor=cursor
             )
+        except CursorError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+            ) from exc
+        spots = keyset.items
+        has_next = keyset.next_cursor is not None
+    elif include_total is TotalMode.EXACT:
+        page = await apaginate(db, ordered, pagination)
+        spots = list(page.items)
+        total = page.total
+        has_next = total is not None and pagination.page * pagination.size < total
+    else:
+        window = await offset_paginate(db, ordered, page=pagination.page, size=pagination.size)
+        spots = window.items
+        has_next = window.has_next
+        if include_total is TotalMode.ESTIMATED:
+            key = ("spots", prefecture, category, keyword.strip() if searching else None)
+            total = await totals.estimate(db, user.id, key, query)
+
+    items = [schema.model_validate(spot) for spot in spots]
+    if include_summary:
+        summaries = await load_spot_summaries(db, [item.id for item in items])
+        for item in items:
+            item.summary = summaries[item.id]
+
+    envelope = {
+        "total": total,
+        "page": None if cursor else pagination.page,
+        "size": pagination.size,
+        "next_cursor": (
+            encode_cursor(SPOT_CURSOR_KEYS, spots[-1])
+            if has_next and spots and not searching
+            else None
+        ),
+    }
+    if fields is not None:
+        return sparse_response(PaginatedSpotsResponse.model_construct(items=items, **envelope))
+    return PaginatedSpotsResponse(items=items, **envelope)
+
+
+@router.get("/suggest", response_model=list[SpotSuggestion])
+async def suggest_spots(
+    db: DatabaseSession,
+    user: CurrentUser,
+    q: str = Query(..., min_length=1, max_length=100, description="Typed name or slug prefix"),
+    limit: int = Query(8, ge=1, le=20, description="Maximum number of suggestions"),
+    service: SpotSuggestionService = Depends(get_spot_suggestion_service),
+) -> list[SpotSuggestion]:
+    """Return the authenticated user's spots whose name or slug matches ``q``."""
+
+    return await service.suggest(db, user, q, limit)
+
+
+@router.get("/search", response_model=PaginatedSpotSearchResponse)
+async def search_spots(
+    db: DatabaseSession,
+    user: CurrentUser,
+    pagination: PaginationParams,
+    q: str = Query(..., min_length=1, max_length=200, description="Search keywords"),
+) -> PaginatedSpotSearchResponse:
+    """Return the authenticated user's spots matching ``q``, most relevant first."""
+
+    if not q.strip():
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Search keywords are empty"
         )
 
-    page = await apaginate(db, query, pagination, transformer=_spot_transformer())
+    rank = spot_search_rank(q).label("rank")
+    query = (
+        select(Spot, rank)
+        .where(Spot.user_id == user.id, spot_search_condition(q))
+        .order_by(rank.desc(), Spot.name.asc(), Spot.id.asc())
+    )
+
+    def transform(rows: list[Any]) -> list[SpotSearchResult]:
+        return [
+            SpotSearchResult.model_validate(
+                {
+                    **SpotRead.model_validate(spot).model_dump(),
+                    "rank": score,
+                    "snippet": build_snippet(q, spot.description, spot.address, spot.name),
+                }
+            )
+            for spot, score in rows
+        ]
+
+    page = await apaginate(db, query, pagination, transformer=transform)
 
-    return PaginatedSpotsResponse(
+    return PaginatedSpotSearchResponse(
         items=page.items,
         total=page.total,
         page=page.page,
@@ -81,29 +242,169 @@ async def list_spots(
     )
 
 
+@router.get("/within", response_model=SpotsWithinResponse)
+async def spots_within(
+    db: DatabaseSession,
+    user: CurrentUser,
+    bbox: str | None = Query(
+        default=None,
+        description="Map area as `west,south,east,north` in degrees",
+        examples=["139.69,35.65,139.80,35.72"],
+    ),
+    near: str | None = Query(
+        default=None,
+        description="Center of a radius search as `latitude,longitude` in degrees",
+        examples=["35.6762,139.6993"],
+    ),
+    radius: float | None = Query(
+        default=None, gt=0, le=MAX_WITHIN_RADIUS_M, description="Radius around `near` in meters"
+    ),
+    limit: int = Query(500, ge=1, le=2000, description="Maximum number of spots"),
+) -> SpotsWithinResponse:
+    """Return the authenticated user's spots in a map area or radius, nearest first.
+
+    Pass either ``bbox`` or ``near`` with ``radius``. Area results are ordered
+    by their distance to the center of the box. Spots without coordinates are
+    never returned.
+    """
+
+    if (bbox is None) == (near is None):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Pass either bbox or near with radius",
+        )
+    try:
+        if bbox is not None:
+            area = parse_bbox(bbox)
+            condition = within_bbox(area)
+            latitude, longitude = area.center
+        else:
+            if radius is None:
+                raise ValueError("radius is required with near")
+            latitude, longitude = parse_point(near)
+            condition = within_radius(latitude, longitude, radius)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
+        ) from exc
+
+    distance = distance_m(latitude, longitude).label("distance_m")
+    rows = (
+        await db.execute(
+            select(Spot, distance)
+            .where(Spot.user_id == user.id, condition)
+            .order_by(distance.asc(), Spot.id.asc())
+            .limit(limit + 1)
+        )
+    ).all()
+
+    return SpotsWithinResponse(
+        items=[
+            SpotWithinResult.model_validate(
+                {**SpotRead.model_validate(spot).model_dump(), "distance_m": meters}
+            )
+            for spot, meters in rows[:limit]
+        ],
+        truncated=len(rows) > limit,
+    )
+
+
+@router.get("/clusters", response_model=SpotClustersResponse)
+async def spot_clusters(
+    db: DatabaseSession,
+    user: CurrentUser,
+    bbox: str = Query(
+        ...,
+        description="Viewport as `west,south,east,north` in degrees",
+        examples=["122,24,146,46"],
+    ),
+    zoom: int = Query(..., ge=0, le=CLUSTER_MAX_ZOOM, description="Map zoom level"),
+    service: SpotClusterService = Depends(get_spot_cluster_service),
+) -> SpotClustersResponse:
+    """Return the authenticated user's spots in the viewport clustered for ``zoom``."""
+
+    try:
+        viewport = parse_bbox(bbox)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
+        ) from exc
+
+    return SpotClustersResponse(
+        zoom=zoom,
+        cell_size=cell_size(zoom),
+        clusters=await service.clusters(db, user.id, zoom, viewport),
+    )
+
+
 @router.post("/", response_model=SpotRead, status_code=status.HTTP_201_CREATED)
 async def create_spot(
     spot_in: SpotCreate,
     db: DatabaseSession,
     user: CurrentUser,
+    caches: SpotCachesDependency,
 ) -> SpotRead:
     """Create a new spot owned by the authenticated user."""
 
     spot = Spot(**spot_in.model_dump(), user_id=user.id)
     db.add(spot)
     await db.commit()
+    caches.invalidate(user.id)
     await db.refresh(spot)
     return SpotRead.model_validate(spot)
 
 
+@router.post("/bulk", response_model=SpotBulkResponse)
+async def create_spots_in_bulk(
+    request: BulkRequest,
+    db: DatabaseSession,
+    user: CurrentUser,
+    caches: SpotCachesDependency,
+) -> SpotBulkResponse:
+    """Create many spots in one transaction.
+
+    Each item is a spot creation payload. Items that are invalid or whose slug
+    is taken are listed in ``errors`` while the others are created.
+    """
+
+    result = await create_spots(db, user.id, request.items)
+    await db.commit()
+    caches.invalidate(user.id)
+    return result
+
+
+@router.patch("/bulk", response_model=SpotBulkResponse)
+async def update_spots_in_bulk(
+    request: BulkRequest,
+    db: DatabaseSession,
+    user: CurrentUser,
+    caches: SpotCachesDependency,
+) -> SpotBulkResponse:
+    """Update many spots in one transaction.
+
+    Each item holds the ``id`` of a spot and the fields to change. Items that
+    are invalid, unknown or conflicting are listed in ``errors`` while the
+    others are applied.
+    """
+
+    result = await update_spots(db, user.id, request.items)
+    await db.commit()
+    caches.invalidate(user.id)
+    return result
+
+
 @router.get("/{spot_id}", response_model=SpotRead)
 async def get_spot(
     spot_id: UUID,
     db: DatabaseSession,
     user: CurrentUser,
-) -> SpotRead:
+    fields: SpotFieldsParam = None,
+) -> SpotRead | Response:
     """Retrieve a single spot owned by the authenticated user."""
 
+    if fields is not None:
+        spot = await _get_spot_for_user(spot_id, db, user, fields.load_only(Spot))
+        return sparse_response(fields.model.model_validate(spot))
     spot = await _get_spot_for_user(spot_id, db, user)
     return SpotRead.model_validate(spot)
 
@@ -114,6 +415,7 @@ async def update_spot(
     spot_in: SpotUpdate,
     db: DatabaseSession,
     user: CurrentUser,
+    caches: SpotCachesDependency,
 ) -> SpotRead:
     """Update an existing spot owned by the authenticated user."""
 
@@ -124,6 +426,7 @@ async def update_spot(
         setattr(spot, field, value)
 
     await db.commit()
+    caches.invalidate(user.id)
     await db.refresh(spot)
     return SpotRead.model_validate(spot)
 
@@ -133,10 +436,12 @@ async def delete_spot(
     spot_id: UUID,
     db: DatabaseSession,
     user: CurrentUser,
+    caches: SpotCachesDependency,
 ):
     """Delete a spot owned by the authenticated user."""
 
     spot = await _get_spot_for_user(spot_id, db, user)
     await db.delete(spot)
     await db.commit()
+    caches.invalidate(user.id)
     return None
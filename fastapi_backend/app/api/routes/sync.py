@@ -0,0 +1,50 @@
+"""Routes exposing the change feed for offline-first clients."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.api.deps import CurrentUser, DatabaseSession
+from app.schemas.sync import SyncChangesResponse, SyncDeletion
+from app.services import SyncService, SyncTokenError, get_sync_service
+
+router = APIRouter(tags=["sync"])
+
+
+@router.get("/changes", response_model=SyncChangesResponse)
+async def get_changes(
+    db: DatabaseSession,
+    user: CurrentUser,
+    since: str | None = Query(
+        default=None, description="Sync token returned by the previous call; omit for a full sync"
+    ),
+    service: SyncService = Depends(get_sync_service),
+) -> SyncChangesResponse:
+    """Return the entities created, updated or deleted since ``since``.
+
+    Clients should apply ``deleted`` before the upserts, then store ``sync_token``
+    for the next call. Entities may be repeated across calls.
+    """
+
+    try:
+        changes = await service.get_changes(db, user, since)
+    except SyncTokenError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    return SyncChangesResponse.model_validate(
+        {
+            "spots": changes.spots,
+            "spot_images": changes.spot_images,
+            "goshuin_records": changes.goshuin_records,
+            "goshuin_images": changes.goshuin_images,
+            "deleted": [
+                SyncDeletion(
+                    entity_type=tombstone.entity_type,
+                    id=tombstone.entity_id,
+                    deleted_at=tombstone.deleted_at,
+                )
+                for tombstone in changes.deleted
+            ],
+            "sync_token": changes.sync_token,
+        }
+    )
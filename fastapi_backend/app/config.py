@@ -38,6 +38,9 @@ class Settings(BaseSettings):
     # CORS
     CORS_ORIGINS: Set[str]
 
+    # Serialization
+    JSON_SERIALIZER: Literal["orjson", "msgspec", "json"] = "orjson"
+
     # Storage
     STORAGE_BACKEND: Literal["s3", "vercel_blob", "vercel", "vercel-blob"] | None = None
     STORAGE_PUBLIC_URL: str | None = None
@@ -0,0 +1,106 @@
+"""Sparse fieldsets for the read endpoints.
+
+A client passes ``fields=id,name,latitude,longitude`` to receive only those
+fields of the response schema; ``id`` is always included. The ORM query then
+loads just the columns backing them with ``load_only`` and rows are
+serialized through a copy of the schema narrowed to the same fields, so a
+narrow view pays for neither the other columns nor their validation.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Response
+from pydantic import BaseModel, ConfigDict, create_model
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only
+from sqlalchemy.orm.interfaces import ORMOption
+
+from app.serialization import FastJSONResponse
+
+ALWAYS_INCLUDED_FIELDS = ("id",)
+
+
+class FieldSelectionError(ValueError):
+    """Raised when ``fields`` names something the response schema lacks."""
+
+
+@lru_cache(maxsize=256)
+def _narrowed_schema(schema: type[BaseModel], names: frozenset[str]) -> type[BaseModel]:
+    return create_model(
+        f"Sparse{schema.__name__}",
+        __config__=ConfigDict(from_attributes=True),
+        **{
+            name: (field.annotation, field)
+            for name, field in schema.model_fields.items()
+            if name in names
+        },
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class FieldSet:
+    """Fields of ``schema`` requested by a client."""
+
+    schema: type[BaseModel]
+    names: frozenset[str]
+
+    @classmethod
+    def parse(cls, schema: type[BaseModel], value: str) -> FieldSet:
+        """Parse a comma separated ``fields`` value, raising :class:`FieldSelectionError`."""
+
+        requested = {name.strip() for name in value.split(",") if name.strip()}
+        if not requested:
+            raise FieldSelectionError("fields must name at least one field")
+        unknown = requested - schema.model_fields.keys()
+        if unknown:
+            raise FieldSelectionError(
+                f"Unknown fields: {', '.join(sorted(unknown))}; "
+                f"available: {', '.join(schema.model_fields)}"
+            )
+        return cls(schema=schema, names=frozenset(requested | set(ALWAYS_INCLUDED_FIELDS)))
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.names
+
+    def including(self, *names: str) -> FieldSet:
+        """Return the field set with ``names`` added."""
+
+        return FieldSet(schema=self.schema, names=self.names | set(names))
+
+    @property
+    def model(self) -> type[BaseModel]:
+        """Return ``schema`` narrowed to the selected fields."""
+
+        return _narrowed_schema(self.schema, self.names)
+
+    def load_only(self, entity: Any, *required: Any) -> ORMOption:
+        """Return the loader option restricting ``entity`` to the selected columns.
+
+        ``required`` lists further attributes the route itself reads, such as
+        the keys of a pagination cursor.
+        """
+
+        columns = inspect(entity).column_attrs.keys()
+        return load_only(
+            *(getattr(entity, name) for name in sorted(self.names) if name in columns),
+            *required,
+        )
+
+
+def sparse_response(content: BaseModel | Sequence[BaseModel]) -> Response:
+    """Render a payload holding narrowed models, bypassing the route's response model.
+
+    Envelopes such as paginated responses are built with ``model_construct`` so
+    their items are not validated against the full schema.
+    """
+
+    if isinstance(content, BaseModel):
+        payload: Any = content.model_dump(mode="json", serialize_as_any=True)
+    else:
+        payload = [item.model_dump(mode="json") for item in content]
+    return FastJSONResponse(payload)
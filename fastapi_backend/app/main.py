@@ -14,9 +14,11 @@ from .api.routes.goshuin_images import router as goshuin_images_router
 from .api.routes.prefectures import router as prefectures_router
 from .api.routes.spot_images import router as spot_images_router
 from .api.routes.spots import router as spots_router
+from .api.routes.sync import router as sync_router
 from .config import settings
 from .routes.items import router as items_router
 from .schemas import UserCreate, UserRead, UserUpdate
+from .serialization import FastJSONResponse
 from .users import AUTH_URL_PATH, auth_backend, fastapi_users
 from .utils import simple_generate_unique_route_id
 
@@ -65,12 +67,29 @@ def create_app() -> FastAPI:
 
     # Include items routes
     app.include_router(items_router, prefix="/items")
-    app.include_router(spots_router, prefix="/api/spots")
-    app.include_router(spot_images_router, prefix="/api/spots")
-    app.include_router(goshuin_router, prefix="/api")
-    app.include_router(goshuin_images_router, prefix="/api/goshuin")
-    app.include_router(prefectures_router, prefix="/api/prefectures")
-    app.include_router(export_router, prefix="/api")
+
+    # Application API routes render JSON with the configured fast serializer
+    app.include_router(
+        spots_router, prefix="/api/spots", default_response_class=FastJSONResponse
+    )
+    app.include_router(
+        spot_images_router, prefix="/api/spots", default_response_class=FastJSONResponse
+    )
+    app.include_router(
+        goshuin_router, prefix="/api", default_response_class=FastJSONResponse
+    )
+    app.include_router(
+        goshuin_images_router, prefix="/api/goshuin", default_response_class=FastJSONResponse
+    )
+    app.include_router(
+        prefectures_router, prefix="/api/prefectures", default_response_class=FastJSONResponse
+    )
+    app.include_router(
+        export_router, prefix="/api", default_response_class=FastJSONResponse
+    )
+    app.include_router(
+        sync_router, prefix="/api/sync", default_response_class=FastJSONResponse
+    )
     add_pagination(app)
 
     return app
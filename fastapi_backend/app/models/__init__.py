@@ -1,4 +1,5 @@
 from .base import Base
+from .export_jobs import ExportJob, ExportJobFormat, ExportJobStatus
 from .goshuin_images import GoshuinImage, GoshuinImageType
 from .goshuin_records import (
     GoshuinAcquisitionMethod,
@@ -6,20 +7,27 @@ from .goshuin_records import (
     GoshuinStatus,
 )
 from .item import Item
+from .prefecture_counters import PrefectureCounter
 from .spots import Spot, SpotImage, SpotImageType, SpotType
+from .sync import SyncTombstone
 from .user import User
 
 __all__ = [
     "Base",
+    "ExportJob",
+    "ExportJobFormat",
+    "ExportJobStatus",
     "GoshuinAcquisitionMethod",
     "GoshuinImage",
     "GoshuinImageType",
     "GoshuinRecord",
     "GoshuinStatus",
     "Item",
+    "PrefectureCounter",
     "Spot",
     "SpotImage",
     "SpotImageType",
     "SpotType",
+    "SyncTombstone",
     "User",
 ]
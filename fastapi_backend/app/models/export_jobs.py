@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import enum
+from uuid import uuid4
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    String,
+    func,
+)
+from sqlalchemy.dialects.postgresql import UUID
+
+from .base import Base
+
+
+class ExportJobFormat(str, enum.Enum):
+    JSON = "json"
+    CSV = "csv"
+
+
+class ExportJobStatus(str, enum.Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ExportJob(Base):
+    __tablename__ = "export_jobs"
+    __table_args__ = (
+        Index("ix_export_jobs_user_format_watermark", "user_id", "format", "watermark"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("user.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    format = Column(Enum(ExportJobFormat, name="export_job_format"), nullable=False)
+    status = Column(
+        Enum(ExportJobStatus, name="export_job_status"),
+        nullable=False,
+        default=ExportJobStatus.PENDING,
+    )
+    watermark = Column(String(255), nullable=False)
+    storage_key = Column(String(500), nullable=True)
+    size_bytes = Column(BigInteger, nullable=True)
+    error = Column(String(500), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
@@ -38,6 +38,7 @@ class GoshuinImage(Base):
             "goshuin_record_id", "display_order", name="uq_goshuin_images_display_order"
         ),
         Index("ix_goshuin_images_record_id", "goshuin_record_id"),
+        Index("ix_goshuin_images_updated_at", "updated_at"),
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
@@ -50,6 +51,9 @@ class GoshuinImage(Base):
     image_type = Column(Enum(GoshuinImageType, name="goshuin_image_type"), nullable=False)
     display_order = Column(Integer, nullable=False, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
 
     goshuin_record: Mapped["GoshuinRecord"] = relationship(
         "GoshuinRecord", back_populates="images"
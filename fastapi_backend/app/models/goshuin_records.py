@@ -51,8 +51,14 @@ class GoshuinRecord(Base):
             "rating IS NULL OR (rating >= 1 AND rating <= 5)",
             name="ck_goshuin_records_rating_range",
         ),
-        Index("ix_goshuin_records_user_id", "user_id"),
         Index("ix_goshuin_records_spot_id", "spot_id"),
+        Index("ix_goshuin_records_user_id_updated_at", "user_id", "updated_at"),
+        Index(
+            "ix_goshuin_records_user_id_visit_date_id", "user_id", "visit_date", "id"
+        ),
+        Index(
+            "ix_goshuin_records_user_id_status_visit_date", "user_id", "status", "visit_date"
+        ),
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from sqlalchemy import DDL, Column, Integer, String, event, text
+from sqlalchemy.dialects.postgresql import UUID
+
+from .base import Base
+
+# Adds a delta to one counter row, creating it on first use and dropping it
+# once both counts are back to zero.
+BUMP_PREFECTURE_COUNTER_FUNCTION = """
+CREATE OR REPLACE FUNCTION bump_prefecture_counter(
+    owner_id uuid, counted_prefecture varchar, spots integer, records integer
+) RETURNS void AS $$
+BEGIN
+    IF spots = 0 AND records = 0 THEN
+        RETURN;
+    END IF;
+    INSERT INTO prefecture_counters AS counter (user_id, prefecture, spot_count, goshuin_count)
+    VALUES (owner_id, counted_prefecture, spots, records)
+    ON CONFLICT (user_id, prefecture) DO UPDATE
+    SET spot_count = counter.spot_count + EXCLUDED.spot_count,
+        goshuin_count = counter.goshuin_count + EXCLUDED.goshuin_count;
+    IF spots < 0 OR records < 0 THEN
+        DELETE FROM prefecture_counters
+        WHERE user_id = owner_id AND prefecture = counted_prefecture
+            AND spot_count = 0 AND goshuin_count = 0;
+    END IF;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# A spot carries its goshuin records along when it changes prefecture or
+# owner. Deletes are counted BEFORE the row goes: records removed by the
+# foreign key cascade can no longer find their spot, so the spot takes its
+# remaining records with it, while records deleted ahead of their spot have
+# already been subtracted by their own trigger.
+COUNT_SPOT_PREFECTURE_FUNCTION = """
+CREATE OR REPLACE FUNCTION count_spot_prefecture() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM bump_prefecture_counter(
+            OLD.user_id,
+            OLD.prefecture,
+            -1,
+            -(SELECT count(*) FROM goshuin_records
+              WHERE spot_id = OLD.id AND user_id = OLD.user_id)::integer
+        );
+    END IF;
+    IF TG_OP = 'INSERT' THEN
+        PERFORM bump_prefecture_counter(NEW.user_id, NEW.prefecture, 1, 0);
+    ELSIF TG_OP = 'UPDATE' THEN
+        PERFORM bump_prefecture_counter(
+            NEW.user_id,
+            NEW.prefecture,
+            1,
+            (SELECT count(*) FROM goshuin_records
+             WHERE spot_id = NEW.id AND user_id = NEW.user_id)::integer
+        );
+    END IF;
+    IF TG_OP = 'DELETE' THEN
+        RETURN OLD;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# Records count towards the prefecture of their spot when both share an owner.
+COUNT_GOSHUIN_PREFECTURE_FUNCTION = """
+CREATE OR REPLACE FUNCTION count_goshuin_prefecture() RETURNS trigger AS $$
+DECLARE
+    spot_owner uuid;
+    spot_prefecture varchar;
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        SELECT user_id, prefecture INTO spot_owner, spot_prefecture
+        FROM spots WHERE id = OLD.spot_id;
+        IF spot_owner = OLD.user_id THEN
+            PERFORM bump_prefecture_counter(spot_owner, spot_prefecture, 0, -1);
+        END IF;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        SELECT user_id, prefecture INTO spot_owner, spot_prefecture
+        FROM spots WHERE id = NEW.spot_id;
+        IF spot_owner = NEW.user_id THEN
+            PERFORM bump_prefecture_counter(spot_owner, spot_prefecture, 0, 1);
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+PREFECTURE_COUNTER_TRIGGERS = {
+    "spots_prefecture_counter_insert": (
+        "AFTER INSERT ON spots FOR EACH ROW EXECUTE FUNCTION count_spot_prefecture()"
+    ),
+    "spots_prefecture_counter_update": (
+        "AFTER UPDATE OF user_id, prefecture ON spots FOR EACH ROW "
+        "WHEN (OLD.user_id IS DISTINCT FROM NEW.user_id "
+        "OR OLD.prefecture IS DISTINCT FROM NEW.prefecture) "
+        "EXECUTE FUNCTION count_spot_prefecture()"
+    ),
+    "spots_prefecture_counter_delete": (
+        "BEFORE DELETE ON spots FOR EACH ROW EXECUTE FUNCTION count_spot_prefecture()"
+    ),
+    "goshuin_records_prefecture_counter": (
+        "AFTER INSERT OR DELETE ON goshuin_records "
+        "FOR EACH ROW EXECUTE FUNCTION count_goshuin_prefecture()"
+    ),
+    "goshuin_records_prefecture_counter_update": (
+        "AFTER UPDATE OF spot_id, user_id ON goshuin_records FOR EACH ROW "
+        "WHEN (OLD.spot_id IS DISTINCT FROM NEW.spot_id "
+        "OR OLD.user_id IS DISTINCT FROM NEW.user_id) "
+        "EXECUTE FUNCTION count_goshuin_prefecture()"
+    ),
+}
+
+
+class PrefectureCounter(Base):
+    """Spot and goshuin record counts of one user in one prefecture.
+
+    Rows are maintained by triggers on ``spots`` and ``goshuin_records`` and
+    can be recomputed with ``commands/rebuild_prefecture_counters.py``.
+    """
+
+    __tablename__ = "prefecture_counters"
+
+    # No foreign key: counters are updated while the owner's rows cascade away
+    user_id = Column(UUID(as_uuid=True), primary_key=True)
+    # Byte order, so the primary key index lists prefectures by code point
+    prefecture = Column(String(100, collation="C"), primary_key=True)
+    spot_count = Column(Integer, nullable=False, server_default=text("0"))
+    goshuin_count = Column(Integer, nullable=False, server_default=text("0"))
+
+
+for _function in (
+    BUMP_PREFECTURE_COUNTER_FUNCTION,
+    COUNT_SPOT_PREFECTURE_FUNCTION,
+    COUNT_GOSHUIN_PREFECTURE_FUNCTION,
+):
+    event.listen(Base.metadata, "after_create", DDL(_function).execute_if(dialect="postgresql"))
+for _trigger, _definition in PREFECTURE_COUNTER_TRIGGERS.items():
+    event.listen(
+        Base.metadata,
+        "after_create",
+        DDL(f"CREATE TRIGGER {_trigger} {_definition}").execute_if(dialect="postgresql"),
+    )
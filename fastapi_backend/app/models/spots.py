@@ -8,6 +8,7 @@ from sqlalchemy import (
     Boolean,
     CheckConstraint,
     Column,
+    Computed,
     DateTime,
     Enum,
     Float,
@@ -19,8 +20,8 @@ from sqlalchemy import (
     UniqueConstraint,
     func,
 )
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import Mapped, deferred, relationship
 
 from .base import Base
 
@@ -28,6 +29,19 @@ if TYPE_CHECKING:
     from .goshuin_records import GoshuinRecord
 
 
+# Text searched by keyword. Japanese has no word boundaries for a text search
+# configuration to split on, so substring matches go through a pg_trgm index on
+# ``search_text`` while ``search_vector`` ranks space separated words.
+SPOT_SEARCH_TEXT = (
+    "coalesce(name, '') || ' ' || coalesce(address, '') || ' ' || coalesce(description, '')"
+)
+SPOT_SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(address, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'C')"
+)
+
+
 class SpotType(str, enum.Enum):
     SHRINE = "shrine"
     TEMPLE = "temple"
@@ -44,8 +58,13 @@ class Spot(Base):
             "longitude >= -180 AND longitude <= 180",
             name="ck_spots_longitude_range",
         ),
-        Index("ix_spots_prefecture", "prefecture"),
-        Index("ix_spots_spot_type", "spot_type"),
+        Index("ix_spots_user_id_prefecture", "user_id", "prefecture"),
+        Index("ix_spots_user_id_spot_type", "user_id", "spot_type"),
+        Index("ix_spots_user_id_updated_at", "user_id", "updated_at"),
+        Index("ix_spots_user_id_name_id", "user_id", "name", "id"),
+        Index("ix_spots_search_vector", "search_vector", postgresql_using="gin"),
+        # ix_spots_search_text_trgm (gin_trgm_ops) is created by the migration
+        # since it needs the pg_trgm extension
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
@@ -65,6 +84,8 @@ class Spot(Base):
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
     )
+    search_text = deferred(Column(Text, Computed(SPOT_SEARCH_TEXT, persisted=True)))
+    search_vector = deferred(Column(TSVECTOR, Computed(SPOT_SEARCH_VECTOR, persisted=True)))
 
     goshuin_records: Mapped[list["GoshuinRecord"]] = relationship(
         "GoshuinRecord", back_populates="spot", cascade="all, delete-orphan"
@@ -74,6 +95,24 @@ class Spot(Base):
     )
 
 
+# Prefix lookups for name and slug suggestions; text_pattern_ops serves
+# ``LIKE 'prefix%'`` whatever the database collation is
+Index(
+    "ix_spots_user_id_lower_name",
+    Spot.user_id,
+    func.lower(Spot.name).label("lower_name"),
+    postgresql_ops={"lower_name": "text_pattern_ops"},
+)
+Index("ix_spots_user_id_slug", Spot.user_id, Spot.slug, postgresql_ops={"slug": "text_pattern_ops"})
+# Map area and radius lookups in app.services.geo; a GiST index on a core
+# ``point`` so no PostGIS is needed
+Index(
+    "ix_spots_location",
+    func.point(Spot.longitude, Spot.latitude).label("location"),
+    postgresql_using="gist",
+)
+
+
 class SpotImageType(str, enum.Enum):
     EXTERIOR = "exterior"
     INTERIOR = "interior"
@@ -88,6 +127,7 @@ class SpotImage(Base):
             "spot_id", "display_order", name="uq_spot_images_spot_id_display_order"
         ),
         Index("ix_spot_images_spot_id", "spot_id"),
+        Index("ix_spot_images_updated_at", "updated_at"),
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
@@ -97,9 +137,13 @@ class SpotImage(Base):
         nullable=False,
     )
     image_url = Column(String(500), nullable=False)
+    thumbnail_url = Column(String(500), nullable=True)
     image_type = Column(Enum(SpotImageType, name="spot_image_type"), nullable=False)
     is_primary = Column(Boolean, nullable=False, server_default="false")
     display_order = Column(Integer, nullable=False, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
 
     spot: Mapped["Spot"] = relationship("Spot", back_populates="images")
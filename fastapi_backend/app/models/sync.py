@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    Column,
+    DateTime,
+    Index,
+    String,
+    event,
+    func,
+)
+from sqlalchemy.dialects.postgresql import UUID
+
+from .base import Base
+
+# Tables whose deletes are recorded, mapped to the entity type reported to clients
+SYNC_TOMBSTONE_ENTITIES = {
+    "spots": "spot",
+    "spot_images": "spot_image",
+    "goshuin_records": "goshuin_record",
+    "goshuin_images": "goshuin_image",
+}
+
+# Children deleted together with their parent are not recorded: the parent's
+# tombstone already tells clients to drop them.
+RECORD_SYNC_TOMBSTONE_FUNCTION = """
+CREATE OR REPLACE FUNCTION record_sync_tombstone() RETURNS trigger AS $$
+DECLARE
+    owner_id uuid;
+BEGIN
+    IF TG_TABLE_NAME = 'spot_images' THEN
+        SELECT user_id INTO owner_id FROM spots WHERE id = OLD.spot_id;
+    ELSIF TG_TABLE_NAME = 'goshuin_images' THEN
+        SELECT user_id INTO owner_id FROM goshuin_records WHERE id = OLD.goshuin_record_id;
+    ELSE
+        owner_id := OLD.user_id;
+    END IF;
+    IF owner_id IS NOT NULL THEN
+        INSERT INTO sync_tombstones (user_id, entity_type, entity_id)
+        VALUES (owner_id, TG_ARGV[0], OLD.id);
+    END IF;
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+class SyncTombstone(Base):
+    __tablename__ = "sync_tombstones"
+    __table_args__ = (Index("ix_sync_tombstones_user_id_deleted_at", "user_id", "deleted_at"),)
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    # No foreign key: tombstones are written while the owner's rows cascade away
+    user_id = Column(UUID(as_uuid=True), nullable=False)
+    entity_type = Column(String(32), nullable=False)
+    entity_id = Column(UUID(as_uuid=True), nullable=False)
+    deleted_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(RECORD_SYNC_TOMBSTONE_FUNCTION).execute_if(dialect="postgresql"),
+)
+for _table, _entity_type in SYNC_TOMBSTONE_ENTITIES.items():
+    event.listen(
+        Base.metadata,
+        "after_create",
+        DDL(
+            f"CREATE TRIGGER {_table}_sync_tombstone AFTER DELETE ON {_table} "
+            f"FOR EACH ROW EXECUTE FUNCTION record_sync_tombstone('{_entity_type}')"
+        ).execute_if(dialect="postgresql"),
+    )
@@ -0,0 +1,167 @@
+"""Pagination helpers shared by the list endpoints.
+
+Keyset pages are read with ``WHERE (k1, k2) > (:v1, :v2) ORDER BY k1, k2 LIMIT
+size`` so their cost does not depend on how deep the page is, and no
+``COUNT(*)`` is run. The keys must be unique together (end them with the
+primary key) and not nullable. The cursor is an opaque token holding the keys
+of the last row returned plus the sort direction it was issued for.
+
+Offset pages normally come with an exact total from ``fastapi_pagination``;
+:class:`TotalMode` lets a client skip that count or settle for an estimate.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import date
+from enum import Enum
+from typing import Any, Generic, TypeVar
+from uuid import UUID
+
+from sqlalchemy import ClauseElement, Executable, Select, func, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+
+from app.serialization import json_dumps, json_loads
+
+T = TypeVar("T")
+
+
+class CursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+class TotalMode(str, Enum):
+    """How the ``total`` of an offset page is computed."""
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
+@dataclass(slots=True)
+class KeysetPage(Generic[T]):
+    """Rows of one keyset page and the cursor of the next one, if any."""
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+@dataclass(slots=True)
+class OffsetPage(Generic[T]):
+    """Rows of one offset page and whether another page follows."""
+
+    items: list[T] = field(default_factory=list)
+    has_next: bool = False
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: Select[Any]) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def _parse_key(key: Any, value: Any) -> Any:
+    python_type = key.type.python_type
+    if issubclass(python_type, date):
+        return python_type.fromisoformat(value)
+    if issubclass(python_type, UUID):
+        return UUID(value)
+    return python_type(value)
+
+
+def encode_cursor(keys: Sequence[Any], item: Any, *, descending: bool = False) -> str:
+    """Return the cursor pointing after ``item``, an ORM object or schema."""
+
+    payload = json_dumps(
+        {"k": [getattr(item, key.key) for key in keys], "d": descending}
+    )
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(keys: Sequence[Any], cursor: str, *, descending: bool = False) -> list[Any]:
+    """Return the key values stored in ``cursor``."""
+
+    try:
+        payload: Any = json_loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        values = [_parse_key(key, value) for key, value in zip(keys, payload["k"], strict=True)]
+        cursor_descending = payload["d"]
+    except (binascii.Error, ValueError, TypeError, KeyError) as exc:
+        raise CursorError("Pagination cursor is invalid") from exc
+    if cursor_descending is not descending:
+        raise CursorError("Pagination cursor was issued for another sort order")
+    return values
+
+
+async def keyset_paginate(
+    session: AsyncSession,
+    query: Select[Any],
+    keys: Sequence[Any],
+    *,
+    size: int,
+    cursor: str | None = None,
+    descending: bool = False,
+) -> KeysetPage[Any]:
+    """Return the page of ``query`` following ``cursor``, ordered by ``keys``.
+
+    ``query`` must select a single entity and carry no ``ORDER BY`` of its own.
+    """
+
+    if cursor:
+        position = tuple_(*keys)
+        values = decode_cursor(keys, cursor, descending=descending)
+        after = tuple_(
+            *(literal(value, key.type) for key, value in zip(keys, values, strict=True))
+        )
+        query = query.where(position < after if descending else position > after)
+
+    rows = list(
+        (
+            await session.execute(
+                query.order_by(*(key.desc() if descending else key.asc() for key in keys))
+                .limit(size + 1)
+            )
+        ).scalars()
+    )
+    page = KeysetPage(items=rows[:size])
+    if len(rows) > size:
+        page.next_cursor = encode_cursor(keys, page.items[-1], descending=descending)
+    return page
+
+
+async def offset_paginate(
+    session: AsyncSession, query: Select[Any], *, page: int, size: int
+) -> OffsetPage[Any]:
+    """Return page ``page`` of ``query`` without counting its rows.
+
+    One row more than ``size`` is read to tell whether another page follows.
+    ``query`` must select a single entity and carry its own ``ORDER BY``.
+    """
+
+    rows = list(
+        (await session.execute(query.offset((page - 1) * size).limit(size + 1))).scalars()
+    )
+    return OffsetPage(items=rows[:size], has_next=len(rows) > size)
+
+
+async def count_rows(session: AsyncSession, query: Select[Any]) -> int:
+    """Return the exact number of rows ``query`` selects."""
+
+    counted = select(func.count()).select_from(query.order_by(None).subquery())
+    return (await session.execute(counted)).scalar_one()
+
+
+async def estimate_rows(session: AsyncSession, query: Select[Any]) -> int:
+    """Return the planner's estimate of the rows ``query`` selects, without running it."""
+
+    plan = (await session.execute(_Explain(query.order_by(None)))).scalar_one()
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -42,14 +42,26 @@ class ItemRead(ItemBase):
 
 
 from .spots import (  # noqa: E402,F401
+    NearbySpot,
+    PaginatedSpotSearchResponse,
     PaginatedSpotsResponse,
+    SpotCluster,
+    SpotClustersResponse,
     SpotCreate,
+    SpotListItem,
     SpotRead,
+    SpotSearchResult,
+    SpotSuggestion,
+    SpotSummary,
     SpotUpdate,
+    SpotWithinResult,
+    SpotsWithinResponse,
 )
 
 from .goshuin import (  # noqa: E402,F401
+    FacetCount,
     GoshuinCreate,
+    GoshuinFacets,
     GoshuinRead,
     GoshuinUpdate,
     PaginatedGoshuinResponse,
@@ -71,6 +83,19 @@ from .prefectures import (  # noqa: E402,F401
     PrefectureStatsResponse,
 )
 
+from .bulk import (  # noqa: E402,F401
+    BulkErrorCode,
+    BulkItemError,
+    BulkRequest,
+    GoshuinBulkCreateItem,
+    GoshuinBulkResponse,
+    GoshuinBulkResult,
+    GoshuinBulkUpdateItem,
+    SpotBulkResponse,
+    SpotBulkResult,
+    SpotBulkUpdateItem,
+)
+
 
 __all__ = [
     "UserRead",
@@ -82,11 +107,23 @@ __all__ = [
     "SpotCreate",
     "SpotRead",
     "SpotUpdate",
+    "SpotListItem",
+    "SpotSummary",
     "PaginatedSpotsResponse",
+    "PaginatedSpotSearchResponse",
+    "SpotSearchResult",
+    "SpotSuggestion",
+    "SpotWithinResult",
+    "SpotsWithinResponse",
+    "SpotCluster",
+    "SpotClustersResponse",
+    "NearbySpot",
     "GoshuinCreate",
     "GoshuinRead",
     "GoshuinUpdate",
     "PaginatedGoshuinResponse",
+    "FacetCount",
+    "GoshuinFacets",
     "ImageGPSMetadata",
     "ImageExifMetadata",
     "ImageUploadResponse",
@@ -97,4 +134,14 @@ __all__ = [
     "GoshuinImageRead",
     "PrefectureStats",
     "PrefectureStatsResponse",
+    "BulkRequest",
+    "BulkErrorCode",
+    "BulkItemError",
+    "SpotBulkUpdateItem",
+    "SpotBulkResult",
+    "SpotBulkResponse",
+    "GoshuinBulkCreateItem",
+    "GoshuinBulkUpdateItem",
+    "GoshuinBulkResult",
+    "GoshuinBulkResponse",
 ]
@@ -0,0 +1,83 @@
+"""Schemas for bulk create and update of spots and goshuin records."""
+
+from __future__ import annotations
+
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from .goshuin import GoshuinCreate, GoshuinRead, GoshuinUpdate
+from .spots import SpotRead, SpotUpdate
+
+BULK_MAX_ITEMS = 500
+
+
+class BulkRequest(BaseModel):
+    """Items to create or update in one transaction.
+
+    Items are validated one by one against the payload schema of the endpoint,
+    so an invalid item is reported in ``errors`` instead of rejecting the batch.
+    """
+
+    items: list[dict[str, Any]] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class BulkErrorCode(str, Enum):
+    INVALID = "invalid"
+    NOT_FOUND = "not_found"
+    CONFLICT = "conflict"
+    REJECTED = "rejected"
+
+
+class BulkItemError(BaseModel):
+    """Why one item of a bulk request was not written."""
+
+    index: int = Field(..., description="Position of the item in the request")
+    code: BulkErrorCode
+    message: str
+
+
+class SpotBulkUpdateItem(SpotUpdate):
+    """Changes to one spot of a bulk update."""
+
+    id: UUID
+
+
+class SpotBulkResult(SpotRead):
+    """Spot written by a bulk request."""
+
+    index: int = Field(..., description="Position of the item in the request")
+
+
+class SpotBulkResponse(BaseModel):
+    """Outcome of a bulk spot request, both lists in request order."""
+
+    items: list[SpotBulkResult]
+    errors: list[BulkItemError]
+
+
+class GoshuinBulkCreateItem(GoshuinCreate):
+    """Goshuin record to create in a bulk request."""
+
+    spot_id: UUID
+
+
+class GoshuinBulkUpdateItem(GoshuinUpdate):
+    """Changes to one goshuin record of a bulk update."""
+
+    id: UUID
+
+
+class GoshuinBulkResult(GoshuinRead):
+    """Goshuin record written by a bulk request."""
+
+    index: int = Field(..., description="Position of the item in the request")
+
+
+class GoshuinBulkResponse(BaseModel):
+    """Outcome of a bulk goshuin request, both lists in request order."""
+
+    items: list[GoshuinBulkResult]
+    errors: list[BulkItemError]
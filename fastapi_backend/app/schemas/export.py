@@ -4,9 +4,12 @@ from __future__ import annotations
 
 from datetime import datetime
 from typing import Any
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.models.export_jobs import ExportJobFormat, ExportJobStatus
+
 
 class ExportSpotData(BaseModel):
     """Spot data for export."""
@@ -58,3 +61,25 @@ class ExportFormat(BaseModel):
     include_images: bool = Field(
         default=False, description="Include image URLs in export"
     )
+
+
+class ExportJobCreate(BaseModel):
+    """Payload for requesting a background export."""
+
+    format: ExportJobFormat = Field(
+        default=ExportJobFormat.JSON, description="Export format: json or csv"
+    )
+
+
+class ExportJobRead(BaseModel):
+    """Status of a background export job."""
+
+    id: UUID
+    format: ExportJobFormat
+    status: ExportJobStatus
+    size_bytes: int | None = None
+    error: str | None = None
+    created_at: datetime
+    completed_at: datetime | None = None
+
+    model_config: dict[str, Any] = {"from_attributes": True}
@@ -91,18 +91,49 @@ class GoshuinRead(GoshuinBase):
     model_config: dict[str, Any] = {"from_attributes": True}
 
 
+class FacetCount(BaseModel):
+    """Number of matching records sharing one value of a facet."""
+
+    value: str | int | None
+    count: int
+
+
+class GoshuinFacets(BaseModel):
+    """Counts of the matching records by each filterable dimension, largest first."""
+
+    status: list[FacetCount]
+    acquisition_method: list[FacetCount]
+    rating: list[FacetCount]
+    prefecture: list[FacetCount]
+    spot_type: list[FacetCount]
+
+
 class PaginatedGoshuinResponse(BaseModel):
     """Standard paginated response for goshuin record collections."""
 
     items: list[GoshuinRead]
-    total: int
-    page: int
+    total: int | None = Field(
+        default=None,
+        description=(
+            "Matching items, an estimate with include_total=estimated and null with "
+            "include_total=none or a cursor"
+        ),
+    )
+    page: int | None = Field(default=None, description="Page number, omitted in cursor mode")
     size: int
+    next_cursor: str | None = Field(
+        default=None, description="Pass as `cursor` to read the next page, null on the last"
+    )
+    facets: GoshuinFacets | None = Field(
+        default=None, description="Only filled in with include_facets=true"
+    )
 
     model_config: dict[str, Any] = {"from_attributes": True}
 
 
 __all__ = [
+    "FacetCount",
+    "GoshuinFacets",
     "GoshuinCreate",
     "GoshuinRead",
     "GoshuinUpdate",
@@ -6,10 +6,12 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.models import GoshuinImageType, SpotImageType
 
+from .spots import NearbySpot
+
 
 class ImageGPSMetadata(BaseModel):
     """GPS coordinates parsed from EXIF metadata."""
@@ -43,6 +45,10 @@ class ImageUploadResponse(BaseModel):
     image_url: str
     thumbnail_url: str | None = None
     metadata: ImageExifMetadata | None = None
+    nearby_spots: list[NearbySpot] = Field(
+        default_factory=list,
+        description="The user's spots near where the photo was taken, nearest first",
+    )
 
 
 class ImageReorderRequest(BaseModel):
@@ -71,6 +77,7 @@ class SpotImageRead(BaseModel):
 
     id: UUID
     image_url: str
+    thumbnail_url: str | None = None
     image_type: SpotImageType
     is_primary: bool
     display_order: int
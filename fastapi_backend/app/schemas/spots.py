@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import date
 from typing import Any
 from uuid import UUID
 
@@ -86,12 +87,116 @@ class SpotRead(SpotBase):
     model_config: dict[str, Any] = {"from_attributes": True}
 
 
+class SpotSummary(BaseModel):
+    """Primary image and visit history of a spot, embedded in spot lists."""
+
+    primary_image_id: UUID | None = Field(
+        default=None, description="The primary image, or the first one when none is marked"
+    )
+    primary_image_url: str | None = None
+    primary_thumbnail_url: str | None = None
+    goshuin_count: int = 0
+    last_visit_date: date | None = None
+
+
+class SpotListItem(SpotRead):
+    """Spot of a list page."""
+
+    summary: SpotSummary | None = Field(
+        default=None, description="Only filled in with include_summary=true"
+    )
+
+
 class PaginatedSpotsResponse(BaseModel):
     """Standard paginated response for spot collections."""
 
-    items: list[SpotRead]
+    items: list[SpotListItem]
+    total: int | None = Field(
+        default=None,
+        description=(
+            "Matching items, an estimate with include_total=estimated and null with "
+            "include_total=none or a cursor"
+        ),
+    )
+    page: int | None = Field(default=None, description="Page number, omitted in cursor mode")
+    size: int
+    next_cursor: str | None = Field(
+        default=None, description="Pass as `cursor` to read the next page, null on the last"
+    )
+
+    model_config: dict[str, Any] = {"from_attributes": True}
+
+
+class SpotSearchResult(SpotRead):
+    """Spot matching a keyword search."""
+
+    rank: float = Field(..., description="Relevance of the spot, higher is better")
+    snippet: str | None = Field(
+        default=None,
+        description="HTML excerpt with the matched terms wrapped in <mark>",
+    )
+
+
+class PaginatedSpotSearchResponse(BaseModel):
+    """Paginated keyword search results, most relevant first."""
+
+    items: list[SpotSearchResult]
     total: int
     page: int
     size: int
 
+
+class SpotWithinResult(SpotRead):
+    """Spot found by a map area or radius lookup."""
+
+    distance_m: float = Field(
+        ..., description="Great circle distance in meters from `near` or the bbox center"
+    )
+
+
+class SpotsWithinResponse(BaseModel):
+    """Spots of a map area or radius, nearest first."""
+
+    items: list[SpotWithinResult]
+    truncated: bool = Field(
+        ..., description="More spots matched than `limit`; zoom in or raise the limit"
+    )
+
+
+class SpotCluster(BaseModel):
+    """Spots of one map grid cell, drawn as a single marker."""
+
+    count: int = Field(..., description="Number of spots in the cell")
+    latitude: float = Field(..., description="Latitude of the spots' centroid")
+    longitude: float = Field(..., description="Longitude of the spots' centroid")
+    bounds: tuple[float, float, float, float] = Field(
+        ..., description="Extent of the spots as west, south, east, north"
+    )
+    spot_id: UUID | None = Field(default=None, description="The spot of a single spot cell")
+
+
+class SpotClustersResponse(BaseModel):
+    """Marker clusters of a map viewport."""
+
+    zoom: int
+    cell_size: float = Field(..., description="Width and height of a grid cell in degrees")
+    clusters: list[SpotCluster]
+
+
+class NearbySpot(BaseModel):
+    """Existing spot close to a point, such as where a photo was taken."""
+
+    id: UUID
+    name: str
+    slug: str
+    distance_m: float = Field(..., description="Great circle distance in meters")
+
+
+class SpotSuggestion(BaseModel):
+    """Spot offered while the user types a name or slug."""
+
+    id: UUID
+    name: str
+    slug: str
+
     model_config: dict[str, Any] = {"from_attributes": True}
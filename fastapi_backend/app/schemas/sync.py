@@ -0,0 +1,54 @@
+"""Schemas for the offline sync change feed."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from .goshuin import GoshuinRead
+from .images import GoshuinImageRead, SpotImageRead
+from .spots import SpotRead
+
+
+class SyncSpot(SpotRead):
+    """Spot as delivered by the change feed."""
+
+    updated_at: datetime
+
+
+class SyncSpotImage(SpotImageRead):
+    """Spot image as delivered by the change feed."""
+
+    spot_id: UUID
+    updated_at: datetime
+
+
+class SyncGoshuinImage(GoshuinImageRead):
+    """Goshuin image as delivered by the change feed."""
+
+    goshuin_record_id: UUID
+    updated_at: datetime
+
+
+class SyncDeletion(BaseModel):
+    """Entity removed since the previous sync."""
+
+    entity_type: Literal["spot", "spot_image", "goshuin_record", "goshuin_image"]
+    id: UUID
+    deleted_at: datetime
+
+
+class SyncChangesResponse(BaseModel):
+    """Entities created, updated or deleted since a sync token."""
+
+    spots: list[SyncSpot] = Field(default_factory=list)
+    spot_images: list[SyncSpotImage] = Field(default_factory=list)
+    goshuin_records: list[GoshuinRead] = Field(default_factory=list)
+    goshuin_images: list[SyncGoshuinImage] = Field(default_factory=list)
+    deleted: list[SyncDeletion] = Field(default_factory=list)
+    sync_token: str = Field(..., description="Opaque token to pass as `since` next time")
+
+    model_config: dict[str, Any] = {"from_attributes": True}
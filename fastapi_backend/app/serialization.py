@@ -0,0 +1,108 @@
+"""Pluggable JSON serialization shared by API responses and exports."""
+
+from __future__ import annotations
+
+import enum
+import json
+import logging
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Callable
+from uuid import UUID
+
+from fastapi.responses import JSONResponse
+
+from app.config import settings
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except Exception:  # pragma: no cover - msgspec is optional
+    msgspec = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+JSONDumps = Callable[[Any], bytes]
+JSONLoads = Callable[[bytes | str], Any]
+
+
+def _default(value: Any) -> Any:
+    """Convert values the stdlib encoder does not understand."""
+
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        # Match pydantic's JSON mode, which renders UTC offsets as "Z"
+        if value.utcoffset() == timedelta(0):
+            return value.isoformat().replace("+00:00", "Z")
+        return value.isoformat()
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(payload: Any) -> bytes:
+    return json.dumps(
+        payload, ensure_ascii=False, separators=(",", ":"), default=_default
+    ).encode("utf-8")
+
+
+def _orjson_dumps(payload: Any) -> bytes:
+    return orjson.dumps(
+        payload, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+    )
+
+
+def _build_msgspec_dumps() -> JSONDumps:
+    encoder = msgspec.json.Encoder(enc_hook=_default)
+    return encoder.encode
+
+
+def get_json_dumps(backend: str | None = None) -> JSONDumps:
+    """Return the ``dumps`` callable for the requested serializer backend.
+
+    Falls back to the standard library encoder when the configured backend is
+    not installed, so the application keeps working without the extras.
+    """
+
+    backend = (backend or settings.JSON_SERIALIZER).lower()
+    if backend == "orjson" and orjson is not None:
+        return _orjson_dumps
+    if backend == "msgspec" and msgspec is not None:
+        return _build_msgspec_dumps()
+    if backend != "json":
+        logger.warning(
+            "JSON serializer '%s' is not available; falling back to the stdlib encoder",
+            backend,
+        )
+    return _stdlib_dumps
+
+
+def get_json_loads(backend: str | None = None) -> JSONLoads:
+    """Return the ``loads`` callable matching :func:`get_json_dumps`."""
+
+    backend = (backend or settings.JSON_SERIALIZER).lower()
+    if backend == "orjson" and orjson is not None:
+        return orjson.loads
+    if backend == "msgspec" and msgspec is not None:
+        return msgspec.json.Decoder().decode
+    return json.loads
+
+
+json_dumps: JSONDumps = get_json_dumps()
+json_loads: JSONLoads = get_json_loads()
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with the configured fast serializer."""
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
@@ -2,14 +2,25 @@
 
 from .export import (
     ExportBundle,
+    ExportEngine,
     ExportService,
     ExportUserMetadata,
-    ImportResult,
+    ReactPdfDocumentPage,
     ReactPdfImage,
     ReactPdfRecord,
     ReactPdfSpotSection,
     get_export_service,
 )
+from .export_jobs import ExportJobService, get_export_job_service
+from .importer import (
+    ImportFormatError,
+    ImportResult,
+    ImportWriter,
+    decompress_stream,
+    iter_json_bundle_entries,
+    iter_ndjson_entries,
+)
+from .sync import SyncService, SyncTokenError, get_sync_service
 from .storage import (
     GPSMetadata,
     ImageMetadata,
@@ -21,17 +32,29 @@ from .storage import (
 
 __all__ = [
     "ExportBundle",
+    "ExportEngine",
+    "ExportJobService",
     "ExportService",
     "ExportUserMetadata",
     "GPSMetadata",
     "ImageMetadata",
     "ImageValidationError",
+    "ImportFormatError",
     "ImportResult",
+    "ImportWriter",
+    "ReactPdfDocumentPage",
     "ReactPdfImage",
     "ReactPdfRecord",
     "ReactPdfSpotSection",
     "StorageService",
     "StorageServiceError",
+    "SyncService",
+    "SyncTokenError",
+    "decompress_stream",
+    "get_export_job_service",
     "get_export_service",
     "get_storage_service",
+    "get_sync_service",
+    "iter_json_bundle_entries",
+    "iter_ndjson_entries",
 ]
@@ -0,0 +1,319 @@
+"""Bulk create and update of spots and goshuin records.
+
+Every bulk request is written with one batched statement per kind of change,
+``INSERT ... VALUES (...), (...)`` or ``UPDATE ... FROM (VALUES ...)``, each
+returning the written rows so nothing is read back afterwards. Problems are
+reported per item instead of failing the batch:
+
+* items not matching the payload schema are ``invalid``;
+* spots and records the user does not own are ``not_found``;
+* inserts skip rows hitting the slug or unique visit constraint with
+  ``ON CONFLICT DO NOTHING`` and report them as ``conflict``.
+
+Each statement runs in a savepoint. Should one still fail on a constraint,
+such as an update moving a record onto an existing visit, the savepoint is
+rolled back and its items are written one by one to single out the failing
+ones. The caller commits the whole request once.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, TypeVar
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import Executable, Row, column, select, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import GoshuinRecord, Spot
+from app.schemas import (
+    BulkErrorCode,
+    BulkItemError,
+    GoshuinBulkCreateItem,
+    GoshuinBulkResponse,
+    GoshuinBulkResult,
+    GoshuinBulkUpdateItem,
+    GoshuinCreate,
+    GoshuinRead,
+    SpotBulkResponse,
+    SpotBulkResult,
+    SpotBulkUpdateItem,
+    SpotCreate,
+    SpotRead,
+)
+
+UNIQUE_VIOLATION = "23505"
+
+M = TypeVar("M", bound=BaseModel)
+Staged = list[tuple[int, dict[str, Any]]]
+
+
+def _returned_columns(table: Any, schema: type[BaseModel]) -> list[Any]:
+    return [table.c[name] for name in schema.model_fields]
+
+
+SPOT_COLUMNS = _returned_columns(Spot.__table__, SpotRead)
+GOSHUIN_COLUMNS = _returned_columns(GoshuinRecord.__table__, GoshuinRead)
+
+
+def _validate(
+    schema: type[M], items: Sequence[dict[str, Any]], errors: list[BulkItemError]
+) -> list[tuple[int, M]]:
+    valid = []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, schema.model_validate(item)))
+        except ValidationError as exc:
+            message = "; ".join(
+                f"{'.'.join(str(part) for part in error['loc']) or 'item'}: {error['msg']}"
+                for error in exc.errors()
+            )
+            errors.append(BulkItemError(index=index, code=BulkErrorCode.INVALID, message=message))
+    return valid
+
+
+def _reject_repeated_ids(
+    changes: list[tuple[int, Any]], errors: list[BulkItemError]
+) -> list[tuple[int, Any]]:
+    first: dict[UUID, int] = {}
+    kept = []
+    for index, change in changes:
+        if change.id in first:
+            errors.append(
+                BulkItemError(
+                    index=index,
+                    code=BulkErrorCode.INVALID,
+                    message=f"Repeats the id of item {first[change.id]}",
+                )
+            )
+            continue
+        first[change.id] = index
+        kept.append((index, change))
+    return kept
+
+
+def _group_changes(
+    changes: Iterable[tuple[int, BaseModel]], errors: list[BulkItemError]
+) -> dict[tuple[str, ...], Staged]:
+    """Group partial updates by the fields they set, one ``UPDATE`` per group."""
+
+    groups: dict[tuple[str, ...], Staged] = {}
+    for index, change in changes:
+        data = change.model_dump(exclude_unset=True)
+        fields = tuple(sorted(data.keys() - {"id"}))
+        if not fields:
+            errors.append(
+                BulkItemError(index=index, code=BulkErrorCode.INVALID, message="Nothing to update")
+            )
+            continue
+        groups.setdefault(fields, []).append((index, data))
+    return groups
+
+
+def _update_by_id(
+    table: Any, user_id: UUID, fields: Sequence[str], returning: Sequence[Any]
+) -> Callable[[list[dict[str, Any]]], Executable]:
+    def build(rows: list[dict[str, Any]]) -> Executable:
+        changes = values(
+            *(column(name, table.c[name].type) for name in ("id", *fields)),
+            name="changes",
+        ).data([tuple(row[name] for name in ("id", *fields)) for row in rows])
+        return (
+            update(table)
+            .where(table.c.id == changes.c.id, table.c.user_id == user_id)
+            .values({name: changes.c[name] for name in fields})
+            .returning(*returning)
+        )
+
+    return build
+
+
+async def _write(
+    session: AsyncSession,
+    build: Callable[[list[dict[str, Any]]], Executable],
+    staged: Staged,
+    errors: list[BulkItemError],
+) -> dict[int, Row[Any]]:
+    """Run ``build`` over the staged rows and match the returned rows back by id.
+
+    Items whose row was not returned are left for the caller to report.
+    """
+
+    if not staged:
+        return {}
+    try:
+        async with session.begin_nested():
+            returned = (await session.execute(build([row for _, row in staged]))).all()
+    except IntegrityError:
+        returned = []
+        for index, row in staged:
+            try:
+                async with session.begin_nested():
+                    returned += (await session.execute(build([row]))).all()
+            except IntegrityError as exc:
+                unique = getattr(exc.orig, "sqlstate", None) == UNIQUE_VIOLATION
+                errors.append(
+                    BulkItemError(
+                        index=index,
+                        code=BulkErrorCode.CONFLICT if unique else BulkErrorCode.REJECTED,
+                        message=(
+                            "Conflicts with an existing item"
+                            if unique
+                            else "Rejected by a database constraint"
+                        ),
+                    )
+                )
+
+    by_id = {row.id: row for row in returned}
+    return {index: by_id[row["id"]] for index, row in staged if row["id"] in by_id}
+
+
+def _report_missing(
+    staged: Staged,
+    written: dict[int, Any],
+    errors: list[BulkItemError],
+    code: BulkErrorCode,
+    message: str,
+) -> None:
+    reported = {error.index for error in errors}
+    for index, _ in staged:
+        if index not in written and index not in reported:
+            errors.append(BulkItemError(index=index, code=code, message=message))
+
+
+async def create_spots(
+    session: AsyncSession, user_id: UUID, items: Sequence[dict[str, Any]]
+) -> SpotBulkResponse:
+    """Insert the valid items as new spots of ``user_id``."""
+
+    errors: list[BulkItemError] = []
+    staged = [
+        (index, {**spot.model_dump(), "id": uuid4(), "user_id": user_id})
+        for index, spot in _validate(SpotCreate, items, errors)
+    ]
+
+    def build(rows: list[dict[str, Any]]) -> Executable:
+        return (
+            pg_insert(Spot.__table__)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["slug"])
+            .returning(*SPOT_COLUMNS)
+        )
+
+    written = await _write(session, build, staged, errors)
+    _report_missing(staged, written, errors, BulkErrorCode.CONFLICT, "Slug is already in use")
+    return SpotBulkResponse(
+        items=[
+            SpotBulkResult.model_validate({**row._mapping, "index": index})
+            for index, row in sorted(written.items())
+        ],
+        errors=sorted(errors, key=lambda error: error.index),
+    )
+
+
+async def update_spots(
+    session: AsyncSession, user_id: UUID, items: Sequence[dict[str, Any]]
+) -> SpotBulkResponse:
+    """Apply the valid partial updates to spots of ``user_id``."""
+
+    errors: list[BulkItemError] = []
+    changes = _reject_repeated_ids(_validate(SpotBulkUpdateItem, items, errors), errors)
+    written: dict[int, Row[Any]] = {}
+    for fields, staged in _group_changes(changes, errors).items():
+        build = _update_by_id(Spot.__table__, user_id, fields, SPOT_COLUMNS)
+        written |= await _write(session, build, staged, errors)
+        _report_missing(staged, written, errors, BulkErrorCode.NOT_FOUND, "Spot not found")
+    return SpotBulkResponse(
+        items=[
+            SpotBulkResult.model_validate({**row._mapping, "index": index})
+            for index, row in sorted(written.items())
+        ],
+        errors=sorted(errors, key=lambda error: error.index),
+    )
+
+
+async def create_goshuin_records(
+    session: AsyncSession, user_id: UUID, items: Sequence[dict[str, Any]]
+) -> GoshuinBulkResponse:
+    """Insert the valid items as goshuin records of ``user_id``."""
+
+    errors: list[BulkItemError] = []
+    records = _validate(GoshuinBulkCreateItem, items, errors)
+    owned = set(
+        (
+            await session.execute(
+                select(Spot.id).where(
+                    Spot.user_id == user_id,
+                    Spot.id.in_({record.spot_id for _, record in records}),
+                )
+            )
+        ).scalars()
+    )
+    staged = []
+    for index, record in records:
+        if record.spot_id not in owned:
+            errors.append(
+                BulkItemError(index=index, code=BulkErrorCode.NOT_FOUND, message="Spot not found")
+            )
+            continue
+        staged.append(
+            (
+                index,
+                {
+                    **record.model_dump(include=set(GoshuinCreate.model_fields)),
+                    "id": uuid4(),
+                    "user_id": user_id,
+                    "spot_id": record.spot_id,
+                },
+            )
+        )
+
+    def build(rows: list[dict[str, Any]]) -> Executable:
+        return (
+            pg_insert(GoshuinRecord.__table__)
+            .values(rows)
+            .on_conflict_do_nothing(constraint="uq_goshuin_records_unique_visit")
+            .returning(*GOSHUIN_COLUMNS)
+        )
+
+    written = await _write(session, build, staged, errors)
+    _report_missing(
+        staged,
+        written,
+        errors,
+        BulkErrorCode.CONFLICT,
+        "A goshuin record of this spot and visit date exists",
+    )
+    return GoshuinBulkResponse(
+        items=[
+            GoshuinBulkResult.model_validate({**row._mapping, "index": index})
+            for index, row in sorted(written.items())
+        ],
+        errors=sorted(errors, key=lambda error: error.index),
+    )
+
+
+async def update_goshuin_records(
+    session: AsyncSession, user_id: UUID, items: Sequence[dict[str, Any]]
+) -> GoshuinBulkResponse:
+    """Apply the valid partial updates to goshuin records of ``user_id``."""
+
+    errors: list[BulkItemError] = []
+    changes = _reject_repeated_ids(_validate(GoshuinBulkUpdateItem, items, errors), errors)
+    written: dict[int, Row[Any]] = {}
+    for fields, staged in _group_changes(changes, errors).items():
+        build = _update_by_id(GoshuinRecord.__table__, user_id, fields, GOSHUIN_COLUMNS)
+        written |= await _write(session, build, staged, errors)
+        _report_missing(
+            staged, written, errors, BulkErrorCode.NOT_FOUND, "Goshuin record not found"
+        )
+    return GoshuinBulkResponse(
+        items=[
+            GoshuinBulkResult.model_validate({**row._mapping, "index": index})
+            for index, row in sorted(written.items())
+        ],
+        errors=sorted(errors, key=lambda error: error.index),
+    )
@@ -0,0 +1,142 @@
+"""Grid clustering of a user's spots for the zoomed out map."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import String, cast, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Spot
+from app.schemas import SpotCluster
+
+from .geo import BoundingBox, within_bbox
+
+# Grid cells across one 256 pixel map tile, so a cell is about 64 pixels wide
+CLUSTER_CELLS_PER_TILE = 4
+CLUSTER_MAX_ZOOM = 22
+# Up to this zoom a user's whole collection is clustered once and cached;
+# deeper zooms only aggregate the viewport
+CLUSTER_CACHE_MAX_ZOOM = 12
+CLUSTER_CACHE_TTL = 300.0
+CLUSTER_CACHE_USERS = 256
+
+
+def cell_size(zoom: int) -> float:
+    """Return the width and height in degrees of a grid cell at ``zoom``."""
+
+    return 360.0 / (2**zoom * CLUSTER_CELLS_PER_TILE)
+
+
+@dataclass(slots=True)
+class _CachedClusters:
+    expires_at: float
+    clusters: list[SpotCluster]
+
+
+class SpotClusterService:
+    """Aggregate spots into one marker per grid cell.
+
+    Each cell of the ``cell_size(zoom)`` grid holding spots becomes a cluster
+    with its count, centroid and bounds, so the response size depends on the
+    viewport and zoom rather than on how many spots the user has. Clusters of
+    the zoomed out levels are cached per user and zoom for ``ttl`` seconds and
+    the spot routes invalidate them on every write. The cache is per process,
+    so other workers may serve clusters up to ``ttl`` old.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = CLUSTER_CACHE_TTL,
+        max_cached_zoom: int = CLUSTER_CACHE_MAX_ZOOM,
+        users: int = CLUSTER_CACHE_USERS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl
+        self._max_cached_zoom = max_cached_zoom
+        self._users = users
+        self._clock = clock
+        self._entries: OrderedDict[UUID, dict[int, _CachedClusters]] = OrderedDict()
+
+    async def clusters(
+        self, session: AsyncSession, user_id: UUID, zoom: int, viewport: BoundingBox
+    ) -> list[SpotCluster]:
+        """Return the clusters at ``zoom`` whose centroid lies in ``viewport``."""
+
+        if zoom > self._max_cached_zoom:
+            return await self._aggregate(session, user_id, zoom, within_bbox(viewport))
+
+        entries = self._entries.setdefault(user_id, {})
+        self._entries.move_to_end(user_id)
+        cached = entries.get(zoom)
+        if cached is None or cached.expires_at <= self._clock():
+            cached = _CachedClusters(
+                expires_at=self._clock() + self._ttl,
+                clusters=await self._aggregate(session, user_id, zoom),
+            )
+            entries[zoom] = cached
+            while len(self._entries) > self._users:
+                self._entries.popitem(last=False)
+
+        return [
+            cluster
+            for cluster in cached.clusters
+            if viewport.contains(cluster.latitude, cluster.longitude)
+        ]
+
+    async def _aggregate(
+        self, session: AsyncSession, user_id: UUID, zoom: int, *conditions: Any
+    ) -> list[SpotCluster]:
+        size = cell_size(zoom)
+        column = func.floor(Spot.longitude / size)
+        row = func.floor(Spot.latitude / size)
+        rows = await session.execute(
+            select(
+                func.count().label("count"),
+                func.avg(Spot.latitude).label("latitude"),
+                func.avg(Spot.longitude).label("longitude"),
+                func.min(Spot.longitude).label("west"),
+                func.min(Spot.latitude).label("south"),
+                func.max(Spot.longitude).label("east"),
+                func.max(Spot.latitude).label("north"),
+                func.min(cast(Spot.id, String)).label("spot_id"),
+            )
+            .where(
+                Spot.user_id == user_id,
+                Spot.latitude.is_not(None),
+                Spot.longitude.is_not(None),
+                *conditions,
+            )
+            .group_by(column, row)
+            .order_by(column, row)
+        )
+        return [
+            SpotCluster(
+                count=cell.count,
+                latitude=cell.latitude,
+                longitude=cell.longitude,
+                bounds=(cell.west, cell.south, cell.east, cell.north),
+                spot_id=UUID(cell.spot_id) if cell.count == 1 else None,
+            )
+            for cell in rows
+        ]
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Drop cached clusters after the user's spots changed."""
+
+        self._entries.pop(user_id, None)
+
+
+_spot_cluster_service = SpotClusterService()
+
+
+def get_spot_cluster_service() -> SpotClusterService:
+    """FastAPI dependency returning the process wide :class:`SpotClusterService`."""
+
+    return _spot_cluster_service
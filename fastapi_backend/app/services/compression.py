@@ -0,0 +1,74 @@
+"""Incremental compression of streamed export bodies."""
+
+from __future__ import annotations
+
+import enum
+import zlib
+from typing import AsyncIterator
+
+import zstandard
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+class ExportCompression(str, enum.Enum):
+    ZSTD = "zstd"
+    GZIP = "gzip"
+
+
+COMPRESSION_SUFFIXES = {ExportCompression.GZIP: "gz", ExportCompression.ZSTD: "zst"}
+COMPRESSION_MEDIA_TYPES = {
+    ExportCompression.GZIP: "application/gzip",
+    ExportCompression.ZSTD: "application/zstd",
+}
+
+
+def negotiate_compression(accept_encoding: str | None) -> ExportCompression | None:
+    """Return the preferred supported coding of an ``Accept-Encoding`` header.
+
+    The highest ``q`` value wins and zstd is preferred over gzip on ties. Codings
+    with ``q=0`` are refused, and ``*`` stands for any coding not listed.
+    """
+
+    if not accept_encoding:
+        return None
+
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, *params = (part.strip() for part in item.split(";"))
+        weight = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        if coding:
+            weights[coding.lower()] = weight
+
+    best: ExportCompression | None = None
+    best_weight = 0.0
+    for compression in ExportCompression:
+        weight = weights.get(compression.value, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = compression, weight
+    return best
+
+
+async def compress_stream(
+    chunks: AsyncIterator[bytes], compression: ExportCompression
+) -> AsyncIterator[bytes]:
+    """Compress ``chunks`` as they are produced, without buffering the whole body."""
+
+    if compression is ExportCompression.GZIP:
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    else:
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+
+    async for chunk in chunks:
+        output = compressor.compress(chunk)
+        if output:
+            yield output
+    yield compressor.flush()
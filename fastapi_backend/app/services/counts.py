@@ -0,0 +1,97 @@
+"""Estimated totals for the paginated list endpoints."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.pagination import count_rows, estimate_rows
+
+TOTAL_COUNT_CACHE_TTL = 60.0
+TOTAL_COUNT_EXACT_BELOW = 10_000
+TOTAL_COUNT_FILTERS_PER_USER = 64
+TOTAL_COUNT_USERS = 1024
+
+
+@dataclass(slots=True)
+class _CachedTotal:
+    expires_at: float
+    total: int
+
+
+class TotalCountService:
+    """Answer ``include_total=estimated`` from a per-user cache of list totals.
+
+    On a miss the planner's row estimate is read with ``EXPLAIN``. When it is
+    below ``exact_below`` the rows are counted instead, which is cheap at that
+    size and far more accurate than the planner on small, filtered sets. Either
+    number is cached per user and filter for ``ttl`` seconds, and the routes
+    invalidate a user's entries whenever they write spots or records. The cache
+    is per process, so other workers may serve totals up to ``ttl`` old.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = TOTAL_COUNT_CACHE_TTL,
+        exact_below: int = TOTAL_COUNT_EXACT_BELOW,
+        filters_per_user: int = TOTAL_COUNT_FILTERS_PER_USER,
+        users: int = TOTAL_COUNT_USERS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl
+        self._exact_below = exact_below
+        self._filters_per_user = filters_per_user
+        self._users = users
+        self._clock = clock
+        self._entries: OrderedDict[UUID, OrderedDict[Hashable, _CachedTotal]] = OrderedDict()
+
+    async def estimate(
+        self, session: AsyncSession, user_id: UUID, key: Hashable, query: Select[Any]
+    ) -> int:
+        """Return the estimated number of rows of ``query``, a list of ``user_id``.
+
+        ``key`` identifies the list and its filters, for example
+        ``("spots", prefecture, category)``.
+        """
+
+        now = self._clock()
+        entries = self._entries.setdefault(user_id, OrderedDict())
+        self._entries.move_to_end(user_id)
+        cached = entries.get(key)
+        if cached is not None and cached.expires_at > now:
+            entries.move_to_end(key)
+            return cached.total
+
+        total = await estimate_rows(session, query)
+        if total < self._exact_below:
+            total = await count_rows(session, query)
+
+        entries[key] = _CachedTotal(expires_at=self._clock() + self._ttl, total=total)
+        entries.move_to_end(key)
+        while len(entries) > self._filters_per_user:
+            entries.popitem(last=False)
+        while len(self._entries) > self._users:
+            self._entries.popitem(last=False)
+        return total
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Forget every total cached for ``user_id``."""
+
+        self._entries.pop(user_id, None)
+
+
+_total_count_service = TotalCountService()
+
+
+def get_total_count_service() -> TotalCountService:
+    """FastAPI dependency returning the process wide :class:`TotalCountService`."""
+
+    return _total_count_service
@@ -3,15 +3,31 @@
 from __future__ import annotations
 
 import csv
+import enum
 import io
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import replace
 from datetime import date, datetime
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, AsyncIterator, Mapping
 from uuid import UUID
 
-import json
-from pydantic import BaseModel, Field
-from sqlalchemy import select
+from fastapi_pagination import Params
+from fastapi_pagination.ext.sqlalchemy import apaginate
+from pydantic import BaseModel, Field, ValidationError
+from sqlalchemy import (
+    DateTime,
+    Enum,
+    RowMapping,
+    Select,
+    Text,
+    and_,
+    case,
+    cast,
+    func,
+    literal_column,
+    select,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -27,6 +43,42 @@ from app.models import (
     SpotType,
     User,
 )
+from app.serialization import JSONDumps, json_dumps
+
+from .importer import (
+    IMPORT_BATCH_SIZE,
+    ImportEntry,
+    ImportFormatError,
+    ImportResult,
+    ImportWriter,
+)
+from .parquet import PARQUET_ROW_GROUP_SIZE, ParquetStreamWriter, ParquetTable
+
+CSV_FIELDNAMES = (
+    "spot_id",
+    "spot_name",
+    "spot_slug",
+    "spot_type",
+    "prefecture",
+    "city",
+    "visit_date",
+    "acquisition_method",
+    "status",
+    "rating",
+    "notes",
+)
+EXPORT_FLUSH_THRESHOLD = 64 * 1024
+EXPORT_YIELD_PER = 1000
+# Matches the timestamps rendered by the backend JSON serializer for UTC values
+JSON_TIMESTAMP_FORMAT = 'YYYY-MM-DD"T"HH24:MI:SS.US"Z"'
+NDJSON_VERSION = "1.0"
+
+
+class ExportEngine(str, enum.Enum):
+    """Where the nested JSON export document is assembled."""
+
+    PYTHON = "python"
+    DATABASE = "database"
 
 
 class ExportedSpotImage(BaseModel):
@@ -96,6 +148,66 @@ class ExportedSpot(BaseModel):
     model_config: dict[str, Any] = {"from_attributes": True}
 
 
+def _exported_columns(
+    schema: type[BaseModel], model: type[Any], *parent_keys: str
+) -> list[Any]:
+    """Return the table columns backing ``schema`` plus the given parent keys."""
+
+    columns = model.__table__.c
+    names = (*schema.model_fields, *parent_keys)
+    return [columns[name] for name in names if name in columns]
+
+
+def _json_value(column: Any) -> Any:
+    """Return a SQL expression rendering ``column`` as the Python export does."""
+
+    if isinstance(column.type, Enum):
+        return case(
+            *(
+                (column == member, literal_column(f"'{member.value}'"))
+                for member in column.type.enum_class
+            )
+        )
+    if isinstance(column.type, DateTime):
+        return func.to_char(
+            func.timezone(literal_column("'UTC'"), column),
+            literal_column(f"'{JSON_TIMESTAMP_FORMAT}'"),
+        )
+    return column
+
+
+def _json_object(schema: type[BaseModel], model: type[Any], **nested: Any) -> Any:
+    """Return ``json_build_object`` over the fields of ``schema`` in declaration order.
+
+    Fields backed by a column of ``model`` are read from it; the others have to be
+    passed as ``nested`` expressions.
+    """
+
+    columns = model.__table__.c
+    arguments: list[Any] = []
+    for name in schema.model_fields:
+        arguments.append(literal_column(f"'{name}'"))
+        arguments.append(nested[name] if name in nested else _json_value(columns[name]))
+    return func.json_build_object(*arguments)
+
+
+def _json_array(document: Any, *order_by: Any) -> Any:
+    """Return ``json_agg`` of ``document`` in the given order, ``[]`` when empty."""
+
+    return func.coalesce(
+        func.json_agg(aggregate_order_by(document, *order_by)),
+        literal_column("'[]'::json"),
+    )
+
+
+NDJSON_SPOT_COLUMNS = _exported_columns(ExportedSpot, Spot)
+NDJSON_SPOT_IMAGE_COLUMNS = _exported_columns(ExportedSpotImage, SpotImage, "spot_id")
+NDJSON_GOSHUIN_RECORD_COLUMNS = _exported_columns(ExportedGoshuinRecord, GoshuinRecord)
+NDJSON_GOSHUIN_IMAGE_COLUMNS = _exported_columns(
+    ExportedGoshuinImage, GoshuinImage, "goshuin_record_id"
+)
+
+
 class ReactPdfImage(BaseModel):
     """Lightweight structure understood by react-pdf generators."""
 
@@ -140,226 +252,586 @@ class ExportBundle(BaseModel):
     pdf_document: list[ReactPdfSpotSection] = Field(default_factory=list)
 
 
-@dataclass(slots=True)
-class ImportResult:
-    """Summary of imported objects."""
+class ReactPdfDocumentPage(BaseModel):
+    """Paginated React-PDF document, one section per spot."""
+
+    items: list[ReactPdfSpotSection]
+    total: int
+    page: int
+    size: int
+
+
+class SpotImageEntry(ExportedSpotImage):
+    """Standalone spot image entry of a streamed import."""
+
+    spot_id: UUID
 
-    spots: int
-    goshuin_records: int
-    spot_images: int
-    goshuin_images: int
 
-    def as_dict(self) -> dict[str, int]:
-        """Return a JSON serialisable dictionary representation."""
+class GoshuinImageEntry(ExportedGoshuinImage):
+    """Standalone goshuin image entry of a streamed import."""
 
-        return {
-            "spots": self.spots,
-            "goshuin_records": self.goshuin_records,
-            "spot_images": self.spot_images,
-            "goshuin_images": self.goshuin_images,
-        }
+    goshuin_record_id: UUID
 
 
 class ExportService:
     """Service responsible for exporting and importing user data."""
 
-    def __init__(self) -> None:
-        self._json_dumps = lambda payload: json.dumps(
-            payload, ensure_ascii=False
-        ).encode("utf-8")
+    def __init__(self, dumps: JSONDumps | None = None) -> None:
+        self._json_dumps = dumps or json_dumps
 
     async def build_export_bundle(
-        self, session: AsyncSession, user: User
+        self, session: AsyncSession, user: User, *, include_pdf: bool = False
     ) -> ExportBundle:
-        """Return a fully populated export bundle for a user."""
+        """Return a fully populated export bundle for a user.
+
+        The React-PDF layout repeats every record and image URL, so it is only
+        built when ``include_pdf`` is set. :meth:`build_pdf_document_page` serves
+        it on its own, one page of spot sections at a time.
+        """
 
         result = await session.execute(
+            self._export_spots_query(user).order_by(Spot.name.asc())
+        )
+        exported_spots = [self._export_spot(spot) for spot in result.scalars().unique()]
+
+        return ExportBundle(
+            generated_at=datetime.utcnow(),
+            user=ExportUserMetadata(id=user.id, email=user.email),
+            spots=exported_spots,
+            pdf_document=(
+                self._build_react_pdf_sections(exported_spots) if include_pdf else []
+            ),
+        )
+
+    async def build_pdf_document_page(
+        self, session: AsyncSession, user: User, params: Params
+    ) -> ReactPdfDocumentPage:
+        """Return one page of React-PDF sections, one section per spot."""
+
+        def transform(spots: list[Spot]) -> list[ReactPdfSpotSection]:
+            return self._build_react_pdf_sections([self._export_spot(spot) for spot in spots])
+
+        page = await apaginate(
+            session,
+            self._export_spots_query(user).order_by(Spot.name.asc(), Spot.id.asc()),
+            params,
+            transformer=transform,
+        )
+        return ReactPdfDocumentPage(
+            items=page.items, total=page.total, page=page.page, size=page.size
+        )
+
+    def _export_spots_query(self, user: User) -> Select[Any]:
+        """Return the query loading a user's spots with their images and records."""
+
+        return (
             select(Spot)
             .where(Spot.user_id == user.id)
             .options(
                 selectinload(Spot.images),
                 selectinload(Spot.goshuin_records).selectinload(GoshuinRecord.images),
             )
-            .order_by(Spot.name.asc())
         )
-        spots = result.scalars().unique().all()
 
-        exported_spots: list[ExportedSpot] = []
-        for spot in spots:
-            sorted_spot_images = sorted(
-                spot.images, key=lambda image: (image.display_order, image.created_at)
-            )
-            sorted_records = sorted(
-                spot.goshuin_records,
-                key=lambda record: (record.visit_date, record.created_at),
-            )
+    def _export_spot(self, spot: Spot) -> ExportedSpot:
+        """Return the exported representation of a loaded spot."""
 
-            exported_records: list[ExportedGoshuinRecord] = []
-            for record in sorted_records:
-                sorted_record_images = sorted(
-                    record.images,
-                    key=lambda image: (image.display_order, image.created_at),
-                )
-                exported_record = ExportedGoshuinRecord.model_validate(
-                    record,
-                    update={
-                        "images": [
-                            ExportedGoshuinImage.model_validate(image)
-                            for image in sorted_record_images
-                        ]
-                    },
-                )
-                exported_records.append(exported_record)
+        sorted_spot_images = sorted(
+            spot.images, key=lambda image: (image.display_order, image.created_at)
+        )
+        sorted_records = sorted(
+            spot.goshuin_records,
+            key=lambda record: (record.visit_date, record.created_at),
+        )
 
-            exported_spot = ExportedSpot.model_validate(
-                spot,
+        exported_records: list[ExportedGoshuinRecord] = []
+        for record in sorted_records:
+            sorted_record_images = sorted(
+                record.images,
+                key=lambda image: (image.display_order, image.created_at),
+            )
+            exported_record = ExportedGoshuinRecord.model_validate(record).model_copy(
                 update={
                     "images": [
-                        ExportedSpotImage.model_validate(image)
-                        for image in sorted_spot_images
-                    ],
-                    "goshuin_records": exported_records,
+                        ExportedGoshuinImage.model_validate(image)
+                        for image in sorted_record_images
+                    ]
                 },
             )
-            exported_spots.append(exported_spot)
+            exported_records.append(exported_record)
+
+        return ExportedSpot.model_validate(spot).model_copy(
+            update={
+                "images": [
+                    ExportedSpotImage.model_validate(image) for image in sorted_spot_images
+                ],
+                "goshuin_records": exported_records,
+            },
+        )
+
+    async def stream_json_export(
+        self, session: AsyncSession, user: User, *, include_pdf: bool = False
+    ) -> AsyncGenerator[bytes, None]:
+        """Yield the exported data as JSON bytes.
 
-        pdf_document = self._build_react_pdf_sections(exported_spots)
+        ``pdf_document`` is left out of the payload unless ``include_pdf`` is set.
+        """
 
-        return ExportBundle(
-            generated_at=datetime.utcnow(),
-            user=ExportUserMetadata(id=user.id, email=user.email),
-            spots=exported_spots,
-            pdf_document=pdf_document,
+        bundle = await self.build_export_bundle(session, user, include_pdf=include_pdf)
+        payload = bundle.model_dump(
+            mode="python", exclude=None if include_pdf else {"pdf_document"}
         )
+        yield self._json_dumps(payload)
 
-    async def stream_json_export(
+    async def stream_database_json_export(
         self, session: AsyncSession, user: User
     ) -> AsyncGenerator[bytes, None]:
-        """Yield the exported data as JSON bytes."""
+        """Yield the JSON export with each spot document rendered by PostgreSQL.
+
+        Produces the same document as :meth:`stream_json_export` without
+        ``pdf_document``. Every spot, with its images and goshuin records nested
+        and ordered, is built with ``json_build_object``/``json_agg`` and returned
+        as text, so no ORM objects or pydantic models are created. Spots are
+        streamed with ``yield_per`` and spliced into the envelope as they arrive.
+        """
+
+        envelope = self._json_dumps(
+            {
+                "version": NDJSON_VERSION,
+                "generated_at": datetime.utcnow(),
+                "user": {"id": user.id, "email": user.email},
+            }
+        )
+        buffer = bytearray(envelope[:-1])
+        buffer += b',"spots":['
 
-        bundle = await self.build_export_bundle(session, user)
-        payload = bundle.model_dump(mode="json")
-        yield self._json_dumps(payload)
+        result = await session.stream(
+            self._database_json_export_query(user).execution_options(
+                yield_per=EXPORT_YIELD_PER
+            )
+        )
+        separator = b""
+        async for documents in result.scalars().partitions():
+            for document in documents:
+                buffer += separator
+                buffer += document.encode("utf-8")
+                separator = b","
+            if len(buffer) >= EXPORT_FLUSH_THRESHOLD:
+                yield bytes(buffer)
+                buffer.clear()
+
+        buffer += b"]}"
+        yield bytes(buffer)
+
+    def _database_json_export_query(self, user: User) -> Select[Any]:
+        """Return the query rendering one JSON document per exported spot."""
+
+        record_images = (
+            select(
+                _json_array(
+                    _json_object(ExportedGoshuinImage, GoshuinImage),
+                    GoshuinImage.display_order,
+                    GoshuinImage.created_at,
+                )
+            )
+            .where(GoshuinImage.goshuin_record_id == GoshuinRecord.id)
+            .scalar_subquery()
+        )
+        records = (
+            select(
+                _json_array(
+                    _json_object(ExportedGoshuinRecord, GoshuinRecord, images=record_images),
+                    GoshuinRecord.visit_date,
+                    GoshuinRecord.created_at,
+                )
+            )
+            .where(GoshuinRecord.spot_id == Spot.id, GoshuinRecord.user_id == user.id)
+            .scalar_subquery()
+        )
+        spot_images = (
+            select(
+                _json_array(
+                    _json_object(ExportedSpotImage, SpotImage),
+                    SpotImage.display_order,
+                    SpotImage.created_at,
+                )
+            )
+            .where(SpotImage.spot_id == Spot.id)
+            .scalar_subquery()
+        )
+        document = _json_object(
+            ExportedSpot, Spot, images=spot_images, goshuin_records=records
+        )
+        return (
+            select(cast(document, Text))
+            .where(Spot.user_id == user.id)
+            .order_by(Spot.name.asc(), Spot.id.asc())
+        )
 
     async def stream_csv_export(
         self, session: AsyncSession, user: User
     ) -> AsyncGenerator[bytes, None]:
-        """Yield the exported data in CSV format suitable for spreadsheets."""
-
-        bundle = await self.build_export_bundle(session, user)
-        fieldnames = [
-            "spot_id",
-            "spot_name",
-            "spot_slug",
-            "spot_type",
-            "prefecture",
-            "city",
-            "visit_date",
-            "acquisition_method",
-            "status",
-            "rating",
-            "notes",
-        ]
+        """Yield the exported data in CSV format suitable for spreadsheets.
+
+        Rows are read straight from a flat ``spots LEFT JOIN goshuin_records``
+        Core query streamed with ``yield_per`` and written into a buffer that is
+        flushed once it reaches :data:`EXPORT_FLUSH_THRESHOLD` bytes, so neither ORM
+        objects nor pydantic models are built for the CSV path.
+        """
 
         buffer = io.StringIO()
-        writer = csv.DictWriter(buffer, fieldnames=fieldnames)
-        writer.writeheader()
-        yield buffer.getvalue().encode("utf-8")
-        buffer.seek(0)
-        buffer.truncate(0)
-
-        for spot in bundle.spots:
-            if spot.goshuin_records:
-                for record in spot.goshuin_records:
-                    writer.writerow(
-                        {
-                            "spot_id": str(spot.id),
-                            "spot_name": spot.name,
-                            "spot_slug": spot.slug,
-                            "spot_type": getattr(spot.spot_type, "value", spot.spot_type),
-                            "prefecture": spot.prefecture,
-                            "city": spot.city or "",
-                            "visit_date": record.visit_date,
-                            "acquisition_method": getattr(
-                                record.acquisition_method,
-                                "value",
-                                record.acquisition_method,
-                            ),
-                            "status": getattr(record.status, "value", record.status),
-                            "rating": record.rating if record.rating is not None else "",
-                            "notes": record.notes or "",
-                        }
+        writer = csv.writer(buffer)
+        writer.writerow(CSV_FIELDNAMES)
+
+        result = await session.stream(
+            self._csv_export_query(user).execution_options(yield_per=EXPORT_YIELD_PER)
+        )
+        async for rows in result.partitions():
+            for (
+                spot_id,
+                name,
+                slug,
+                spot_type,
+                prefecture,
+                city,
+                visit_date,
+                method,
+                record_status,
+                rating,
+                notes,
+            ) in rows:
+                writer.writerow(
+                    (
+                        spot_id,
+                        name,
+                        slug,
+                        spot_type.value,
+                        prefecture,
+                        city,
+                        visit_date,
+                        method.value if method is not None else None,
+                        record_status.value if record_status is not None else None,
+                        rating,
+                        notes,
                     )
+                )
+                if buffer.tell() >= EXPORT_FLUSH_THRESHOLD:
                     yield buffer.getvalue().encode("utf-8")
                     buffer.seek(0)
                     buffer.truncate(0)
-            else:
-                writer.writerow(
-                    {
-                        "spot_id": str(spot.id),
-                        "spot_name": spot.name,
-                        "spot_slug": spot.slug,
-                        "spot_type": getattr(spot.spot_type, "value", spot.spot_type),
-                        "prefecture": spot.prefecture,
-                        "city": spot.city or "",
-                        "visit_date": "",
-                        "acquisition_method": "",
-                        "status": "",
-                        "rating": "",
-                        "notes": "",
-                    }
+
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+
+    def _csv_export_query(self, user: User) -> Select[Any]:
+        """Return the flat Core query backing :meth:`stream_csv_export`."""
+
+        return (
+            select(
+                Spot.id,
+                Spot.name,
+                Spot.slug,
+                Spot.spot_type,
+                Spot.prefecture,
+                Spot.city,
+                GoshuinRecord.visit_date,
+                GoshuinRecord.acquisition_method,
+                GoshuinRecord.status,
+                GoshuinRecord.rating,
+                GoshuinRecord.notes,
+            )
+            .outerjoin(
+                GoshuinRecord,
+                and_(
+                    GoshuinRecord.spot_id == Spot.id,
+                    GoshuinRecord.user_id == user.id,
+                ),
+            )
+            .where(Spot.user_id == user.id)
+            .order_by(
+                Spot.name.asc(),
+                Spot.id.asc(),
+                GoshuinRecord.visit_date.asc(),
+                GoshuinRecord.created_at.asc(),
+            )
+        )
+
+    async def stream_ndjson_export(
+        self, session: AsyncSession, user: User
+    ) -> AsyncGenerator[bytes, None]:
+        """Yield the exported data as newline delimited JSON.
+
+        Every line is ``{"type": ..., "data": ...}``. The first line is a ``meta``
+        entry describing the export, followed by ``spot``, ``spot_image``,
+        ``goshuin_record`` and ``goshuin_image`` entries. Parents always precede their
+        children. Spots are streamed in batches and the children of each batch are
+        loaded with one query per table, so memory stays bounded by the batch size.
+        """
+
+        buffer = bytearray()
+        buffer += self._ndjson_line(
+            "meta",
+            {
+                "version": NDJSON_VERSION,
+                "generated_at": datetime.utcnow(),
+                "user": {"id": user.id, "email": user.email},
+            },
+        )
+
+        spots_result = await session.stream(
+            select(*NDJSON_SPOT_COLUMNS)
+            .where(Spot.user_id == user.id)
+            .order_by(Spot.name.asc(), Spot.id.asc())
+            .execution_options(yield_per=EXPORT_YIELD_PER)
+        )
+        async for spot_rows in spots_result.mappings().partitions():
+            spot_ids = [spot["id"] for spot in spot_rows]
+            spot_images = await self._fetch_children(
+                session,
+                select(*NDJSON_SPOT_IMAGE_COLUMNS)
+                .where(SpotImage.spot_id.in_(spot_ids))
+                .order_by(SpotImage.display_order.asc(), SpotImage.created_at.asc()),
+                "spot_id",
+            )
+            records = await self._fetch_children(
+                session,
+                select(*NDJSON_GOSHUIN_RECORD_COLUMNS)
+                .where(
+                    GoshuinRecord.spot_id.in_(spot_ids),
+                    GoshuinRecord.user_id == user.id,
+                )
+                .order_by(GoshuinRecord.visit_date.asc(), GoshuinRecord.created_at.asc()),
+                "spot_id",
+            )
+            record_ids = [record["id"] for group in records.values() for record in group]
+            record_images: dict[UUID, list[RowMapping]] = {}
+            # A batch of spots can hold any number of records, so keep the IN lists
+            # within the driver's bind parameter limit.
+            for start in range(0, len(record_ids), EXPORT_YIELD_PER):
+                record_images.update(
+                    await self._fetch_children(
+                        session,
+                        select(*NDJSON_GOSHUIN_IMAGE_COLUMNS)
+                        .where(
+                            GoshuinImage.goshuin_record_id.in_(
+                                record_ids[start : start + EXPORT_YIELD_PER]
+                            )
+                        )
+                        .order_by(
+                            GoshuinImage.display_order.asc(),
+                            GoshuinImage.created_at.asc(),
+                        ),
+                        "goshuin_record_id",
+                    )
+                )
+
+            for spot in spot_rows:
+                buffer += self._ndjson_line("spot", spot)
+                for image in spot_images.get(spot["id"], ()):
+                    buffer += self._ndjson_line("spot_image", image)
+                for record in records.get(spot["id"], ()):
+                    buffer += self._ndjson_line("goshuin_record", record)
+                    for image in record_images.get(record["id"], ()):
+                        buffer += self._ndjson_line("goshuin_image", image)
+
+                if len(buffer) >= EXPORT_FLUSH_THRESHOLD:
+                    yield bytes(buffer)
+                    buffer.clear()
+
+        if buffer:
+            yield bytes(buffer)
+
+    async def _fetch_children(
+        self, session: AsyncSession, query: Select[Any], parent_key: str
+    ) -> dict[UUID, list[RowMapping]]:
+        """Execute ``query`` and group the resulting rows by ``parent_key``."""
+
+        grouped: dict[UUID, list[RowMapping]] = defaultdict(list)
+        for row in (await session.execute(query)).mappings():
+            grouped[row[parent_key]].append(row)
+        return grouped
+
+    def _ndjson_line(self, entity_type: str, data: Mapping[str, Any]) -> bytes:
+        """Return a single NDJSON line for an exported entity."""
+
+        return self._json_dumps({"type": entity_type, "data": dict(data)}) + b"\n"
+
+    async def stream_parquet_export(
+        self, session: AsyncSession, user: User, table: ParquetTable
+    ) -> AsyncGenerator[bytes, None]:
+        """Yield one exported table as a Parquet file.
+
+        Columns are typed: enums are dictionary encoded, dates and timestamps use
+        the native Parquet types. Rows are read in batches of
+        :data:`PARQUET_ROW_GROUP_SIZE` and every batch is written and yielded as a
+        row group, so the file is never held in memory.
+        """
+
+        columns, query = self._parquet_export_query(user, table)
+        writer = ParquetStreamWriter(columns)
+        result = await session.stream(
+            query.execution_options(yield_per=PARQUET_ROW_GROUP_SIZE)
+        )
+        async for rows in result.partitions():
+            data = writer.write_rows(rows)
+            if data:
+                yield data
+        yield writer.close()
+
+    def _parquet_export_query(
+        self, user: User, table: ParquetTable
+    ) -> tuple[list[Any], Select[Any]]:
+        """Return the columns and Core query backing a Parquet table export."""
+
+        if table is ParquetTable.SPOT_IMAGES:
+            columns = NDJSON_SPOT_IMAGE_COLUMNS
+            query = (
+                select(*columns)
+                .join(Spot, SpotImage.spot_id == Spot.id)
+                .where(Spot.user_id == user.id)
+                .order_by(SpotImage.spot_id.asc(), SpotImage.display_order.asc())
+            )
+        elif table is ParquetTable.GOSHUIN_RECORDS:
+            columns = NDJSON_GOSHUIN_RECORD_COLUMNS
+            query = (
+                select(*columns)
+                .where(GoshuinRecord.user_id == user.id)
+                .order_by(GoshuinRecord.visit_date.asc(), GoshuinRecord.id.asc())
+            )
+        elif table is ParquetTable.GOSHUIN_IMAGES:
+            columns = NDJSON_GOSHUIN_IMAGE_COLUMNS
+            query = (
+                select(*columns)
+                .join(GoshuinRecord, GoshuinImage.goshuin_record_id == GoshuinRecord.id)
+                .where(GoshuinRecord.user_id == user.id)
+                .order_by(
+                    GoshuinImage.goshuin_record_id.asc(), GoshuinImage.display_order.asc()
                 )
-                yield buffer.getvalue().encode("utf-8")
-                buffer.seek(0)
-                buffer.truncate(0)
+            )
+        else:
+            columns = NDJSON_SPOT_COLUMNS
+            query = (
+                select(*columns)
+                .where(Spot.user_id == user.id)
+                .order_by(Spot.name.asc(), Spot.id.asc())
+            )
+        return columns, query
 
     async def import_from_bundle(
         self, session: AsyncSession, user: User, bundle: ExportBundle
     ) -> ImportResult:
         """Persist the provided export bundle for the authenticated user."""
 
-        spots_created = 0
-        goshuin_created = 0
-        spot_images_created = 0
-        goshuin_images_created = 0
-
+        writer = ImportWriter(session, user)
         for exported_spot in bundle.spots:
-            spot_payload = exported_spot.model_dump(
-                mode="python", exclude={"images", "goshuin_records", "user_id"}
-            )
-            spot_payload["user_id"] = user.id
-            spot = Spot(**spot_payload)
-            session.merge(spot)
-            spots_created += 1
-
-            for image in exported_spot.images:
-                image_payload = image.model_dump(mode="python")
-                image_payload["spot_id"] = exported_spot.id
-                session.merge(SpotImage(**image_payload))
-                spot_images_created += 1
-
-            for record in exported_spot.goshuin_records:
-                record_payload = record.model_dump(mode="python", exclude={"images", "user_id"})
-                record_payload["user_id"] = user.id
-                record_payload["spot_id"] = exported_spot.id
-                goshuin = GoshuinRecord(**record_payload)
-                session.merge(goshuin)
-                goshuin_created += 1
-
-                for image in record.images:
-                    image_payload = image.model_dump(mode="python")
-                    image_payload["goshuin_record_id"] = record.id
-                    session.merge(GoshuinImage(**image_payload))
-                    goshuin_images_created += 1
+            self._stage_spot(writer, exported_spot)
 
+        result = await writer.flush()
         await session.commit()
+        return result
+
+    async def import_entries(
+        self,
+        session: AsyncSession,
+        user: User,
+        entries: AsyncIterator[ImportEntry],
+        *,
+        batch_size: int = IMPORT_BATCH_SIZE,
+    ) -> AsyncGenerator[ImportResult, None]:
+        """Validate and import streamed entries, yielding progress after each batch.
+
+        ``entries`` are ``(type, data)`` pairs as produced by
+        :func:`iter_ndjson_entries` or :func:`iter_json_bundle_entries`. Each entry
+        is validated on its own and staged into an :class:`ImportWriter` that is
+        flushed every ``batch_size`` rows, so memory is bounded by the batch size
+        rather than the payload size. The first entry must be the ``meta`` entry
+        naming the owner, and children must follow their parents, as they do in
+        exports. The whole import is committed once at the end and rolled back if
+        any entry is invalid.
+        """
+
+        writer = ImportWriter(session, user, batch_size=batch_size)
+        index = 0
+        try:
+            async for entity_type, data in entries:
+                index += 1
+                if index == 1 and entity_type != "meta":
+                    raise ImportFormatError("The first entry must be the export metadata")
+                try:
+                    self._stage_entry(writer, user, entity_type, data)
+                except ValidationError as exc:
+                    raise ImportFormatError(
+                        f"Entry {index} ({entity_type}) is invalid: "
+                        f"{exc.errors()[0]['msg']}"
+                    ) from exc
+                if writer.staged >= batch_size:
+                    yield replace(await writer.flush())
+            if index == 0:
+                raise ImportFormatError("The import payload is empty")
+
+            result = await writer.flush()
+            await session.commit()
+        except BaseException:
+            await session.rollback()
+            raise
+        yield result
+
+    def _stage_entry(
+        self, writer: ImportWriter, user: User, entity_type: str, data: dict[str, Any]
+    ) -> None:
+        """Validate a single streamed entry and stage it on ``writer``."""
+
+        if entity_type == "meta":
+            try:
+                owner_id = UUID(str(data["user"]["id"]))
+            except (KeyError, TypeError, ValueError) as exc:
+                raise ImportFormatError("Export metadata is missing the owner id") from exc
+            if owner_id != user.id:
+                raise ImportFormatError(
+                    "Export bundle does not belong to the authenticated user"
+                )
+        elif entity_type == "spot":
+            self._stage_spot(writer, ExportedSpot.model_validate(data))
+        elif entity_type == "spot_image":
+            image = SpotImageEntry.model_validate(data)
+            writer.add_spot_image(
+                image.model_dump(mode="python", exclude={"spot_id"}), image.spot_id
+            )
+        elif entity_type == "goshuin_record":
+            self._stage_record(writer, ExportedGoshuinRecord.model_validate(data))
+        elif entity_type == "goshuin_image":
+            image = GoshuinImageEntry.model_validate(data)
+            writer.add_goshuin_image(
+                image.model_dump(mode="python", exclude={"goshuin_record_id"}),
+                image.goshuin_record_id,
+            )
+        else:
+            raise ImportFormatError(f"Unknown entry type '{entity_type}'")
 
-        return ImportResult(
-            spots=spots_created,
-            goshuin_records=goshuin_created,
-            spot_images=spot_images_created,
-            goshuin_images=goshuin_images_created,
+    def _stage_spot(self, writer: ImportWriter, exported_spot: ExportedSpot) -> None:
+        writer.add_spot(
+            exported_spot.model_dump(
+                mode="python", exclude={"images", "goshuin_records", "user_id"}
+            )
+        )
+        for image in exported_spot.images:
+            writer.add_spot_image(image.model_dump(mode="python"), exported_spot.id)
+        for record in exported_spot.goshuin_records:
+            self._stage_record(writer, record, spot_id=exported_spot.id)
+
+    def _stage_record(
+        self,
+        writer: ImportWriter,
+        record: ExportedGoshuinRecord,
+        *,
+        spot_id: UUID | None = None,
+    ) -> None:
+        writer.add_goshuin_record(
+            record.model_dump(mode="python", exclude={"images", "user_id"}),
+            spot_id or record.spot_id,
         )
+        for image in record.images:
+            writer.add_goshuin_image(image.model_dump(mode="python"), record.id)
 
     def _build_react_pdf_sections(
         self, spots: list[ExportedSpot]
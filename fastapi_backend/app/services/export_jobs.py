@@ -0,0 +1,179 @@
+"""Background export jobs that persist reusable export artifacts."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import (
+    ExportJob,
+    ExportJobFormat,
+    ExportJobStatus,
+    GoshuinImage,
+    GoshuinRecord,
+    Spot,
+    SpotImage,
+    User,
+)
+
+from .export import ExportService
+from .storage import StorageService
+
+logger = logging.getLogger(__name__)
+
+EXPORT_JOB_CONTENT_TYPES = {
+    ExportJobFormat.JSON: "application/json",
+    ExportJobFormat.CSV: "text/csv",
+}
+
+
+class ExportJobService:
+    """Create, run and look up export jobs.
+
+    A job renders one export format for one user and stores the result through
+    the configured storage backend. Jobs are keyed by a watermark of the user's
+    data, so asking for the same export again while nothing changed returns the
+    existing job and its artifact instead of rebuilding it.
+    """
+
+    def __init__(self, export_service: ExportService | None = None) -> None:
+        self._export_service = export_service or ExportService()
+
+    async def compute_watermark(self, session: AsyncSession, user: User) -> str:
+        """Return a fingerprint that changes whenever the user's exported data does.
+
+        The newest ``updated_at``/``created_at`` catches inserts and updates and the
+        row counts catch deletes, which leave no timestamp behind.
+        """
+
+        spot_ids = select(Spot.id).where(Spot.user_id == user.id)
+        record_ids = select(GoshuinRecord.id).where(GoshuinRecord.user_id == user.id)
+        row = (
+            await session.execute(
+                select(
+                    select(func.max(Spot.updated_at))
+                    .where(Spot.user_id == user.id)
+                    .scalar_subquery(),
+                    select(func.count()).where(Spot.user_id == user.id).scalar_subquery(),
+                    select(func.max(GoshuinRecord.updated_at))
+                    .where(GoshuinRecord.user_id == user.id)
+                    .scalar_subquery(),
+                    select(func.count())
+                    .where(GoshuinRecord.user_id == user.id)
+                    .scalar_subquery(),
+                    select(func.max(SpotImage.created_at))
+                    .where(SpotImage.spot_id.in_(spot_ids))
+                    .scalar_subquery(),
+                    select(func.count())
+                    .where(SpotImage.spot_id.in_(spot_ids))
+                    .scalar_subquery(),
+                    select(func.max(GoshuinImage.created_at))
+                    .where(GoshuinImage.goshuin_record_id.in_(record_ids))
+                    .scalar_subquery(),
+                    select(func.count())
+                    .where(GoshuinImage.goshuin_record_id.in_(record_ids))
+                    .scalar_subquery(),
+                )
+            )
+        ).one()
+        return "|".join(
+            value.isoformat() if isinstance(value, datetime) else str(value or 0)
+            for value in row
+        )
+
+    async def request_export(
+        self, session: AsyncSession, user: User, export_format: ExportJobFormat
+    ) -> tuple[ExportJob, bool]:
+        """Return a job for the user's current data and whether it must be run.
+
+        A pending, running or completed job with the current watermark is reused;
+        otherwise a new pending job is created.
+        """
+
+        watermark = await self.compute_watermark(session, user)
+        existing = (
+            await session.execute(
+                select(ExportJob)
+                .where(
+                    ExportJob.user_id == user.id,
+                    ExportJob.format == export_format,
+                    ExportJob.watermark == watermark,
+                    ExportJob.status != ExportJobStatus.FAILED,
+                )
+                .order_by(ExportJob.created_at.desc())
+                .limit(1)
+            )
+        ).scalar_one_or_none()
+        if existing is not None:
+            return existing, False
+
+        job = ExportJob(
+            user_id=user.id,
+            format=export_format,
+            status=ExportJobStatus.PENDING,
+            watermark=watermark,
+        )
+        session.add(job)
+        await session.commit()
+        await session.refresh(job)
+        return job, True
+
+    async def get_job(self, session: AsyncSession, user: User, job_id: UUID) -> ExportJob | None:
+        """Return the user's job with ``job_id`` or ``None``."""
+
+        return (
+            await session.execute(
+                select(ExportJob).where(ExportJob.id == job_id, ExportJob.user_id == user.id)
+            )
+        ).scalar_one_or_none()
+
+    async def run_job(
+        self, session: AsyncSession, storage: StorageService, job_id: UUID
+    ) -> None:
+        """Render the export for ``job_id`` and upload it as the job artifact."""
+
+        job = await session.get(ExportJob, job_id)
+        if job is None or job.status != ExportJobStatus.PENDING:
+            return
+        job.status = ExportJobStatus.RUNNING
+        await session.commit()
+
+        try:
+            user = await session.get(User, job.user_id)
+            if user is None:
+                raise LookupError(f"User {job.user_id} no longer exists")
+            export_format = ExportJobFormat(job.format)
+            if export_format is ExportJobFormat.JSON:
+                chunks = self._export_service.stream_json_export(session, user)
+            else:
+                chunks = self._export_service.stream_csv_export(session, user)
+            data = b"".join([chunk async for chunk in chunks])
+
+            key = f"exports/{job.user_id}/{job.id}.{export_format.value}"
+            await storage.upload_bytes(
+                data, key=key, content_type=EXPORT_JOB_CONTENT_TYPES[export_format]
+            )
+        except Exception as exc:
+            logger.exception("Export job %s failed", job_id)
+            await session.rollback()
+            job = await session.get(ExportJob, job_id)
+            if job is None:
+                return
+            job.status = ExportJobStatus.FAILED
+            job.error = str(exc)[:500]
+        else:
+            job.status = ExportJobStatus.COMPLETED
+            job.storage_key = key
+            job.size_bytes = len(data)
+        job.completed_at = datetime.now(timezone.utc)
+        await session.commit()
+
+
+def get_export_job_service() -> ExportJobService:
+    """FastAPI dependency returning an :class:`ExportJobService` instance."""
+
+    return ExportJobService()
@@ -0,0 +1,100 @@
+"""Filters and facet counts of the goshuin record list."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Select, func, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import GoshuinAcquisitionMethod, GoshuinRecord, GoshuinStatus, Spot
+from app.models.spots import SpotType
+from app.schemas import FacetCount, GoshuinFacets
+
+GOSHUIN_FACETS = {
+    "status": GoshuinRecord.status,
+    "acquisition_method": GoshuinRecord.acquisition_method,
+    "rating": GoshuinRecord.rating,
+    "prefecture": Spot.prefecture,
+    "spot_type": Spot.spot_type,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class GoshuinFilters:
+    """Filters of the goshuin record list; several values of one filter are ORed."""
+
+    spot_id: UUID | None = None
+    statuses: tuple[GoshuinStatus, ...] = ()
+    acquisition_methods: tuple[GoshuinAcquisitionMethod, ...] = ()
+    min_rating: int | None = None
+    max_rating: int | None = None
+    visited_from: date | None = None
+    visited_to: date | None = None
+    prefectures: tuple[str, ...] = ()
+    spot_types: tuple[SpotType, ...] = ()
+
+    def apply(self, query: Select[Any]) -> Select[Any]:
+        """Return ``query``, which must join ``Spot``, narrowed by the filters."""
+
+        if self.spot_id is not None:
+            query = query.where(GoshuinRecord.spot_id == self.spot_id)
+        if self.statuses:
+            query = query.where(GoshuinRecord.status.in_(self.statuses))
+        if self.acquisition_methods:
+            query = query.where(GoshuinRecord.acquisition_method.in_(self.acquisition_methods))
+        if self.min_rating is not None:
+            query = query.where(GoshuinRecord.rating >= self.min_rating)
+        if self.max_rating is not None:
+            query = query.where(GoshuinRecord.rating <= self.max_rating)
+        if self.visited_from is not None:
+            query = query.where(GoshuinRecord.visit_date >= self.visited_from)
+        if self.visited_to is not None:
+            query = query.where(GoshuinRecord.visit_date <= self.visited_to)
+        if self.prefectures:
+            query = query.where(Spot.prefecture.in_(self.prefectures))
+        if self.spot_types:
+            query = query.where(Spot.spot_type.in_(self.spot_types))
+        return query
+
+
+def _facet_value(value: Any) -> str | int | None:
+    return value.value if isinstance(value, Enum) else value
+
+
+async def goshuin_facets(session: AsyncSession, query: Select[Any]) -> GoshuinFacets:
+    """Count the records of ``query`` by each facet in a single grouped query.
+
+    ``query`` is the filtered record list, joined to ``Spot``. ``GROUPING SETS``
+    aggregates its rows once per facet column in one pass, and ``GROUPING()``
+    tells which facet a result row counts, since a facet value may itself be
+    null. Counts follow every filter, including the one on the facet's own
+    dimension.
+    """
+
+    facet_columns = GOSHUIN_FACETS.items()
+    rows = await session.execute(
+        query.with_only_columns(
+            *(column.label(name) for name, column in facet_columns),
+            *(func.grouping(column).label(f"grouping_{name}") for name, column in facet_columns),
+            func.count().label("count"),
+        )
+        .order_by(None)
+        .group_by(func.grouping_sets(*(tuple_(column) for _, column in facet_columns)))
+    )
+
+    facets: dict[str, list[FacetCount]] = {name: [] for name in GOSHUIN_FACETS}
+    for row in rows:
+        values = row._mapping
+        for name in GOSHUIN_FACETS:
+            if values[f"grouping_{name}"] == 0:
+                facets[name].append(
+                    FacetCount(value=_facet_value(values[name]), count=values["count"])
+                )
+    for counts in facets.values():
+        counts.sort(key=lambda facet: (-facet.count, str(facet.value)))
+    return GoshuinFacets(**facets)
@@ -0,0 +1,156 @@
+"""Bounding box and radius lookups of spots for the map view.
+
+Spots are located through the GiST index ``ix_spots_location`` on the
+expression ``point(longitude, latitude)``, which ships with PostgreSQL itself
+and needs no extension. Conditions below always go through a ``<@ box`` test
+on that exact expression so the index serves them; radius searches first
+narrow to the box around the circle, then keep the spots whose great circle
+distance is within the radius.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import and_, func, or_
+
+from app.models import Spot
+
+EARTH_RADIUS_M = 6_371_008.8
+METERS_PER_DEGREE_LATITUDE = math.pi * EARTH_RADIUS_M / 180
+
+
+@dataclass(slots=True, frozen=True)
+class BoundingBox:
+    """Area between two longitudes and two latitudes, in degrees.
+
+    ``west`` is greater than ``east`` for a box crossing the antimeridian.
+    """
+
+    west: float
+    south: float
+    east: float
+    north: float
+
+    @property
+    def center(self) -> tuple[float, float]:
+        """Return the ``(latitude, longitude)`` in the middle of the box."""
+
+        east = self.east if self.east >= self.west else self.east + 360
+        longitude = (self.west + east) / 2
+        if longitude > 180:
+            longitude -= 360
+        return (self.south + self.north) / 2, longitude
+
+    def contains(self, latitude: float, longitude: float) -> bool:
+        """Return whether the point lies inside the box, edges included."""
+
+        if not self.south <= latitude <= self.north:
+            return False
+        if self.west <= self.east:
+            return self.west <= longitude <= self.east
+        return longitude >= self.west or longitude <= self.east
+
+
+def parse_bbox(value: str) -> BoundingBox:
+    """Parse ``"west,south,east,north"`` in degrees, raising ``ValueError`` if invalid."""
+
+    parts = [float(part) for part in value.split(",")]
+    if len(parts) != 4:
+        raise ValueError("bbox must be west,south,east,north")
+    west, south, east, north = parts
+    if not (-180 <= west <= 180 and -180 <= east <= 180):
+        raise ValueError("bbox longitudes must be between -180 and 180")
+    if not (-90 <= south <= north <= 90):
+        raise ValueError("bbox latitudes must be between -90 and 90, south first")
+    return BoundingBox(west=west, south=south, east=east, north=north)
+
+
+def parse_point(value: str) -> tuple[float, float]:
+    """Parse ``"latitude,longitude"`` in degrees, raising ``ValueError`` if invalid."""
+
+    parts = [float(part) for part in value.split(",")]
+    if len(parts) != 2:
+        raise ValueError("near must be latitude,longitude")
+    latitude, longitude = parts
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        raise ValueError("near is outside the valid coordinate range")
+    return latitude, longitude
+
+
+def radius_bbox(latitude: float, longitude: float, radius_m: float) -> BoundingBox:
+    """Return the smallest box containing the circle of ``radius_m`` around the point."""
+
+    delta_latitude = radius_m / METERS_PER_DEGREE_LATITUDE
+    south = max(latitude - delta_latitude, -90.0)
+    north = min(latitude + delta_latitude, 90.0)
+    # The circle's widest parallel is the one closest to a pole
+    widest = max(abs(south), abs(north))
+    if widest >= 90.0:
+        return BoundingBox(west=-180.0, south=south, east=180.0, north=north)
+    delta_longitude = delta_latitude / math.cos(math.radians(widest))
+    if delta_longitude >= 180.0:
+        return BoundingBox(west=-180.0, south=south, east=180.0, north=north)
+
+    west = longitude - delta_longitude
+    east = longitude + delta_longitude
+    if west < -180.0:
+        west += 360.0
+    if east > 180.0:
+        east -= 360.0
+    return BoundingBox(west=west, south=south, east=east, north=north)
+
+
+def haversine_m(
+    latitude: float, longitude: float, other_latitude: float, other_longitude: float
+) -> float:
+    """Return the great circle distance in meters between two points."""
+
+    half_latitude = math.radians(other_latitude - latitude) / 2
+    half_longitude = math.radians(other_longitude - longitude) / 2
+    a = math.sin(half_latitude) ** 2 + math.cos(math.radians(latitude)) * math.cos(
+        math.radians(other_latitude)
+    ) * math.sin(half_longitude) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(math.sqrt(a), 1.0))
+
+
+def _location() -> Any:
+    # Must match the expression of ix_spots_location exactly
+    return func.point(Spot.longitude, Spot.latitude)
+
+
+def _box(west: float, south: float, east: float, north: float) -> Any:
+    return func.box(func.point(west, south), func.point(east, north))
+
+
+def within_bbox(bbox: BoundingBox) -> Any:
+    """Return the condition matching spots located inside ``bbox``."""
+
+    if bbox.west <= bbox.east:
+        return _location().op("<@")(_box(bbox.west, bbox.south, bbox.east, bbox.north))
+    return or_(
+        _location().op("<@")(_box(bbox.west, bbox.south, 180.0, bbox.north)),
+        _location().op("<@")(_box(-180.0, bbox.south, bbox.east, bbox.north)),
+    )
+
+
+def distance_m(latitude: float, longitude: float) -> Any:
+    """Return the haversine distance in meters from the point to a spot."""
+
+    half_latitude = func.radians(Spot.latitude - latitude) / 2
+    half_longitude = func.radians(Spot.longitude - longitude) / 2
+    a = func.power(func.sin(half_latitude), 2) + math.cos(math.radians(latitude)) * func.cos(
+        func.radians(Spot.latitude)
+    ) * func.power(func.sin(half_longitude), 2)
+    return 2 * EARTH_RADIUS_M * func.asin(func.least(func.sqrt(a), 1.0))
+
+
+def within_radius(latitude: float, longitude: float, radius_m: float) -> Any:
+    """Return the condition matching spots at most ``radius_m`` from the point."""
+
+    return and_(
+        within_bbox(radius_bbox(latitude, longitude, radius_m)),
+        distance_m(latitude, longitude) <= radius_m,
+    )
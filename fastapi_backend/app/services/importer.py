@@ -0,0 +1,330 @@
+"""Set-based writer and streaming readers used to import exported archives."""
+
+from __future__ import annotations
+
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Iterable
+from uuid import UUID
+
+import ijson
+from ijson.common import ObjectBuilder
+from sqlalchemy import ColumnElement, Table, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import GoshuinImage, GoshuinRecord, Spot, SpotImage, User
+from app.serialization import json_loads
+
+IMPORT_BATCH_SIZE = 1000
+# asyncpg rejects statements with more bind parameters than this
+MAX_BIND_PARAMETERS = 32767
+DECOMPRESS_CHUNK_SIZE = 64 * 1024
+MAX_NDJSON_LINE_BYTES = 16 * 1024 * 1024
+
+ImportEntry = tuple[str, dict[str, Any]]
+
+
+class ImportFormatError(ValueError):
+    """Raised when an import stream cannot be decoded or validated."""
+
+
+@dataclass(slots=True)
+class ImportResult:
+    """Summary of imported objects."""
+
+    spots: int = 0
+    goshuin_records: int = 0
+    spot_images: int = 0
+    goshuin_images: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return a JSON serialisable dictionary representation."""
+
+        return {
+            "spots": self.spots,
+            "goshuin_records": self.goshuin_records,
+            "spot_images": self.spot_images,
+            "goshuin_images": self.goshuin_images,
+        }
+
+
+@dataclass(slots=True)
+class ImportWriter:
+    """Stage exported rows and persist them with batched upserts.
+
+    Rows are staged per entity type and written by :meth:`flush` with
+    ``INSERT ... ON CONFLICT (id) DO UPDATE`` statements of up to
+    :data:`IMPORT_BATCH_SIZE` rows, parents before children. Rows staged more than
+    once with the same ``id`` are written once, keeping the last copy. Rows that
+    would overwrite another user's data, or whose parent is not owned by the
+    importing user, are skipped and not counted.
+    """
+
+    session: AsyncSession
+    user: User
+    batch_size: int = IMPORT_BATCH_SIZE
+    result: ImportResult = field(default_factory=ImportResult)
+    spots: list[dict[str, Any]] = field(default_factory=list)
+    spot_images: list[dict[str, Any]] = field(default_factory=list)
+    goshuin_records: list[dict[str, Any]] = field(default_factory=list)
+    goshuin_images: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def staged(self) -> int:
+        """Return the number of rows waiting to be flushed."""
+
+        return (
+            len(self.spots)
+            + len(self.spot_images)
+            + len(self.goshuin_records)
+            + len(self.goshuin_images)
+        )
+
+    def add_spot(self, row: dict[str, Any]) -> None:
+        self.spots.append({**row, "user_id": self.user.id})
+
+    def add_spot_image(self, row: dict[str, Any], spot_id: UUID) -> None:
+        self.spot_images.append({**row, "spot_id": spot_id})
+
+    def add_goshuin_record(self, row: dict[str, Any], spot_id: UUID) -> None:
+        self.goshuin_records.append({**row, "user_id": self.user.id, "spot_id": spot_id})
+
+    def add_goshuin_image(self, row: dict[str, Any], goshuin_record_id: UUID) -> None:
+        self.goshuin_images.append({**row, "goshuin_record_id": goshuin_record_id})
+
+    async def flush(self) -> ImportResult:
+        """Write all staged rows and return the running totals."""
+
+        user_id = self.user.id
+        owned_spot_ids = select(Spot.id).where(Spot.user_id == user_id)
+
+        self.result.spots += await self._upsert(
+            Spot.__table__, self.spots, where=Spot.user_id == user_id
+        )
+
+        spot_images = await self._owned_children(
+            self.spot_images, "spot_id", Spot.id, Spot.user_id
+        )
+        self.result.spot_images += await self._upsert(
+            SpotImage.__table__, spot_images, where=SpotImage.spot_id.in_(owned_spot_ids)
+        )
+
+        records = await self._owned_children(
+            self.goshuin_records, "spot_id", Spot.id, Spot.user_id
+        )
+        self.result.goshuin_records += await self._upsert(
+            GoshuinRecord.__table__, records, where=GoshuinRecord.user_id == user_id
+        )
+
+        goshuin_images = await self._owned_children(
+            self.goshuin_images,
+            "goshuin_record_id",
+            GoshuinRecord.id,
+            GoshuinRecord.user_id,
+        )
+        self.result.goshuin_images += await self._upsert(
+            GoshuinImage.__table__,
+            goshuin_images,
+            where=GoshuinImage.goshuin_record_id.in_(
+                select(GoshuinRecord.id).where(GoshuinRecord.user_id == user_id)
+            ),
+        )
+
+        self.spots.clear()
+        self.spot_images.clear()
+        self.goshuin_records.clear()
+        self.goshuin_images.clear()
+        return self.result
+
+    async def _owned_children(
+        self,
+        rows: list[dict[str, Any]],
+        parent_key: str,
+        parent_id: Any,
+        parent_user_id: Any,
+    ) -> list[dict[str, Any]]:
+        """Return the staged rows whose parent belongs to the importing user."""
+
+        parent_ids = list({row[parent_key] for row in rows})
+        owned: set[UUID] = set()
+        for start in range(0, len(parent_ids), self.batch_size):
+            owned.update(
+                (
+                    await self.session.execute(
+                        select(parent_id).where(
+                            parent_id.in_(parent_ids[start : start + self.batch_size]),
+                            parent_user_id == self.user.id,
+                        )
+                    )
+                ).scalars()
+            )
+        return [row for row in rows if row[parent_key] in owned]
+
+    async def _upsert(
+        self,
+        table: Table,
+        rows: Iterable[dict[str, Any]],
+        *,
+        where: ColumnElement[bool],
+    ) -> int:
+        """Upsert ``rows`` into ``table`` in batches and return the rows written."""
+
+        # ON CONFLICT cannot touch the same row twice in one statement
+        rows = list({row["id"]: row for row in rows}.values())
+        if not rows:
+            return 0
+        # updated_at records when the server copy changed so sync clients see imports
+        if "updated_at" in table.c:
+            rows = [{k: v for k, v in row.items() if k != "updated_at"} for row in rows]
+        columns = list(rows[0])
+        batch_size = min(self.batch_size, MAX_BIND_PARAMETERS // len(columns))
+        written = 0
+        for start in range(0, len(rows), batch_size):
+            statement = pg_insert(table).values(rows[start : start + batch_size])
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.id],
+                set_={
+                    **{name: statement.excluded[name] for name in columns if name != "id"},
+                    **({"updated_at": func.now()} if "updated_at" in table.c else {}),
+                },
+                where=where,
+            ).returning(table.c.id)
+            written += len((await self.session.execute(statement)).all())
+        return written
+
+
+async def decompress_stream(
+    chunks: AsyncIterator[bytes], content_encoding: str | None = None
+) -> AsyncIterator[bytes]:
+    """Yield the decoded body, transparently inflating gzip payloads.
+
+    Gzip is detected from ``Content-Encoding`` or the gzip magic number.
+    Output is produced in bounded slices so a highly compressed payload never
+    expands into memory all at once.
+    """
+
+    decompressor: Any = None
+    first = True
+    async for chunk in chunks:
+        if not chunk:
+            continue
+        if first:
+            first = False
+            encoding = (content_encoding or "").lower()
+            if encoding == "gzip" or chunk[:2] == b"\x1f\x8b":
+                decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+            elif encoding not in {"", "identity"}:
+                raise ImportFormatError(f"Unsupported content encoding '{content_encoding}'")
+        if decompressor is None:
+            yield chunk
+            continue
+        data = chunk
+        while data:
+            try:
+                output = decompressor.decompress(data, DECOMPRESS_CHUNK_SIZE)
+            except zlib.error as exc:
+                raise ImportFormatError("Invalid gzip payload") from exc
+            if output:
+                yield output
+            data = decompressor.unconsumed_tail
+
+    if decompressor is not None:
+        tail = decompressor.flush()
+        if tail:
+            yield tail
+        if not decompressor.eof:
+            raise ImportFormatError("Truncated gzip payload")
+
+
+async def iter_ndjson_entries(chunks: AsyncIterator[bytes]) -> AsyncIterator[ImportEntry]:
+    """Yield ``(type, data)`` pairs from an NDJSON export stream."""
+
+    pending = b""
+    line_number = 0
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        if len(pending) > MAX_NDJSON_LINE_BYTES:
+            raise ImportFormatError(f"Line {line_number + len(lines) + 1} is too long")
+        for line in lines:
+            line_number += 1
+            entry = _parse_ndjson_line(line, line_number)
+            if entry is not None:
+                yield entry
+    entry = _parse_ndjson_line(pending, line_number + 1)
+    if entry is not None:
+        yield entry
+
+
+def _parse_ndjson_line(line: bytes, line_number: int) -> ImportEntry | None:
+    if not line.strip():
+        return None
+    try:
+        payload = json_loads(line)
+    except ValueError as exc:
+        raise ImportFormatError(f"Line {line_number} is not valid JSON") from exc
+    if (
+        not isinstance(payload, dict)
+        or not isinstance(payload.get("type"), str)
+        or not isinstance(payload.get("data"), dict)
+    ):
+        raise ImportFormatError(f"Line {line_number} must be an object with 'type' and 'data'")
+    return payload["type"], payload["data"]
+
+
+class _AsyncChunkReader:
+    """Expose an async iterator of byte chunks through an ``async read()`` API."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = chunks
+        self._buffer = b""
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            return b""
+        async for chunk in self._chunks:
+            self._buffer += chunk
+            if size < 0 or len(self._buffer) >= size:
+                break
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+async def iter_json_bundle_entries(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[ImportEntry]:
+    """Yield ``(type, data)`` pairs from a JSON export bundle, one spot at a time.
+
+    The owner is reported as a ``meta`` entry and each element of ``spots`` is
+    yielded as soon as it has been parsed, so only a single spot (with its
+    images and records) is held in memory. ``user.id`` must precede ``spots``, as
+    it does in exports.
+    """
+
+    builder: Any = None
+    has_owner = False
+    try:
+        async for prefix, event, value in ijson.parse_async(
+            _AsyncChunkReader(chunks), use_float=True
+        ):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == "spots.item" and event == "end_map":
+                    yield "spot", builder.value
+                    builder = None
+            elif prefix == "user.id" and event == "string":
+                has_owner = True
+                yield "meta", {"user": {"id": value}}
+            elif prefix == "spots.item" and event == "start_map":
+                if not has_owner:
+                    raise ImportFormatError("Export bundle must declare 'user.id' before 'spots'")
+                builder = ObjectBuilder()
+                builder.event(event, value)
+    except ijson.JSONError as exc:
+        raise ImportFormatError("Payload is not a valid JSON export bundle") from exc
+    if not has_owner:
+        raise ImportFormatError("Export bundle is missing 'user.id'")
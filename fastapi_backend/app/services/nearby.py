@@ -0,0 +1,182 @@
+"""Suggest a user's spots near where a photo was taken."""
+
+from __future__ import annotations
+
+import heapq
+import math
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Spot
+from app.schemas import NearbySpot
+
+from .geo import BoundingBox, haversine_m, radius_bbox
+from .storage import ImageMetadata
+
+PHOTO_SPOT_RADIUS_M = 300.0
+PHOTO_SPOT_SUGGESTIONS = 5
+# About 1.1 km north to south, so a photo radius touches at most four cells
+SPOT_LOCATION_CELL_DEGREES = 0.01
+SPOT_LOCATION_CACHE_TTL = 600.0
+SPOT_LOCATION_CACHE_USERS = 256
+
+
+@dataclass(slots=True, frozen=True)
+class _LocatedSpot:
+    id: UUID
+    name: str
+    slug: str
+    latitude: float
+    longitude: float
+
+
+class SpotLocationGrid:
+    """One user's located spots bucketed into a fixed latitude/longitude grid.
+
+    A lookup only measures the spots of the few cells overlapping the box
+    around the search circle, so it stays in the microseconds however many
+    spots the user has elsewhere.
+    """
+
+    def __init__(
+        self, spots: Iterable[_LocatedSpot], *, cell_degrees: float = SPOT_LOCATION_CELL_DEGREES
+    ) -> None:
+        self._cell_degrees = cell_degrees
+        self._cells: defaultdict[tuple[int, int], list[_LocatedSpot]] = defaultdict(list)
+        for spot in spots:
+            self._cells[self._cell(spot.latitude, spot.longitude)].append(spot)
+
+    def __len__(self) -> int:
+        return sum(len(spots) for spots in self._cells.values())
+
+    def _cell(self, latitude: float, longitude: float) -> tuple[int, int]:
+        return (
+            math.floor(longitude / self._cell_degrees),
+            math.floor(latitude / self._cell_degrees),
+        )
+
+    def _columns(self, bbox: BoundingBox) -> Iterator[int]:
+        if bbox.west <= bbox.east:
+            ranges = [(bbox.west, bbox.east)]
+        else:
+            ranges = [(bbox.west, 180.0), (-180.0, bbox.east)]
+        for west, east in ranges:
+            yield from range(
+                math.floor(west / self._cell_degrees), math.floor(east / self._cell_degrees) + 1
+            )
+
+    def nearest(
+        self, latitude: float, longitude: float, radius_m: float, limit: int
+    ) -> list[tuple[float, _LocatedSpot]]:
+        """Return up to ``limit`` ``(distance, spot)`` pairs within ``radius_m``, nearest first."""
+
+        bbox = radius_bbox(latitude, longitude, radius_m)
+        rows = range(
+            math.floor(bbox.south / self._cell_degrees),
+            math.floor(bbox.north / self._cell_degrees) + 1,
+        )
+        found = []
+        for column in self._columns(bbox):
+            for row in rows:
+                for spot in self._cells.get((column, row), ()):
+                    distance = haversine_m(latitude, longitude, spot.latitude, spot.longitude)
+                    if distance <= radius_m:
+                        found.append((distance, spot))
+        return heapq.nsmallest(limit, found, key=lambda pair: pair[0])
+
+
+@dataclass(slots=True)
+class _CachedGrid:
+    expires_at: float
+    grid: SpotLocationGrid
+
+
+class SpotLocationService:
+    """Find a user's spots near a point from a cached :class:`SpotLocationGrid`.
+
+    The grid of a user is built from one query on first use and kept for
+    ``ttl`` seconds; spot writes and imports invalidate it. The cache is per
+    process, so other workers may answer from a grid up to ``ttl`` old.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = SPOT_LOCATION_CACHE_TTL,
+        users: int = SPOT_LOCATION_CACHE_USERS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl
+        self._users = users
+        self._clock = clock
+        self._grids: OrderedDict[UUID, _CachedGrid] = OrderedDict()
+
+    async def grid(self, session: AsyncSession, user_id: UUID) -> SpotLocationGrid:
+        """Return the location grid of ``user_id``, building it on a miss."""
+
+        cached = self._grids.get(user_id)
+        if cached is not None and cached.expires_at > self._clock():
+            self._grids.move_to_end(user_id)
+            return cached.grid
+
+        rows = await session.execute(
+            select(Spot.id, Spot.name, Spot.slug, Spot.latitude, Spot.longitude).where(
+                Spot.user_id == user_id,
+                Spot.latitude.is_not(None),
+                Spot.longitude.is_not(None),
+            )
+        )
+        grid = SpotLocationGrid(_LocatedSpot(*row) for row in rows)
+        self._grids[user_id] = _CachedGrid(expires_at=self._clock() + self._ttl, grid=grid)
+        self._grids.move_to_end(user_id)
+        while len(self._grids) > self._users:
+            self._grids.popitem(last=False)
+        return grid
+
+    async def nearby(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+        latitude: float,
+        longitude: float,
+        *,
+        radius_m: float = PHOTO_SPOT_RADIUS_M,
+        limit: int = PHOTO_SPOT_SUGGESTIONS,
+    ) -> list[NearbySpot]:
+        """Return the user's spots within ``radius_m`` of the point, nearest first."""
+
+        grid = await self.grid(session, user_id)
+        return [
+            NearbySpot(id=spot.id, name=spot.name, slug=spot.slug, distance_m=distance)
+            for distance, spot in grid.nearest(latitude, longitude, radius_m, limit)
+        ]
+
+    async def for_photo(
+        self, session: AsyncSession, user_id: UUID, metadata: ImageMetadata | None
+    ) -> list[NearbySpot]:
+        """Return the spots near where the photo of ``metadata`` was taken, if it says."""
+
+        gps = metadata.gps if metadata else None
+        if gps is None or gps.latitude is None or gps.longitude is None:
+            return []
+        return await self.nearby(session, user_id, gps.latitude, gps.longitude)
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Drop the grid of ``user_id`` after the user's spots changed."""
+
+        self._grids.pop(user_id, None)
+
+
+_spot_location_service = SpotLocationService()
+
+
+def get_spot_location_service() -> SpotLocationService:
+    """FastAPI dependency returning the process wide :class:`SpotLocationService`."""
+
+    return _spot_location_service
@@ -0,0 +1,141 @@
+"""Helpers writing exported tables as Apache Parquet with :mod:`pyarrow`."""
+
+from __future__ import annotations
+
+import enum
+import io
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Boolean, Date, DateTime, Enum, Float, Integer
+from sqlalchemy.dialects.postgresql import UUID
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except Exception:  # pragma: no cover - pyarrow is optional
+    pa = None  # type: ignore[assignment]
+    pq = None  # type: ignore[assignment]
+
+PARQUET_AVAILABLE = pa is not None
+PARQUET_MEDIA_TYPE = "application/vnd.apache.parquet"
+PARQUET_COMPRESSION = "zstd"
+# Each batch read from the database becomes one row group
+PARQUET_ROW_GROUP_SIZE = 10_000
+
+
+class ParquetTable(str, enum.Enum):
+    SPOTS = "spots"
+    SPOT_IMAGES = "spot_images"
+    GOSHUIN_RECORDS = "goshuin_records"
+    GOSHUIN_IMAGES = "goshuin_images"
+
+
+def _arrow_type(column: Any) -> Any:
+    """Return the Arrow type storing values of a table ``column``."""
+
+    column_type = column.type
+    if isinstance(column_type, Enum):
+        # Few distinct values per column, so store them once per row group
+        return pa.dictionary(pa.int8(), pa.string())
+    if isinstance(column_type, DateTime):
+        return pa.timestamp("us", tz="UTC")
+    if isinstance(column_type, Date):
+        return pa.date32()
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    if isinstance(column_type, Integer):
+        return pa.int32()
+    if isinstance(column_type, Float):
+        return pa.float64()
+    return pa.string()
+
+
+def _arrow_value(column: Any) -> Any:
+    """Return a converter for values of ``column`` that Arrow cannot take as is."""
+
+    if isinstance(column.type, Enum):
+        return lambda value: value.value if value is not None else None
+    if isinstance(column.type, UUID):
+        return lambda value: str(value) if value is not None else None
+    return None
+
+
+class ParquetStreamWriter:
+    """Write row groups to a Parquet file and hand back the bytes produced so far.
+
+    The file is never held in memory as a whole: after each row group the encoded
+    bytes are drained with :meth:`write_rows` and can be streamed to the client.
+    """
+
+    def __init__(self, columns: Sequence[Any]) -> None:
+        if pa is None:  # pragma: no cover - exercised when pyarrow is missing
+            raise RuntimeError("Parquet export requires the 'pyarrow' package to be installed.")
+
+        self._columns = list(columns)
+        self._converters = [_arrow_value(column) for column in self._columns]
+        self._schema = pa.schema(
+            [
+                pa.field(column.name, _arrow_type(column), nullable=column.nullable)
+                for column in self._columns
+            ]
+        )
+        self._sink = _DrainableSink()
+        self._writer = pq.ParquetWriter(
+            pa.PythonFile(self._sink, mode="w"),
+            self._schema,
+            compression=PARQUET_COMPRESSION,
+        )
+
+    def write_rows(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        """Encode ``rows`` as one row group and return the bytes written."""
+
+        arrays = []
+        for index, (field, converter) in enumerate(
+            zip(self._schema, self._converters, strict=True)
+        ):
+            values = [row[index] for row in rows]
+            if converter is not None:
+                values = [converter(value) for value in values]
+            arrays.append(pa.array(values, type=field.type))
+        self._writer.write_table(
+            pa.Table.from_arrays(arrays, schema=self._schema),
+            row_group_size=max(len(rows), 1),
+        )
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        """Write the Parquet footer and return the remaining bytes."""
+
+        self._writer.close()
+        return self._sink.drain()
+
+
+class _DrainableSink(io.RawIOBase):
+    """Write-only file whose buffered bytes can be taken out while writing.
+
+    ``tell`` keeps counting drained bytes since the Parquet footer stores
+    absolute offsets.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._buffer = bytearray()
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        size = len(data)
+        self._buffer += data
+        self._position += size
+        return size
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
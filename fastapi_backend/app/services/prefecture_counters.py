@@ -0,0 +1,58 @@
+"""Recomputation of the per-user prefecture counters."""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from sqlalchemy import and_, delete, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import GoshuinRecord, PrefectureCounter, Spot
+
+
+async def rebuild_prefecture_counters(session: AsyncSession, user_id: UUID | None = None) -> int:
+    """Recompute the counters of ``user_id``, or of every user, from the source tables.
+
+    The counters are kept up to date by triggers; this repairs any drift,
+    such as rows written while the triggers were disabled. Spots and goshuin
+    records are locked against writes until the caller commits, so no change
+    lands between deleting the old counters and counting afresh. Returns the
+    number of counter rows written.
+    """
+
+    await session.execute(text("LOCK TABLE spots, goshuin_records IN SHARE MODE"))
+
+    records = select(
+        GoshuinRecord.spot_id,
+        GoshuinRecord.user_id,
+        func.count().label("goshuin_count"),
+    ).group_by(GoshuinRecord.spot_id, GoshuinRecord.user_id)
+    spots = select(Spot)
+    stale = delete(PrefectureCounter)
+    if user_id is not None:
+        records = records.where(GoshuinRecord.user_id == user_id)
+        spots = spots.where(Spot.user_id == user_id)
+        stale = stale.where(PrefectureCounter.user_id == user_id)
+
+    records_by_spot = records.subquery("records")
+    counts = (
+        spots.with_only_columns(
+            Spot.user_id,
+            Spot.prefecture,
+            func.count().label("spot_count"),
+            func.coalesce(func.sum(records_by_spot.c.goshuin_count), 0).label("goshuin_count"),
+        )
+        .outerjoin(
+            records_by_spot,
+            and_(records_by_spot.c.spot_id == Spot.id, records_by_spot.c.user_id == Spot.user_id),
+        )
+        .group_by(Spot.user_id, Spot.prefecture)
+    )
+
+    await session.execute(stale)
+    result = await session.execute(
+        insert(PrefectureCounter).from_select(
+            ["user_id", "prefecture", "spot_count", "goshuin_count"], counts
+        )
+    )
+    return result.rowcount
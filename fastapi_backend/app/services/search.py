@@ -0,0 +1,95 @@
+"""Keyword search over a user's spots."""
+
+from __future__ import annotations
+
+import html
+import re
+from typing import Any
+
+from sqlalchemy import and_, case, func, literal, or_
+
+from app.models import Spot
+
+SPOT_SEARCH_CONFIG = "simple"
+SNIPPET_RADIUS = 40
+SNIPPET_START = "<mark>"
+SNIPPET_STOP = "</mark>"
+
+
+def like_escape(term: str) -> str:
+    """Return ``term`` with the ``LIKE`` wildcards and escape character escaped."""
+
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_terms(keyword: str) -> list[str]:
+    """Return the whitespace separated terms of ``keyword``."""
+
+    return keyword.split()
+
+
+def spot_search_condition(keyword: str) -> Any:
+    """Return the condition matching spots for ``keyword``.
+
+    A spot matches when every term occurs in its name, address or description,
+    which the trigram index on ``search_text`` answers for Japanese as well as
+    for other scripts, or when the web search style query matches its words.
+    """
+
+    terms = search_terms(keyword)
+    return or_(
+        Spot.search_vector.op("@@")(
+            func.websearch_to_tsquery(SPOT_SEARCH_CONFIG, keyword)
+        ),
+        and_(*(Spot.search_text.ilike(f"%{like_escape(term)}%") for term in terms)),
+    )
+
+
+def spot_search_rank(keyword: str) -> Any:
+    """Return the relevance of a spot for ``keyword``, higher is better.
+
+    Name matches outrank address and description matches, and a name starting
+    with the keyword ranks highest. The weighted ``ts_rank`` of the words breaks
+    ties between otherwise equal matches.
+    """
+
+    escaped = like_escape(keyword.strip())
+    return (
+        func.ts_rank(Spot.search_vector, func.websearch_to_tsquery(SPOT_SEARCH_CONFIG, keyword))
+        + case((Spot.name.ilike(f"{escaped}%"), literal(2.0)), else_=literal(0.0))
+        + case((Spot.name.ilike(f"%{escaped}%"), literal(1.0)), else_=literal(0.0))
+    )
+
+
+def build_snippet(keyword: str, *texts: str | None, radius: int = SNIPPET_RADIUS) -> str | None:
+    """Return an HTML excerpt of the first of ``texts`` containing a term of ``keyword``.
+
+    Up to ``radius`` characters are kept on each side of the first match and every
+    occurrence of a term is wrapped in ``<mark>``; everything else is escaped.
+    """
+
+    terms = sorted(set(search_terms(keyword)), key=len, reverse=True)
+    if not terms:
+        return None
+    pattern = re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+
+    for text in texts:
+        if not text:
+            continue
+        first = pattern.search(text)
+        if first is None:
+            continue
+
+        start = max(first.start() - radius, 0)
+        end = min(first.end() + radius, len(text))
+        window = text[start:end]
+        parts = ["…" if start else ""]
+        position = 0
+        for match in pattern.finditer(window):
+            parts.append(html.escape(window[position : match.start()]))
+            parts.append(f"{SNIPPET_START}{html.escape(match.group(0))}{SNIPPET_STOP}")
+            position = match.end()
+        parts.append(html.escape(window[position:]))
+        parts.append("…" if end < len(text) else "")
+        return "".join(parts)
+    return None
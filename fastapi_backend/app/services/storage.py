@@ -8,6 +8,7 @@ import mimetypes
 from dataclasses import dataclass
 from datetime import datetime
 from fractions import Fraction
+from numbers import Rational
 from typing import Protocol
 
 import httpx
@@ -39,6 +40,10 @@ class StorageUploadError(StorageServiceError):
     """Raised when uploading an asset fails."""
 
 
+class StorageDownloadError(StorageServiceError):
+    """Raised when reading a stored asset fails."""
+
+
 class ImageValidationError(StorageServiceError):
     """Raised when the provided file is not a valid image."""
 
@@ -82,6 +87,8 @@ class StorageBackend(Protocol):
 
     def build_url(self, key: str) -> str: ...
 
+    def download(self, *, key: str, byte_range: tuple[int, int] | None = None) -> bytes: ...
+
     @property
     def supports_deferred_upload(self) -> bool: ...
 
@@ -131,6 +138,16 @@ class S3StorageBackend:
             raise StorageUploadError("Failed to upload object to S3") from exc
         return self.build_url(key)
 
+    def download(self, *, key: str, byte_range: tuple[int, int] | None = None) -> bytes:
+        params = {"Bucket": self._bucket, "Key": key}
+        if byte_range is not None:
+            params["Range"] = f"bytes={byte_range[0]}-{byte_range[1]}"
+        try:
+            response = self._client.get_object(**params)
+            return response["Body"].read()
+        except (BotoCoreError, ClientError) as exc:  # pragma: no cover - requires boto3
+            raise StorageDownloadError("Failed to download object from S3") from exc
+
     def build_url(self, key: str) -> str:
         if self._base_url:
             return f"{self._base_url}/{key}"
@@ -180,6 +197,17 @@ class VercelBlobStorageBackend:
             return url
         return self.build_url(key)
 
+    def download(self, *, key: str, byte_range: tuple[int, int] | None = None) -> bytes:
+        headers = {"Authorization": f"Bearer {self._token}"}
+        if byte_range is not None:
+            headers["Range"] = f"bytes={byte_range[0]}-{byte_range[1]}"
+        try:
+            response = httpx.get(self.build_url(key), headers=headers, timeout=self._timeout)
+            response.raise_for_status()
+        except httpx.HTTPError as exc:  # pragma: no cover - requires network
+            raise StorageDownloadError("Failed to download blob from Vercel") from exc
+        return response.content
+
     def build_url(self, key: str) -> str:
         if self._base_url:
             return f"{self._base_url}/{key}"
@@ -268,6 +296,20 @@ class StorageService:
             metadata=metadata,
         )
 
+    async def upload_bytes(self, data: bytes, *, key: str, content_type: str) -> str:
+        """Persist an arbitrary payload, such as an export artifact."""
+
+        return await run_in_threadpool(
+            self._backend.upload, key=key, data=data, content_type=content_type
+        )
+
+    async def download_bytes(
+        self, key: str, *, byte_range: tuple[int, int] | None = None
+    ) -> bytes:
+        """Read a stored payload, optionally limited to an inclusive byte range."""
+
+        return await run_in_threadpool(self._backend.download, key=key, byte_range=byte_range)
+
     def _build_thumbnail_bytes(self, image: Image.Image) -> bytes:
         thumbnail = image.copy()
         try:
@@ -331,6 +373,9 @@ class StorageService:
             elif tag == "FocalLength":
                 metadata.focal_length = self._to_float(value)
             elif tag == "GPSInfo":
+                # Pillow only gives the offset of the GPS IFD here, not its tags
+                if isinstance(value, int):
+                    value = exif_data.get_ifd(tag_id)
                 gps = self._parse_gps(value)
                 if gps:
                     metadata.gps = gps
@@ -362,6 +407,11 @@ class StorageService:
     def _to_fraction(self, value: object) -> Fraction | None:
         if isinstance(value, Fraction):
             return value
+        if isinstance(value, Rational):
+            # Pillow reads EXIF rationals as IFDRational
+            if value.denominator:
+                return Fraction(value.numerator, value.denominator)
+            return None
         if isinstance(value, tuple) and len(value) == 2:
             numerator, denominator = value
             if denominator:
@@ -0,0 +1,204 @@
+"""Spot name and slug suggestions for search-as-you-type."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import and_, func, not_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Spot, User
+from app.schemas import SpotSuggestion
+
+from .search import like_escape
+
+SUGGESTION_CACHE_TTL = 30.0
+SUGGESTION_CACHE_PREFIXES_PER_USER = 64
+SUGGESTION_CACHE_USERS = 1024
+
+
+def normalize_prefix(prefix: str) -> str:
+    """Return the lookup key of a typed prefix."""
+
+    return prefix.strip().lower()
+
+
+def _is_prefix_match(suggestion: SpotSuggestion, prefix: str) -> bool:
+    return suggestion.name.lower().startswith(prefix) or suggestion.slug.startswith(prefix)
+
+
+def _matches(suggestion: SpotSuggestion, prefix: str) -> bool:
+    """Mirror the SQL of :meth:`SpotSuggestionService.suggest` for cached results."""
+
+    return prefix in suggestion.name.lower() or suggestion.slug.startswith(prefix)
+
+
+@dataclass(slots=True)
+class _CachedSuggestions:
+    expires_at: float
+    suggestions: list[SpotSuggestion]
+    # Fewer matches than the limit were found, so this is every match
+    complete: bool
+
+
+class SpotSuggestionCache:
+    """Small per-user LRU cache of recently typed prefixes.
+
+    Besides exact hits, a prefix can be answered from a shorter cached prefix
+    whose result was complete: everything matching ``"明治神"`` also matches
+    ``"明治"``, so filtering the shorter result is enough. Entries expire after
+    ``ttl`` seconds and the spot routes invalidate a user's entries on every
+    write. The cache is per process, so other workers may serve results up to
+    ``ttl`` old.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = SUGGESTION_CACHE_TTL,
+        prefixes_per_user: int = SUGGESTION_CACHE_PREFIXES_PER_USER,
+        users: int = SUGGESTION_CACHE_USERS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl
+        self._prefixes_per_user = prefixes_per_user
+        self._users = users
+        self._clock = clock
+        self._entries: OrderedDict[UUID, OrderedDict[tuple[str, int], _CachedSuggestions]] = (
+            OrderedDict()
+        )
+
+    def get(self, user_id: UUID, prefix: str, limit: int) -> list[SpotSuggestion] | None:
+        """Return the cached suggestions for ``prefix`` or ``None`` on a miss."""
+
+        entries = self._entries.get(user_id)
+        if entries is None:
+            return None
+        self._entries.move_to_end(user_id)
+        now = self._clock()
+
+        cached = entries.get((prefix, limit))
+        if cached is not None and cached.expires_at > now:
+            entries.move_to_end((prefix, limit))
+            return cached.suggestions
+
+        base: _CachedSuggestions | None = None
+        base_length = 0
+        for (shorter, _), candidate in entries.items():
+            if (
+                candidate.complete
+                and candidate.expires_at > now
+                and base_length < len(shorter) < len(prefix)
+                and prefix.startswith(shorter)
+            ):
+                base, base_length = candidate, len(shorter)
+        if base is None:
+            return None
+
+        matches = [suggestion for suggestion in base.suggestions if _matches(suggestion, prefix)]
+        narrowed = [s for s in matches if _is_prefix_match(s, prefix)]
+        narrowed += [s for s in matches if not _is_prefix_match(s, prefix)]
+        self.set(user_id, prefix, limit, narrowed[:limit])
+        return narrowed[:limit]
+
+    def set(
+        self, user_id: UUID, prefix: str, limit: int, suggestions: list[SpotSuggestion]
+    ) -> None:
+        """Remember the suggestions found for ``prefix``."""
+
+        entries = self._entries.setdefault(user_id, OrderedDict())
+        self._entries.move_to_end(user_id)
+        entries[(prefix, limit)] = _CachedSuggestions(
+            expires_at=self._clock() + self._ttl,
+            suggestions=suggestions,
+            complete=len(suggestions) < limit,
+        )
+        entries.move_to_end((prefix, limit))
+        while len(entries) > self._prefixes_per_user:
+            entries.popitem(last=False)
+        while len(self._entries) > self._users:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Forget every suggestion cached for ``user_id``."""
+
+        self._entries.pop(user_id, None)
+
+
+class SpotSuggestionService:
+    """Look up spots whose name or slug matches what the user is typing."""
+
+    def __init__(self, cache: SpotSuggestionCache | None = None) -> None:
+        self.cache = cache or SpotSuggestionCache()
+
+    async def suggest(
+        self, session: AsyncSession, user: User, prefix: str, limit: int
+    ) -> list[SpotSuggestion]:
+        """Return up to ``limit`` suggestions, prefix matches first.
+
+        Names and slugs starting with ``prefix`` are read from the
+        ``ix_spots_user_id_lower_name`` and ``ix_spots_user_id_slug`` prefix
+        indexes. When they are fewer than ``limit``, names containing ``prefix``
+        fill the rest through the trigram index on ``search_text``.
+        """
+
+        prefix = normalize_prefix(prefix)
+        if not prefix:
+            return []
+        cached = self.cache.get(user.id, prefix, limit)
+        if cached is not None:
+            return cached
+
+        pattern = like_escape(prefix)
+        starts_with = or_(
+            func.lower(Spot.name).like(f"{pattern}%"), Spot.slug.like(f"{pattern}%")
+        )
+        columns = (Spot.id, Spot.name, Spot.slug)
+        rows = list(
+            (
+                await session.execute(
+                    select(*columns)
+                    .where(Spot.user_id == user.id, starts_with)
+                    .order_by(Spot.name.asc(), Spot.id.asc())
+                    .limit(limit)
+                )
+            ).all()
+        )
+        if len(rows) < limit:
+            rows += (
+                await session.execute(
+                    select(*columns)
+                    .where(
+                        Spot.user_id == user.id,
+                        and_(
+                            Spot.search_text.ilike(f"%{pattern}%"),
+                            Spot.name.ilike(f"%{pattern}%"),
+                        ),
+                        not_(starts_with),
+                    )
+                    .order_by(Spot.name.asc(), Spot.id.asc())
+                    .limit(limit - len(rows))
+                )
+            ).all()
+
+        suggestions = [SpotSuggestion.model_validate(row) for row in rows]
+        self.cache.set(user.id, prefix, limit, suggestions)
+        return suggestions
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Drop cached suggestions after the user's spots changed."""
+
+        self.cache.invalidate(user_id)
+
+
+_spot_suggestion_service = SpotSuggestionService()
+
+
+def get_spot_suggestion_service() -> SpotSuggestionService:
+    """FastAPI dependency returning the process wide :class:`SpotSuggestionService`."""
+
+    return _spot_suggestion_service
@@ -0,0 +1,68 @@
+"""Primary image and visit history of the spots on a list page."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from uuid import UUID
+
+from sqlalchemy import func, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import GoshuinRecord, Spot, SpotImage
+from app.schemas import SpotSummary
+
+
+async def load_spot_summaries(
+    session: AsyncSession, spot_ids: Sequence[UUID]
+) -> dict[UUID, SpotSummary]:
+    """Return the summary of every spot in ``spot_ids``, read in a single query.
+
+    Each spot is joined laterally to its primary image, or its first image by
+    display order when none is marked, and to the count and latest visit date
+    of its goshuin records. Both lateral subqueries are index lookups on the
+    spot id, so the query costs the same per spot however large the
+    collection is.
+    """
+
+    if not spot_ids:
+        return {}
+
+    primary_image = (
+        select(SpotImage.id, SpotImage.image_url, SpotImage.thumbnail_url)
+        .where(SpotImage.spot_id == Spot.id)
+        .order_by(SpotImage.is_primary.desc(), SpotImage.display_order.asc())
+        .limit(1)
+        .lateral("primary_image")
+    )
+    visits = (
+        select(
+            func.count().label("goshuin_count"),
+            func.max(GoshuinRecord.visit_date).label("last_visit_date"),
+        )
+        .where(GoshuinRecord.user_id == Spot.user_id, GoshuinRecord.spot_id == Spot.id)
+        .lateral("visits")
+    )
+    rows = await session.execute(
+        select(
+            Spot.id,
+            primary_image.c.id.label("primary_image_id"),
+            primary_image.c.image_url.label("primary_image_url"),
+            primary_image.c.thumbnail_url.label("primary_thumbnail_url"),
+            visits.c.goshuin_count,
+            visits.c.last_visit_date,
+        )
+        .select_from(Spot)
+        .outerjoin(primary_image, true())
+        .join(visits, true())
+        .where(Spot.id.in_(spot_ids))
+    )
+    return {
+        row.id: SpotSummary(
+            primary_image_id=row.primary_image_id,
+            primary_image_url=row.primary_image_url,
+            primary_thumbnail_url=row.primary_thumbnail_url,
+            goshuin_count=row.goshuin_count,
+            last_visit_date=row.last_visit_date,
+        )
+        for row in rows
+    }
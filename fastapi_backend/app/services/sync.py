@@ -0,0 +1,129 @@
+"""Change feed used by offline-first clients to stay in sync."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import GoshuinImage, GoshuinRecord, Spot, SpotImage, SyncTombstone, User
+from app.serialization import json_dumps, json_loads
+
+SYNC_TOKEN_VERSION = 1
+# ``updated_at`` is the start time of the writing transaction, so a transaction
+# that was still running when the previous sync read the data commits rows that
+# look older than that sync. Re-sending this window keeps them from being
+# skipped; clients upsert by id, so repeats are harmless.
+SYNC_OVERLAP = timedelta(seconds=30)
+
+
+class SyncTokenError(ValueError):
+    """Raised when a sync token cannot be decoded."""
+
+
+@dataclass(slots=True)
+class SyncChanges:
+    """Entities changed since a sync token, plus the token for the next sync."""
+
+    sync_token: str
+    spots: list[Spot] = field(default_factory=list)
+    spot_images: list[SpotImage] = field(default_factory=list)
+    goshuin_records: list[GoshuinRecord] = field(default_factory=list)
+    goshuin_images: list[GoshuinImage] = field(default_factory=list)
+    deleted: list[SyncTombstone] = field(default_factory=list)
+
+
+def encode_sync_token(watermark: datetime) -> str:
+    """Return the opaque token for ``watermark``."""
+
+    payload = json_dumps({"v": SYNC_TOKEN_VERSION, "t": watermark.isoformat()})
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_sync_token(token: str) -> datetime:
+    """Return the watermark stored in ``token``."""
+
+    try:
+        payload: Any = json_loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        version, watermark = payload["v"], datetime.fromisoformat(payload["t"])
+    except (binascii.Error, ValueError, TypeError, KeyError) as exc:
+        raise SyncTokenError("Sync token is invalid") from exc
+    if version != SYNC_TOKEN_VERSION or watermark.tzinfo is None:
+        raise SyncTokenError("Sync token is invalid")
+    return watermark
+
+
+class SyncService:
+    """Compute the entities a client has to apply to catch up."""
+
+    async def get_changes(
+        self, session: AsyncSession, user: User, since: str | None = None
+    ) -> SyncChanges:
+        """Return everything created, updated or deleted since ``since``.
+
+        Without a token every entity is returned, which is the initial sync.
+        Each query is a range scan on an ``updated_at``/``deleted_at`` index.
+        """
+
+        cutoff = decode_sync_token(since) - SYNC_OVERLAP if since else None
+        watermark = (await session.execute(select(func.now()))).scalar_one()
+        changes = SyncChanges(sync_token=encode_sync_token(watermark))
+
+        spots = select(Spot).where(Spot.user_id == user.id)
+        records = select(GoshuinRecord).where(GoshuinRecord.user_id == user.id)
+        spot_images = (
+            select(SpotImage)
+            .join(Spot, SpotImage.spot_id == Spot.id)
+            .where(Spot.user_id == user.id)
+        )
+        goshuin_images = (
+            select(GoshuinImage)
+            .join(GoshuinRecord, GoshuinImage.goshuin_record_id == GoshuinRecord.id)
+            .where(GoshuinRecord.user_id == user.id)
+        )
+        if cutoff is not None:
+            spots = spots.where(Spot.updated_at > cutoff)
+            records = records.where(GoshuinRecord.updated_at > cutoff)
+            spot_images = spot_images.where(SpotImage.updated_at > cutoff)
+            goshuin_images = goshuin_images.where(GoshuinImage.updated_at > cutoff)
+            changes.deleted = list(
+                (
+                    await session.execute(
+                        select(SyncTombstone)
+                        .where(
+                            SyncTombstone.user_id == user.id,
+                            SyncTombstone.deleted_at > cutoff,
+                        )
+                        .order_by(SyncTombstone.deleted_at.asc(), SyncTombstone.id.asc())
+                    )
+                ).scalars()
+            )
+
+        changes.spots = list(
+            (await session.execute(spots.order_by(Spot.updated_at.asc()))).scalars()
+        )
+        changes.spot_images = list(
+            (await session.execute(spot_images.order_by(SpotImage.updated_at.asc()))).scalars()
+        )
+        changes.goshuin_records = list(
+            (
+                await session.execute(records.order_by(GoshuinRecord.updated_at.asc()))
+            ).scalars()
+        )
+        changes.goshuin_images = list(
+            (
+                await session.execute(goshuin_images.order_by(GoshuinImage.updated_at.asc()))
+            ).scalars()
+        )
+        return changes
+
+
+def get_sync_service() -> SyncService:
+    """FastAPI dependency returning a :class:`SyncService` instance."""
+
+    return SyncService()
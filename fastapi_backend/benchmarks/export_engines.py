@@ -0,0 +1,118 @@
+"""Compare the Python and PostgreSQL engines of the JSON export.
+
+Run from the ``fastapi_backend`` directory against a disposable database::
+
+    python -m benchmarks.export_engines --records 1000 10000 100000
+
+The tables are created in ``TEST_DATABASE_URL`` (or ``--database-url``) and
+dropped again afterwards, exactly like the test suite does, so never point it
+at a database holding real data. For every size one user is seeded by
+:mod:`benchmarks.seed` with ``records / 10`` spots, one image per spot and one
+image per goshuin record. The ``python`` row is
+:meth:`ExportService.stream_json_export`, which loads ORM objects and validates
+the nested pydantic models; the ``database`` row is
+:meth:`ExportService.stream_database_json_export`, which streams the documents
+rendered by ``json_build_object``/``json_agg``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config import settings
+from app.models import Base, User
+from app.services import ExportService
+from benchmarks.seed import SeedProfile, seed_user
+
+RECORDS_PER_SPOT = 10
+
+
+async def _consume(chunks: AsyncIterator[bytes]) -> int:
+    size = 0
+    async for chunk in chunks:
+        size += len(chunk)
+    return size
+
+
+async def run(database_url: str, sizes: list[int], repeat: int) -> list[dict[str, Any]]:
+    """Return one result row per export size and engine."""
+
+    engine = create_async_engine(database_url)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    service = ExportService()
+    engines: list[tuple[str, Callable[[AsyncSession, User], AsyncIterator[bytes]]]] = [
+        ("python", service.stream_json_export),
+        ("database", service.stream_database_json_export),
+    ]
+    results: list[dict[str, Any]] = []
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        for records in sizes:
+            async with session_maker() as session:
+                user = await seed_user(
+                    session,
+                    SeedProfile(
+                        spots=max(records // RECORDS_PER_SPOT, 1),
+                        records_per_spot=RECORDS_PER_SPOT,
+                        seed=records,
+                    ),
+                )
+
+            baseline: float | None = None
+            for label, stream in engines:
+                timings = []
+                for _ in range(repeat):
+                    async with session_maker() as session:
+                        started = time.perf_counter()
+                        size = await _consume(stream(session, user))
+                        timings.append(time.perf_counter() - started)
+                seconds = min(timings)
+                baseline = baseline or seconds
+                results.append(
+                    {
+                        "records": records,
+                        "engine": label,
+                        "bytes": size,
+                        "seconds": seconds,
+                        "speedup": baseline / seconds,
+                    }
+                )
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--records",
+        type=int,
+        nargs="+",
+        default=[1000, 10_000, 100_000],
+        help="Goshuin records of each seeded user",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions")
+    parser.add_argument(
+        "--database-url", default=settings.TEST_DATABASE_URL, help="Disposable database"
+    )
+    args = parser.parse_args()
+
+    for row in asyncio.run(run(args.database_url, args.records, args.repeat)):
+        print(
+            f"{row['records']:>7} records {row['engine']:<9} {row['bytes']:>12} B "
+            f"{row['seconds'] * 1000:>10.1f} ms  x{row['speedup']:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
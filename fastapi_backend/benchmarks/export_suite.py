@@ -0,0 +1,266 @@
+"""Measure the export and import paths of ``ExportService`` on large collections.
+
+Run from the ``fastapi_backend`` directory against a disposable database::
+
+    python -m benchmarks.export_suite --spots 2000 --records-per-spot 10 \
+        --output results.json
+    python -m benchmarks.export_suite --spots 2000 --compare results.json
+
+The tables are created in ``TEST_DATABASE_URL`` (or ``--database-url``) and
+dropped again afterwards, exactly like the test suite does, so never point it
+at a database holding real data. ``--users`` synthetic users are seeded by
+:mod:`benchmarks.seed` and the first one is measured.
+
+Every measurement runs in a fresh process, so peak RSS belongs to that one
+operation; ``rss_growth_bytes`` is how far the peak rose above the process's
+RSS right before the operation started. ``ttfb_seconds`` is the time until the
+stream yielded its first chunk. ``import_from_bundle`` first empties the
+user's collection, then times validating the JSON export into an
+``ExportBundle`` and importing it, as ``POST /api/export/json`` does.
+
+Results are written as JSON. ``--compare`` prints the ratio of every metric to
+a previous results file, which is how regressions between versions are read.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.config import settings
+from app.models import Base, Spot, User
+from app.services import ExportBundle, ExportService
+from benchmarks.seed import SeedProfile, seed_user
+
+OPERATIONS = ("stream_json_export", "stream_csv_export", "import_from_bundle")
+METRICS = ("wall_seconds", "ttfb_seconds", "peak_rss_bytes", "rss_growth_bytes")
+
+
+def _peak_rss_bytes() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+async def _measure(
+    database_url: str, operation: str, user_id: UUID, bundle_path: str
+) -> dict[str, Any]:
+    engine = create_async_engine(database_url)
+    service = ExportService()
+    try:
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            user = await session.get(User, user_id)
+            assert user is not None
+            ttfb: float | None = None
+            size = 0
+
+            if operation == "import_from_bundle":
+                await session.execute(delete(Spot).where(Spot.user_id == user.id))
+                await session.commit()
+                baseline = _peak_rss_bytes()
+                started = time.perf_counter()
+                payload = Path(bundle_path).read_bytes()
+                bundle = ExportBundle.model_validate_json(payload)
+                await service.import_from_bundle(session, user, bundle)
+                size = len(payload)
+            else:
+                baseline = _peak_rss_bytes()
+                started = time.perf_counter()
+                async for chunk in getattr(service, operation)(session, user):
+                    if ttfb is None:
+                        ttfb = time.perf_counter() - started
+                    size += len(chunk)
+            wall = time.perf_counter() - started
+    finally:
+        await engine.dispose()
+
+    peak = _peak_rss_bytes()
+    return {
+        "wall_seconds": wall,
+        "ttfb_seconds": ttfb,
+        "bytes": size,
+        "peak_rss_bytes": peak,
+        "rss_growth_bytes": peak - baseline,
+    }
+
+
+def _measure_in_process(
+    database_url: str, operation: str, user_id: UUID, bundle_path: str
+) -> dict[str, Any]:
+    return asyncio.run(_measure(database_url, operation, user_id, bundle_path))
+
+
+def _isolated(*args: Any) -> dict[str, Any]:
+    """Run one measurement in a fresh interpreter."""
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(_measure_in_process, *args).result()
+
+
+async def _prepare(
+    database_url: str, profile: SeedProfile, users: int, bundle_path: str
+) -> UUID:
+    """Create the tables, seed the users and write the measured user's JSON export."""
+
+    engine = create_async_engine(database_url)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_maker = async_sessionmaker(engine, expire_on_commit=False)
+        seeded = []
+        for index in range(users):
+            async with session_maker() as session:
+                user_profile = SeedProfile(
+                    spots=profile.spots,
+                    records_per_spot=profile.records_per_spot,
+                    images_per_spot=profile.images_per_spot,
+                    images_per_record=profile.images_per_record,
+                    seed=profile.seed + index,
+                )
+                seeded.append(await seed_user(session, user_profile))
+
+        async with session_maker() as session:
+            with open(bundle_path, "wb") as bundle_file:
+                async for chunk in ExportService().stream_json_export(session, seeded[0]):
+                    bundle_file.write(chunk)
+        return seeded[0].id
+    finally:
+        await engine.dispose()
+
+
+async def _drop(database_url: str) -> None:
+    engine = create_async_engine(database_url)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+    finally:
+        await engine.dispose()
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(
+    database_url: str, profile: SeedProfile, users: int, repeat: int
+) -> dict[str, Any]:
+    """Seed the database, measure every operation and return the results document."""
+
+    with tempfile.TemporaryDirectory() as directory:
+        bundle_path = str(Path(directory) / "bundle.json")
+        try:
+            user_id = asyncio.run(_prepare(database_url, profile, users, bundle_path))
+            results = []
+            for operation in OPERATIONS:
+                runs = [
+                    _isolated(database_url, operation, user_id, bundle_path)
+                    for _ in range(repeat)
+                ]
+                ttfbs = [
+                    measured["ttfb_seconds"]
+                    for measured in runs
+                    if measured["ttfb_seconds"] is not None
+                ]
+                results.append(
+                    {
+                        "operation": operation,
+                        "bytes": runs[0]["bytes"],
+                        "wall_seconds": min(measured["wall_seconds"] for measured in runs),
+                        "ttfb_seconds": min(ttfbs) if ttfbs else None,
+                        "peak_rss_bytes": max(measured["peak_rss_bytes"] for measured in runs),
+                        "rss_growth_bytes": max(measured["rss_growth_bytes"] for measured in runs),
+                    }
+                )
+        finally:
+            asyncio.run(_drop(database_url))
+
+    return {
+        "benchmark": "export_suite",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "profile": profile.as_dict(),
+        "users": users,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(current: dict[str, Any], previous: dict[str, Any]) -> list[str]:
+    """Return one line per operation and metric with the ratio to ``previous``."""
+
+    before = {row["operation"]: row for row in previous["results"]}
+    lines = []
+    for row in current["results"]:
+        old = before.get(row["operation"])
+        if old is None:
+            continue
+        for metric in METRICS:
+            if row[metric] is None or not old.get(metric):
+                continue
+            lines.append(
+                f"{row['operation']:<20} {metric:<18} {old[metric]:>14.4g} -> "
+                f"{row[metric]:>14.4g}  x{row[metric] / old[metric]:.2f}"
+            )
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spots", type=int, default=1000, help="Spots per user")
+    parser.add_argument("--records-per-spot", type=int, default=10)
+    parser.add_argument("--images-per-spot", type=int, default=1)
+    parser.add_argument("--images-per-record", type=int, default=1)
+    parser.add_argument("--users", type=int, default=1, help="Synthetic users to seed")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the data")
+    parser.add_argument("--repeat", type=int, default=3, help="Measurements per operation")
+    parser.add_argument(
+        "--database-url", default=settings.TEST_DATABASE_URL, help="Disposable database"
+    )
+    parser.add_argument("--output", type=Path, help="Write the results here, not stdout")
+    parser.add_argument("--compare", type=Path, help="Previous results to compare with")
+    args = parser.parse_args()
+
+    profile = SeedProfile(
+        spots=args.spots,
+        records_per_spot=args.records_per_spot,
+        images_per_spot=args.images_per_spot,
+        images_per_record=args.images_per_record,
+        seed=args.seed,
+    )
+    document = run(args.database_url, profile, args.users, args.repeat)
+
+    rendered = json.dumps(document, indent=2)
+    if args.output:
+        args.output.write_text(rendered + "\n")
+    else:
+        print(rendered)
+    if args.compare:
+        for line in compare(document, json.loads(args.compare.read_text())):
+            print(line, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
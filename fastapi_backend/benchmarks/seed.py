@@ -0,0 +1,142 @@
+"""Seed synthetic users into a disposable database for the benchmarks.
+
+The data is generated from a :class:`random.Random` seeded with
+:attr:`SeedProfile.seed`, so the same profile always produces the same rows,
+ids included, and results stay comparable between runs and versions.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import (
+    GoshuinAcquisitionMethod,
+    GoshuinImage,
+    GoshuinImageType,
+    GoshuinRecord,
+    GoshuinStatus,
+    Spot,
+    SpotImage,
+    SpotImageType,
+    SpotType,
+    User,
+)
+
+SEED_CHUNK_SIZE = 5000
+PREFECTURES = ("京都府", "奈良県", "東京都", "大阪府", "鎌倉市", "三重県")
+
+
+@dataclass(slots=True, frozen=True)
+class SeedProfile:
+    """Shape of the collection owned by one synthetic user."""
+
+    spots: int = 1000
+    records_per_spot: int = 10
+    images_per_spot: int = 1
+    images_per_record: int = 1
+    seed: int = 0
+
+    @property
+    def records(self) -> int:
+        return self.spots * self.records_per_spot
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "records": self.records}
+
+
+def _uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+async def _insert(session: AsyncSession, model: type[Any], rows: list[dict[str, Any]]) -> None:
+    for start in range(0, len(rows), SEED_CHUNK_SIZE):
+        await session.execute(insert(model), rows[start : start + SEED_CHUNK_SIZE])
+
+
+async def seed_user(session: AsyncSession, profile: SeedProfile) -> User:
+    """Insert one user owning the collection described by ``profile`` and return it."""
+
+    rng = random.Random(profile.seed)
+    user = User(
+        id=_uuid(rng),
+        email=f"benchmark-{profile.seed}-{rng.getrandbits(32)}@example.com",
+        hashed_password="-",
+        is_active=True,
+        is_superuser=False,
+        is_verified=True,
+    )
+    session.add(user)
+    await session.flush()
+
+    spots: list[dict[str, Any]] = []
+    spot_images: list[dict[str, Any]] = []
+    records: list[dict[str, Any]] = []
+    record_images: list[dict[str, Any]] = []
+    for index in range(profile.spots):
+        spot_id = _uuid(rng)
+        spots.append(
+            {
+                "id": spot_id,
+                "user_id": user.id,
+                "slug": f"benchmark-{user.id}-{index}",
+                "name": f"寺院 {index}",
+                "spot_type": rng.choice(list(SpotType)),
+                "prefecture": rng.choice(PREFECTURES),
+                "city": "京都市" if rng.random() < 0.7 else None,
+                "address": f"東山区 {index}-1",
+                "latitude": rng.uniform(31.0, 43.0),
+                "longitude": rng.uniform(130.0, 145.0),
+                "description": "御朱印をいただける由緒ある寺院です。" * rng.randint(0, 4),
+            }
+        )
+        spot_images.extend(
+            {
+                "id": _uuid(rng),
+                "spot_id": spot_id,
+                "image_url": f"https://example.com/spots/{spot_id}/{order}.jpg",
+                "image_type": rng.choice(list(SpotImageType)),
+                "is_primary": order == 0,
+                "display_order": order,
+            }
+            for order in range(profile.images_per_spot)
+        )
+        first_visit = date(2015, 1, 1) + timedelta(days=rng.randrange(365))
+        for visit in range(profile.records_per_spot):
+            record_id = _uuid(rng)
+            records.append(
+                {
+                    "id": record_id,
+                    "user_id": user.id,
+                    "spot_id": spot_id,
+                    # One visit per spot and day keeps uq_goshuin_records_unique_visit happy
+                    "visit_date": first_visit + timedelta(days=visit * 7),
+                    "acquisition_method": rng.choice(list(GoshuinAcquisitionMethod)),
+                    "status": rng.choice(list(GoshuinStatus)),
+                    "rating": rng.choice((None, 1, 2, 3, 4, 5)),
+                    "notes": "季節限定の御朱印をいただきました。" * rng.randint(0, 3) or None,
+                }
+            )
+            record_images.extend(
+                {
+                    "id": _uuid(rng),
+                    "goshuin_record_id": record_id,
+                    "image_url": f"https://example.com/goshuin/{record_id}/{order}.jpg",
+                    "image_type": rng.choice(list(GoshuinImageType)),
+                    "display_order": order,
+                }
+                for order in range(profile.images_per_record)
+            )
+
+    await _insert(session, Spot, spots)
+    await _insert(session, SpotImage, spot_images)
+    await _insert(session, GoshuinRecord, records)
+    await _insert(session, GoshuinImage, record_images)
+    await session.commit()
+    return user
@@ -0,0 +1,204 @@
+"""Compare the previous and current JSON render paths of the API endpoints.
+
+Run from the ``fastapi_backend`` directory::
+
+    python -m benchmarks.serialization --items 100 --spots 1000
+
+Each endpoint is timed end to end from its validated response model to the
+response bytes. The ``old`` path is what the endpoints did before the fast
+serializer: ``model_dump(mode="json")`` rendered by Starlette's
+``JSONResponse`` (lists) or by ``json.dumps`` (JSON export). The other rows are
+the current paths with each available serializer backend: ``FastJSONResponse``
+for the lists and ``model_dump(mode="python")`` plus the backend ``dumps`` for
+the export, as in ``ExportService.stream_json_export``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import timeit
+from datetime import date, datetime, timedelta
+from typing import Any, Callable
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+
+from app.models import (
+    GoshuinAcquisitionMethod,
+    GoshuinImageType,
+    GoshuinStatus,
+    SpotImageType,
+    SpotType,
+)
+from app.schemas import PaginatedGoshuinResponse, PaginatedSpotsResponse
+from app import serialization
+from app.serialization import FastJSONResponse, get_json_dumps
+from app.services import ExportBundle
+
+BACKENDS = ("json", "orjson", "msgspec")
+
+
+def _spot_payload(index: int, user_id: Any) -> dict[str, Any]:
+    now = datetime(2024, 1, 1) + timedelta(minutes=index)
+    return {
+        "id": uuid4(),
+        "user_id": user_id,
+        "slug": f"spot-{index}",
+        "name": f"寺院 {index}",
+        "spot_type": SpotType.TEMPLE,
+        "prefecture": "京都府",
+        "city": "京都市",
+        "address": f"東山区 {index}-1",
+        "latitude": 35.0 + index / 10_000,
+        "longitude": 135.7 + index / 10_000,
+        "description": "御朱印をいただける由緒ある寺院です。" * 4,
+        "website_url": f"https://example.com/spots/{index}",
+        "phone_number": "075-000-0000",
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def _record_payload(index: int, user_id: Any, spot_id: Any) -> dict[str, Any]:
+    now = datetime(2024, 1, 1) + timedelta(minutes=index)
+    return {
+        "id": uuid4(),
+        "user_id": user_id,
+        "spot_id": spot_id,
+        "visit_date": date(2023, 1, 1) + timedelta(days=index % 365),
+        "acquisition_method": GoshuinAcquisitionMethod.IN_PERSON,
+        "status": GoshuinStatus.COLLECTED,
+        "rating": index % 5 + 1,
+        "notes": "朝の参拝。墨書きが美しい。",
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def build_models(items: int, spots: int) -> dict[str, Any]:
+    """Return the validated response models each endpoint renders."""
+
+    user_id = uuid4()
+    spot_page = PaginatedSpotsResponse(
+        items=[_spot_payload(i, user_id) for i in range(items)],
+        total=items,
+        page=1,
+        size=items,
+    )
+    goshuin_page = PaginatedGoshuinResponse(
+        items=[_record_payload(i, user_id, uuid4()) for i in range(items)],
+        total=items,
+        page=1,
+        size=items,
+    )
+
+    exported_spots = []
+    for i in range(spots):
+        spot = _spot_payload(i, user_id)
+        record = _record_payload(i, user_id, spot["id"])
+        record["images"] = [
+            {
+                "id": uuid4(),
+                "image_url": f"https://cdn.example.com/goshuin/{i}.jpg",
+                "image_type": GoshuinImageType.STAMP_FRONT,
+                "display_order": 0,
+                "created_at": record["created_at"],
+            }
+        ]
+        spot["images"] = [
+            {
+                "id": uuid4(),
+                "image_url": f"https://cdn.example.com/spots/{i}.jpg",
+                "image_type": SpotImageType.EXTERIOR,
+                "is_primary": True,
+                "display_order": 0,
+                "created_at": spot["created_at"],
+            }
+        ]
+        spot["goshuin_records"] = [record]
+        exported_spots.append(spot)
+    bundle = ExportBundle(
+        generated_at=datetime(2024, 1, 1),
+        user={"id": user_id, "email": "bench@example.com"},
+        spots=exported_spots,
+    )
+
+    return {"spot_list": spot_page, "goshuin_list": goshuin_page, "export_json": bundle}
+
+
+def _old_list_render(model: Any) -> bytes:
+    return JSONResponse(model.model_dump(mode="json")).body
+
+
+def _old_export_render(bundle: ExportBundle) -> bytes:
+    return json.dumps(bundle.model_dump(mode="json"), ensure_ascii=False).encode("utf-8")
+
+
+def _new_render(name: str, dumps: Callable[[Any], bytes]) -> Callable[[Any], bytes]:
+    if name == "export_json":
+        return lambda bundle: dumps(bundle.model_dump(mode="python"))
+
+    def render(model: Any) -> bytes:
+        # FastJSONResponse renders with the module level serializer
+        serialization.json_dumps = dumps
+        return FastJSONResponse(model.model_dump(mode="json")).body
+
+    return render
+
+
+def _time(render: Callable[[Any], bytes], model: Any, repeat: int) -> float:
+    return min(timeit.repeat(lambda: render(model), number=1, repeat=repeat))
+
+
+def run(items: int, spots: int, repeat: int) -> list[dict[str, Any]]:
+    """Return one result row per endpoint and render path."""
+
+    models = build_models(items, spots)
+    configured = serialization.json_dumps
+    results: list[dict[str, Any]] = []
+    try:
+        for name, model in models.items():
+            paths: list[tuple[str, Callable[[Any], bytes]]] = [
+                ("old", _old_export_render if name == "export_json" else _old_list_render)
+            ]
+            for backend in BACKENDS:
+                if backend != "json" and importlib.util.find_spec(backend) is None:
+                    continue
+                paths.append((backend, _new_render(name, get_json_dumps(backend))))
+
+            baseline: float | None = None
+            for label, render in paths:
+                seconds = _time(render, model, repeat)
+                baseline = baseline or seconds
+                results.append(
+                    {
+                        "endpoint": name,
+                        "path": label,
+                        "bytes": len(render(model)),
+                        "seconds": seconds,
+                        "speedup": baseline / seconds,
+                    }
+                )
+    finally:
+        serialization.json_dumps = configured
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100, help="Items per list page")
+    parser.add_argument("--spots", type=int, default=1000, help="Spots in the export bundle")
+    parser.add_argument("--repeat", type=int, default=20, help="Timing repetitions")
+    args = parser.parse_args()
+
+    for row in run(args.items, args.spots, args.repeat):
+        print(
+            f"{row['endpoint']:<14} {row['path']:<8} {row['bytes']:>10} B "
+            f"{row['seconds'] * 1000:>9.3f} ms  x{row['speedup']:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import argparse
+import asyncio
+from typing import Optional, Sequence
+from uuid import UUID
+
+
+async def rebuild(user_id: Optional[UUID] = None) -> int:
+    """Recompute the prefecture counters in one transaction and commit them."""
+
+    from app.database import async_session_maker
+    from app.services.prefecture_counters import rebuild_prefecture_counters
+
+    async with async_session_maker() as session:
+        written = await rebuild_prefecture_counters(session, user_id)
+        await session.commit()
+    return written
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Recompute the per-user prefecture counters from spots and goshuin records."
+    )
+    parser.add_argument(
+        "--user-id", type=UUID, default=None, help="Only rebuild the counters of this user"
+    )
+    args = parser.parse_args(argv)
+
+    written = asyncio.run(rebuild(args.user_id))
+    scope = f"user {args.user_id}" if args.user_id else "all users"
+    print(f"Rebuilt {written} prefecture counters for {scope}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import csv
+import gzip
+import io
+import json
 from datetime import date
 from uuid import uuid4
 
@@ -20,6 +24,7 @@ from app.models import (
     SpotImageType,
     SpotType,
 )
+from app.services import ExportBundle
 
 
 @pytest.mark.asyncio
@@ -83,7 +88,7 @@ async def test_json_export_import_round_trip(
     assert response.status_code == 200
     payload = response.json()
     assert payload["spots"]
-    assert payload["pdf_document"]
+    assert "pdf_document" not in payload
     assert payload["spots"][0]["goshuin_records"][0]["notes"] == "Memorable visit"
 
     await db_session.execute(delete(GoshuinImage))
@@ -116,3 +121,751 @@ async def test_json_export_import_round_trip(
     assert len(restored_records) == 1
     assert restored_records[0].notes == "Memorable visit"
 
+
+@pytest.mark.asyncio
+async def test_database_json_export_matches_python_export(
+    test_client: AsyncClient, authenticated_user, db_session
+) -> None:
+    """The PostgreSQL rendered export should carry the same document."""
+
+    user = authenticated_user["user"]
+    spot = Spot(
+        id=uuid4(),
+        user_id=user.id,
+        slug="database-spot",
+        name="Database Spot",
+        spot_type=SpotType.TEMPLE,
+        prefecture="Nara",
+        latitude=34.5,
+    )
+    empty = Spot(
+        id=uuid4(),
+        user_id=user.id,
+        slug="empty-database-spot",
+        name="Empty Database Spot",
+        spot_type=SpotType.OTHER,
+        prefecture="Nara",
+    )
+    db_session.add_all([spot, empty])
+    await db_session.flush()
+    records = [
+        GoshuinRecord(
+            id=uuid4(),
+            spot_id=spot.id,
+            user_id=user.id,
+            visit_date=date(2024, 3, day),
+            acquisition_method=GoshuinAcquisitionMethod.BY_MAIL,
+            status=GoshuinStatus.COLLECTED,
+            notes=f"Visit \"{day}\"",
+        )
+        for day in (9, 2)
+    ]
+    db_session.add_all(
+        [
+            *records,
+            *(
+                SpotImage(
+                    id=uuid4(),
+                    spot_id=spot.id,
+                    image_url=f"https://example.com/spot-{order}.jpg",
+                    image_type=SpotImageType.EXTERIOR,
+                    display_order=order,
+                )
+                for order in (2, 1)
+            ),
+        ]
+    )
+    await db_session.flush()
+    db_session.add(
+        GoshuinImage(
+            id=uuid4(),
+            goshuin_record_id=records[0].id,
+            image_url="https://example.com/stamp.jpg",
+            image_type=GoshuinImageType.STAMP_BACK,
+            display_order=0,
+        )
+    )
+    await db_session.commit()
+
+    python_export = await test_client.get(
+        "/api/export/json", headers=authenticated_user["headers"]
+    )
+    database_export = await test_client.get(
+        "/api/export/json",
+        params={"engine": "database"},
+        headers=authenticated_user["headers"],
+    )
+
+    assert database_export.status_code == 200
+    payload = database_export.json()
+    assert list(payload) == ["version", "generated_at", "user", "spots"]
+    assert payload["spots"][0]["created_at"].endswith("Z")
+    assert [image["display_order"] for image in payload["spots"][0]["images"]] == [1, 2]
+    assert [record["visit_date"] for record in payload["spots"][0]["goshuin_records"]] == [
+        "2024-03-02",
+        "2024-03-09",
+    ]
+    assert payload["spots"][1]["images"] == []
+    assert (
+        ExportBundle.model_validate(payload).spots
+        == ExportBundle.model_validate(python_export.json()).spots
+    )
+
+    rejected = await test_client.get(
+        "/api/export/json",
+        params={"engine": "database", "include_pdf": "true"},
+        headers=authenticated_user["headers"],
+    )
+    assert rejected.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_pdf_document_is_opt_in_and_paginated(
+    test_client: AsyncClient, authenticated_user, db_session
+) -> None:
+    """The React-PDF layout should be opt-in on the bundle and paginated by spot."""
+
+    user = authenticated_user["user"]
+    spots = [
+        Spot(
+            id=uuid4(),
+            user_id=user.id,
+            slug=f"pdf-spot-{index}",
+            name=f"PDF Spot {index}",
+            spot_type=SpotType.SHRINE,
+            prefecture="Kyoto",
+            city="Kyoto" if index == 0 else None,
+        )
+        for index in range(3)
+    ]
+    db_session.add_all(spots)
+    await db_session.flush()
+    db_session.add(
+        GoshuinRecord(
+            id=uuid4(),
+            spot_id=spots[0].id,
+            user_id=user.id,
+            visit_date=date(2024, 1, 1),
+            acquisition_method=GoshuinAcquisitionMethod.IN_PERSON,
+            status=GoshuinStatus.COLLECTED,
+            notes="First page",
+        )
+    )
+    await db_session.commit()
+
+    bundle = await test_client.get(
+        "/api/export/json",
+        params={"include_pdf": "true"},
+        headers=authenticated_user["headers"],
+    )
+    assert [section["title"] for section in bundle.json()["pdf_document"]] == [
+        "PDF Spot 0",
+        "PDF Spot 1",
+        "PDF Spot 2",
+    ]
+
+    first = await test_client.get(
+        "/api/export/pdf", params={"size": 2}, headers=authenticated_user["headers"]
+    )
+    second = await test_client.get(
+        "/api/export/pdf",
+        params={"page": 2, "size": 2},
+        headers=authenticated_user["headers"],
+    )
+
+    assert first.status_code == 200
+    assert first.json()["total"] == 3
+    assert [section["title"] for section in first.json()["items"]] == [
+        "PDF Spot 0",
+        "PDF Spot 1",
+    ]
+    assert first.json()["items"][0]["subtitle"] == "Kyoto · Kyoto"
+    assert first.json()["items"][0]["records"][0]["notes"] == "First page"
+    assert [section["title"] for section in second.json()["items"]] == ["PDF Spot 2"]
+
+
+@pytest.mark.asyncio
+async def test_csv_export_rows(
+    test_client: AsyncClient, authenticated_user, db_session
+) -> None:
+    """CSV export should emit one row per record and one row per empty spot."""
+
+    user = authenticated_user["user"]
+
+    visited = Spot(
+        id=uuid4(),
+        user_id=user.id,
+        slug="visited-spot",
+        name="A Visited Spot",
+        spot_type=SpotType.SHRINE,
+        prefecture="Kyoto",
+        city="Kyoto",
+    )
+    empty = Spot(
+        id=uuid4(),
+        user_id=user.id,
+        slug="empty-spot",
+        name="B Empty Spot",
+        spot_type=SpotType.MUSEUM,
+        prefecture="Osaka",
+    )
+    db_session.add_all([visited, empty])
+    await db_session.flush()
+    db_session.add_all(
+        [
+            GoshuinRecord(
+                id=uuid4(),
+                spot_id=visited.id,
+                user_id=user.id,
+                visit_date=date(2023, 5, 1),
+                acquisition_method=GoshuinAcquisitionMethod.BY_MAIL,
+                status=GoshuinStatus.COLLECTED,
+                rating=4,
+                notes="First, with a comma",
+            ),
+            GoshuinRecord(
+                id=uuid4(),
+                spot_id=visited.id,
+                user_id=user.id,
+                visit_date=date(2022, 5, 1),
+                acquisition_method=GoshuinAcquisitionMethod.IN_PERSON,
+                status=GoshuinStatus.PLANNED,
+            ),
+        ]
+    )
+    await db_session.commit()
+
+    response = await test_client.get(
+        "/api/export/csv", headers=authenticated_user["headers"]
+    )
+
+    assert response.status_code == 200
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0][0] == "spot_id"
+    assert len(rows) == 4
+    assert rows[1][1:] == [
+        "A Visited Spot",
+        "visited-spot",
+        "shrine",
+        "Kyoto",
+        "Kyoto",
+        "2022-05-01",
+        "in_person",
+        "planned",
+        "",
+        "",
+    ]
+    assert rows[2][6:] == ["2023-05-01", "by_mail", "collected", "4", "First, with a comma"]
+    assert rows[3][1:] == [
+        "B Empty Spot",
+        "empty-spot",
+        "museum",
+        "Osaka",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_export_emits_parents_before_children(
+    test_client: AsyncClient, authenticated_user, db_session
+) -> None:
+    """NDJSON export should emit typed lines with parents ahead of children."""
+
+    user = authenticated_user["user"]
+
+    spot = Spot(
+        id=uuid4(),
+        user_id=user.id,
+        slug="ndjson-spot",
+        name="NDJSON Spot",
+        spot_type=SpotType.TEMPLE,
+        prefecture="Nara",
+    )
+    db_session.add(spot)
+    await db_session.flush()
+    record = GoshuinRecord(
+        id=uuid4(),
+        spot_id=spot.id,
+        user_id=user.id,
+        visit_date=date(2024, 2, 3),
+        acquisition_method=GoshuinAcquisitionMethod.EVENT,
+        status=GoshuinStatus.COLLECTED,
+    )
+    db_session.add_all(
+        [
+            record,
+            SpotImage(
+                id=uuid4(),
+                spot_id=spot.id,
+                image_url="https://example.com/spot.jpg",
+                image_type=SpotImageType.MAP,
+                display_order=0,
+            ),
+        ]
+    )
+    await db_session.flush()
+    db_session.add(
+        GoshuinImage(
+            id=uuid4(),
+            goshuin_record_id=record.id,
+            image_url="https://example.com/stamp.jpg",
+            image_type=GoshuinImageType.COVER,
+            display_order=0,
+        )
+    )
+    await db_session.commit()
+
+    response = await test_client.get(
+        "/api/export/ndjson", headers=authenticated_user["headers"]
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["type"] for line in lines] == [
+        "meta",
+        "spot",
+        "spot_image",
+        "goshuin_record",
+        "goshuin_image",
+    ]
+    assert lines[0]["data"]["user"]["id"] == str(user.id)
+    assert lines[1]["data"]["slug"] == "ndjson-spot"
+    assert lines[3]["data"]["acquisition_method"] == "event"
+    assert lines[4]["data"]["goshuin_record_id"] == str(record.id)
+    assert set(lines[2]["data"]) == {
+        "id",
+        "spot_id",
+        "image_url",
+        "image_type",
+        "is_primary",
+        "display_order",
+        "created_at",
+    }
+
+
+@pytest.mark.asyncio
+async def test_csv_export_negotiates_content_encoding(
+    test_client: AsyncClient, authenticated_user, db_session
+) -> None:
+    """The export stream should be compressed with the coding the client prefers."""
+
+    db_session.add(
+        Spot(
+            id=uuid4(),
+            user_id=authenticated_user["user"].id,
+            slug="encoded-spot",
+            name="Encoded Spot",
+            spot_type=SpotType.TEMPLE,
+            prefecture="Nara",
+        )
+    )
+    await db_session.commit()
+
+    async with test_client.stream(
+        "GET",
+        "/api/export/csv",
+        headers={**authenticated_user["headers"], "Accept-Encoding": "gzip;q=1, zstd;q=0.5"},
+    ) as response:
+        raw = b"".join([chunk async for chunk in response.aiter_raw()])
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    rows = list(csv.reader(io.StringIO(gzip.decompress(raw).decode("utf-8"))))
+    assert rows[1][1] == "Encoded Spot"
+
+    identity = await test_client.get(
+        "/api/export/csv",
+        headers={**authenticated_user["headers"], "Accept-Encoding": "identity"},
+    )
+    assert "content-encoding" not in identity.headers
+    assert identity.text == gzip.decompress(raw).decode("utf-8")
+
+
+@pytest.mark.asyncio
+async def test_ndjson_export_downloads_zstd_file(
+    test_client: AsyncClient, authenticated_user, db_session
+) -> None:
+    """``?compression=zstd`` should download a ``.zst`` file rather than encode the body."""
+
+    zstandard = pytest.importorskip("zstandard")
+    db_session.add(
+        Spot(
+            id=uuid4(),
+            user_id=authenticated_user["user"].id,
+            slug="zstd-spot",
+            name="Zstd Spot",
+            spot_type=SpotType.SHRINE,
+            prefecture="Tokyo",
+        )
+    )
+    await db_session.commit()
+
+    response = await test_client.get(
+        "/api/export/ndjson",
+        params={"compression": "zstd"},
+        headers={**authenticated_user["headers"], "Accept-Encoding": "gzip"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zstd"
+    assert "content-encoding" not in response.headers
+    assert '.ndjson.zst"' in response.headers["content-disposition"]
+    lines = (
+        zstandard.ZstdDecompressor()
+        .decompressobj()
+        .decompress(response.content)
+        .decode("utf-8")
+        .splitlines()
+    )
+    assert [json.loads(line)["type"] for line in lines] == ["meta", "spot"]
+    assert json.loads(lines[1])["data"]["name"] == "Zstd Spot"
+
+
+@pytest.mark.asyncio
+async def test_parquet_export_writes_typed_tables(
+    test_client: AsyncClient, authenticated_user, db_session
+) -> None:
+    """Parquet export should write native dates and dictionary encoded enums."""
+
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    user = authenticated_user["user"]
+
+    spot = Spot(
+        id=uuid4(),
+        user_id=user.id,
+        slug="parquet-spot",
+        name="Parquet Spot",
+        spot_type=SpotType.TEMPLE,
+        prefecture="Kyoto",
+        latitude=35.0,
+    )
+    db_session.add(spot)
+    await db_session.flush()
+    db_session.add_all(
+        [
+            GoshuinRecord(
+                id=uuid4(),
+                spot_id=spot.id,
+                user_id=user.id,
+                visit_date=date(2024, 4, day),
+                acquisition_method=GoshuinAcquisitionMethod.IN_PERSON,
+                status=GoshuinStatus.COLLECTED,
+                rating=day,
+            )
+            for day in (1, 2)
+        ]
+    )
+    await db_session.commit()
+
+    response = await test_client.get(
+        "/api/export/parquet",
+        params={"table": "goshuin_records"},
+        headers=authenticated_user["headers"],
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.parquet"
+    assert '.goshuin_records.parquet"' in response.headers["content-disposition"]
+    records = pq.read_table(io.BytesIO(response.content))
+    assert records.schema.field("visit_date").type == pa.date32()
+    assert pa.types.is_dictionary(records.schema.field("status").type)
+    assert pa.types.is_timestamp(records.schema.field("created_at").type)
+    assert records.column("visit_date").to_pylist() == [date(2024, 4, 1), date(2024, 4, 2)]
+    assert records.column("status").to_pylist() == ["collected", "collected"]
+    assert records.column("spot_id").to_pylist() == [str(spot.id)] * 2
+
+    spots = pq.read_table(
+        io.BytesIO(
+            (
+                await test_client.get(
+                    "/api/export/parquet", headers=authenticated_user["headers"]
+                )
+            ).content
+        )
+    )
+    assert spots.to_pylist()[0]["name"] == "Parquet Spot"
+    assert spots.to_pylist()[0]["latitude"] == 35.0
+    assert spots.column("spot_type").to_pylist() == ["temple"]
+
+
+@pytest.mark.asyncio
+async def test_streaming_import_accepts_gzipped_ndjson(
+    test_client: AsyncClient, authenticated_user, db_session
+) -> None:
+    """A gzip'd NDJSON export should round-trip through the streaming import."""
+
+    user = authenticated_user["user"]
+    spot = Spot(
+        id=uuid4(),
+        user_id=user.id,
+        slug="stream-spot",
+        name="Stream Spot",
+        spot_type=SpotType.SHRINE,
+        prefecture="Hokkaido",
+    )
+    db_session.add(spot)
+    await db_session.flush()
+    db_session.add(
+        GoshuinRecord(
+            id=uuid4(),
+            spot_id=spot.id,
+            user_id=user.id,
+            visit_date=date(2024, 8, 1),
+            acquisition_method=GoshuinAcquisitionMethod.IN_PERSON,
+            status=GoshuinStatus.COLLECTED,
+            notes="Summer",
+        )
+    )
+    await db_session.commit()
+
+    exported = await test_client.get(
+        "/api/export/ndjson", headers=authenticated_user["headers"]
+    )
+    await db_session.execute(delete(GoshuinRecord))
+    await db_session.execute(delete(Spot))
+    await db_session.commit()
+
+    response = await test_client.post(
+        "/api/export/import?progress=true",
+        content=gzip.compress(exported.content),
+        headers={
+            **authenticated_user["headers"],
+            "Content-Type": "application/x-ndjson",
+            "Content-Encoding": "gzip",
+        },
+    )
+
+    assert response.status_code == 200
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert events[-1] == {
+        "type": "result",
+        "data": {"spots": 1, "goshuin_records": 1, "spot_images": 0, "goshuin_images": 0},
+    }
+    restored = (
+        await db_session.execute(select(GoshuinRecord).where(GoshuinRecord.user_id == user.id))
+    ).scalars().all()
+    assert [record.notes for record in restored] == ["Summer"]
+
+
+@pytest.mark.asyncio
+async def test_streaming_import_accepts_json_bundle(
+    test_client: AsyncClient, authenticated_user
+) -> None:
+    """A JSON bundle should be parsed spot by spot by the streaming import."""
+
+    user = authenticated_user["user"]
+    spot_id = str(uuid4())
+    bundle = {
+        "version": "1.0",
+        "generated_at": "2024-01-01T00:00:00",
+        "user": {"id": str(user.id), "email": user.email},
+        "spots": [
+            {
+                "id": spot_id,
+                "user_id": str(user.id),
+                "slug": "bundle-spot",
+                "name": "Bundle Spot",
+                "spot_type": "temple",
+                "prefecture": "Kyoto",
+                "city": None,
+                "address": None,
+                "latitude": 35.0,
+                "longitude": 135.7,
+                "description": None,
+                "website_url": None,
+                "phone_number": None,
+                "created_at": "2024-01-01T00:00:00",
+                "updated_at": "2024-01-01T00:00:00",
+                "images": [],
+                "goshuin_records": [],
+            }
+        ],
+    }
+
+    response = await test_client.post(
+        "/api/export/import",
+        content=json.dumps(bundle),
+        headers={**authenticated_user["headers"], "Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 201
+    assert response.json()["spots"] == 1
+
+
+@pytest.mark.asyncio
+async def test_streaming_import_rejects_foreign_bundle(
+    test_client: AsyncClient, authenticated_user
+) -> None:
+    """The streaming import should refuse exports that belong to another user."""
+
+    meta = {"type": "meta", "data": {"user": {"id": str(uuid4())}}}
+
+    response = await test_client.post(
+        "/api/export/import",
+        content=json.dumps(meta) + "\n",
+        headers={**authenticated_user["headers"], "Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_streaming_import_requires_owner_metadata(
+    test_client: AsyncClient, authenticated_user
+) -> None:
+    """Imports without the owner entry first should be rejected."""
+
+    spot_line = {"type": "spot", "data": {"id": str(uuid4())}}
+    bundle = {"version": "1.0", "spots": []}
+
+    ndjson_response = await test_client.post(
+        "/api/export/import",
+        content=json.dumps(spot_line) + "\n",
+        headers={**authenticated_user["headers"], "Content-Type": "application/x-ndjson"},
+    )
+    json_response = await test_client.post(
+        "/api/export/import",
+        content=json.dumps(bundle),
+        headers={**authenticated_user["headers"], "Content-Type": "application/json"},
+    )
+
+    assert ndjson_response.status_code == 400
+    assert json_response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_streaming_import_reports_conflicts_as_progress_errors(
+    test_client: AsyncClient, authenticated_user, db_session
+) -> None:
+    """Database conflicts should end the progress stream with an error event."""
+
+    user = authenticated_user["user"]
+    db_session.add(
+        Spot(
+            id=uuid4(),
+            user_id=user.id,
+            slug="taken-slug",
+            name="Existing Spot",
+            spot_type=SpotType.TEMPLE,
+            prefecture="Nara",
+        )
+    )
+    await db_session.commit()
+    lines = [
+        {"type": "meta", "data": {"user": {"id": str(user.id)}}},
+        {
+            "type": "spot",
+            "data": {
+                "id": str(uuid4()),
+                "user_id": str(user.id),
+                "slug": "taken-slug",
+                "name": "Duplicate Slug",
+                "spot_type": "temple",
+                "prefecture": "Nara",
+                "city": None,
+                "address": None,
+                "latitude": None,
+                "longitude": None,
+                "description": None,
+                "website_url": None,
+                "phone_number": None,
+                "created_at": "2024-01-01T00:00:00",
+                "updated_at": "2024-01-01T00:00:00",
+            },
+        },
+    ]
+
+    response = await test_client.post(
+        "/api/export/import?progress=true",
+        content="".join(json.dumps(line) + "\n" for line in lines),
+        headers={**authenticated_user["headers"], "Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert events[-1]["type"] == "error"
+
+
+@pytest.mark.asyncio
+async def test_export_job_artifact_is_reused_and_supports_ranges(
+    test_client: AsyncClient, authenticated_user, db_session, mock_storage
+) -> None:
+    """Export jobs should be reused while data is unchanged and serve byte ranges."""
+
+    user = authenticated_user["user"]
+    headers = authenticated_user["headers"]
+    db_session.add(
+        Spot(
+            id=uuid4(),
+            user_id=user.id,
+            slug="job-spot",
+            name="Job Spot",
+            spot_type=SpotType.TEMPLE,
+            prefecture="Kyoto",
+        )
+    )
+    await db_session.commit()
+
+    created = await test_client.post("/api/export/jobs", json={"format": "csv"}, headers=headers)
+    assert created.status_code == 202
+    job_id = created.json()["id"]
+
+    job = await test_client.get(f"/api/export/jobs/{job_id}", headers=headers)
+    assert job.json()["status"] == "completed"
+
+    download = await test_client.get(f"/api/export/jobs/{job_id}/download", headers=headers)
+    assert download.status_code == 200
+    assert download.headers["accept-ranges"] == "bytes"
+    assert "Job Spot" in download.text
+    assert len(download.content) == job.json()["size_bytes"]
+
+    partial = await test_client.get(
+        f"/api/export/jobs/{job_id}/download", headers={**headers, "Range": "bytes=0-6"}
+    )
+    assert partial.status_code == 206
+    assert partial.content == download.content[:7]
+    assert partial.headers["content-range"] == f"bytes 0-6/{len(download.content)}"
+
+    unsatisfiable = await test_client.get(
+        f"/api/export/jobs/{job_id}/download",
+        headers={**headers, "Range": f"bytes={len(download.content)}-"},
+    )
+    assert unsatisfiable.status_code == 416
+
+    reused = await test_client.post("/api/export/jobs", json={"format": "csv"}, headers=headers)
+    assert reused.json()["id"] == job_id
+
+    db_session.add(
+        Spot(
+            id=uuid4(),
+            user_id=user.id,
+            slug="job-spot-2",
+            name="Second Job Spot",
+            spot_type=SpotType.SHRINE,
+            prefecture="Kyoto",
+        )
+    )
+    await db_session.commit()
+    rebuilt = await test_client.post("/api/export/jobs", json={"format": "csv"}, headers=headers)
+    assert rebuilt.json()["id"] != job_id
+
+
+@pytest.mark.asyncio
+async def test_export_job_download_returns_404_for_unknown_job(
+    test_client: AsyncClient, authenticated_user, mock_storage
+) -> None:
+    """Downloading a job that does not exist should return 404."""
+
+    response = await test_client.get(
+        f"/api/export/jobs/{uuid4()}/download", headers=authenticated_user["headers"]
+    )
+
+    assert response.status_code == 404
@@ -424,6 +424,358 @@ class TestGoshuin:
         # First item should be latest date
         assert items[0]["visit_date"] == "2024-03-15"
 
+    @pytest.mark.asyncio
+    async def test_cursor_pagination(
+        self, test_client: AsyncClient, authenticated_user, db_session
+    ):
+        """Test walking goshuin records with next_cursor in both sort orders."""
+        user = authenticated_user["user"]
+
+        spots = []
+        for index in range(2):
+            spot = Spot(
+                name=f"Cursor Temple {index}",
+                prefecture="Tokyo",
+                spot_type="temple",
+                slug=f"cursor-temple-{index}",
+                user_id=user.id,
+            )
+            db_session.add(spot)
+            spots.append(spot)
+        await db_session.commit()
+
+        # Both spots share visit dates, so pages split between equal dates
+        visit_dates = [date(2024, 1, day) for day in (5, 10, 20)]
+        for spot in spots:
+            for visit_date in visit_dates:
+                db_session.add(
+                    GoshuinRecord(
+                        spot_id=spot.id,
+                        user_id=user.id,
+                        visit_date=visit_date,
+                        acquisition_method="in_person",
+                        status="collected",
+                    )
+                )
+        await db_session.commit()
+
+        for sort_order in ("desc", "asc"):
+            response = await test_client.get(
+                "/api/goshuin",
+                params={"size": 4, "sort_order": sort_order},
+                headers=authenticated_user["headers"],
+            )
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total"] == 6
+            walked = data["items"]
+            cursor = data["next_cursor"]
+            while cursor:
+                response = await test_client.get(
+                    "/api/goshuin",
+                    params={"size": 4, "sort_order": sort_order, "cursor": cursor},
+                    headers=authenticated_user["headers"],
+                )
+                assert response.status_code == 200
+                data = response.json()
+                walked += data["items"]
+                cursor = data["next_cursor"]
+
+            assert len({item["id"] for item in walked}) == 6
+            dates = [item["visit_date"] for item in walked]
+            assert dates == sorted(dates, reverse=sort_order == "desc")
+
+        response = await test_client.get(
+            "/api/goshuin?size=2", headers=authenticated_user["headers"]
+        )
+        response = await test_client.get(
+            "/api/goshuin",
+            params={"sort_order": "asc", "cursor": response.json()["next_cursor"]},
+            headers=authenticated_user["headers"],
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_goshuin_sparse_fieldsets(
+        self, test_client: AsyncClient, authenticated_user, db_session
+    ):
+        """Test narrowing goshuin records with fields."""
+        user = authenticated_user["user"]
+        spot = Spot(
+            name="Sparse Temple",
+            prefecture="Tokyo",
+            spot_type="temple",
+            slug="sparse-temple",
+            user_id=user.id,
+        )
+        db_session.add(spot)
+        await db_session.flush()
+        records = [
+            GoshuinRecord(
+                spot_id=spot.id,
+                user_id=user.id,
+                visit_date=date(2024, 3, day),
+                acquisition_method="in_person",
+                status="collected",
+                notes="Long notes",
+            )
+            for day in (1, 2, 3)
+        ]
+        db_session.add_all(records)
+        await db_session.commit()
+        headers = authenticated_user["headers"]
+
+        response = await test_client.get(
+            "/api/goshuin", params={"size": 2, "fields": "visit_date"}, headers=headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["items"] == [
+            {"id": str(records[2].id), "visit_date": "2024-03-03"},
+            {"id": str(records[1].id), "visit_date": "2024-03-02"},
+        ]
+        response = await test_client.get(
+            "/api/goshuin",
+            params={"size": 2, "fields": "spot_id", "cursor": data["next_cursor"]},
+            headers=headers,
+        )
+        assert response.json()["items"] == [{"id": str(records[0].id), "spot_id": str(spot.id)}]
+
+        response = await test_client.get(
+            f"/api/goshuin/{records[0].id}?fields=status,notes", headers=headers
+        )
+        assert response.status_code == 200
+        assert response.json() == {
+            "id": str(records[0].id),
+            "status": "collected",
+            "notes": "Long notes",
+        }
+
+        response = await test_client.get("/api/goshuin?fields=name", headers=headers)
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_and_update_goshuin_records(
+        self, test_client: AsyncClient, authenticated_user, db_session
+    ):
+        """Test bulk goshuin writes across spots reporting errors per item."""
+        user = authenticated_user["user"]
+        spots = [
+            Spot(
+                name=f"Bulk Temple {index}",
+                prefecture="Tokyo",
+                spot_type="temple",
+                slug=f"bulk-goshuin-temple-{index}",
+                user_id=user.id,
+            )
+            for index in range(2)
+        ]
+        db_session.add_all(spots)
+        await db_session.flush()
+        db_session.add(
+            GoshuinRecord(
+                spot_id=spots[0].id,
+                user_id=user.id,
+                visit_date=date(2024, 1, 1),
+                acquisition_method="in_person",
+                status="collected",
+            )
+        )
+        await db_session.commit()
+        headers = authenticated_user["headers"]
+
+        def record(spot_id, visit_date: str, **extra):
+            return {
+                "spot_id": str(spot_id),
+                "visit_date": visit_date,
+                "acquisition_method": "in_person",
+                "status": "collected",
+                **extra,
+            }
+
+        response = await test_client.post(
+            "/api/goshuin/bulk",
+            json={
+                "items": [
+                    record(spots[0].id, "2024-02-01", rating=5),
+                    record(spots[1].id, "2024-02-01"),
+                    record(spots[0].id, "2024-01-01"),
+                    record(uuid4(), "2024-02-02"),
+                    record(spots[1].id, "2999-01-01"),
+                ]
+            },
+            headers=headers,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["index"] for item in data["items"]] == [0, 1]
+        assert data["items"][0]["rating"] == 5
+        assert data["items"][1]["spot_id"] == str(spots[1].id)
+        assert [(error["index"], error["code"]) for error in data["errors"]] == [
+            (2, "conflict"),
+            (3, "not_found"),
+            (4, "invalid"),
+        ]
+        first, second = (item["id"] for item in data["items"])
+
+        response = await test_client.patch(
+            "/api/goshuin/bulk",
+            json={
+                "items": [
+                    {"id": first, "notes": "Bulk notes", "rating": 4},
+                    {"id": second, "notes": "Other notes", "rating": 3},
+                    {"id": first, "visit_date": "2024-01-01"},
+                ]
+            },
+            headers=headers,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [(item["index"], item["notes"]) for item in data["items"]] == [
+            (0, "Bulk notes"),
+            (1, "Other notes"),
+        ]
+        assert [(error["index"], error["code"]) for error in data["errors"]] == [
+            (2, "invalid"),
+        ]
+
+        response = await test_client.patch(
+            "/api/goshuin/bulk",
+            json={
+                "items": [
+                    {"id": first, "visit_date": "2024-01-01"},
+                    {"id": second, "rating": 1},
+                ]
+            },
+            headers=headers,
+        )
+        data = response.json()
+        assert [item["index"] for item in data["items"]] == [1]
+        assert [(error["index"], error["code"]) for error in data["errors"]] == [(0, "conflict")]
+
+        response = await test_client.get("/api/goshuin", headers=headers)
+        assert response.json()["total"] == 3
+
+    @pytest.mark.asyncio
+    async def test_faceted_filters(
+        self, test_client: AsyncClient, authenticated_user, db_session
+    ):
+        """Test filtering goshuin records and counting them by facet."""
+        user = authenticated_user["user"]
+        shrine = Spot(
+            name="Facet Shrine",
+            prefecture="Kyoto",
+            spot_type="shrine",
+            slug="facet-shrine",
+            user_id=user.id,
+        )
+        temple = Spot(
+            name="Facet Temple",
+            prefecture="Nara",
+            spot_type="temple",
+            slug="facet-temple",
+            user_id=user.id,
+        )
+        db_session.add_all([shrine, temple])
+        await db_session.flush()
+        for spot, day, status, method, rating in [
+            (shrine, 1, "collected", "in_person", 5),
+            (shrine, 2, "collected", "by_mail", 3),
+            (shrine, 3, "planned", "in_person", None),
+            (temple, 1, "collected", "in_person", 4),
+            (temple, 5, "missed", "event", None),
+        ]:
+            db_session.add(
+                GoshuinRecord(
+                    spot_id=spot.id,
+                    user_id=user.id,
+                    visit_date=date(2024, 4, day),
+                    acquisition_method=method,
+                    status=status,
+                    rating=rating,
+                )
+            )
+        await db_session.commit()
+        headers = authenticated_user["headers"]
+
+        response = await test_client.get(
+            "/api/goshuin?include_facets=true&visited_to=2024-04-03", headers=headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 4
+        assert data["facets"] == {
+            "status": [{"value": "collected", "count": 3}, {"value": "planned", "count": 1}],
+            "acquisition_method": [
+                {"value": "in_person", "count": 3},
+                {"value": "by_mail", "count": 1},
+            ],
+            "rating": [
+                {"value": 3, "count": 1},
+                {"value": 4, "count": 1},
+                {"value": 5, "count": 1},
+                {"value": None, "count": 1},
+            ],
+            "prefecture": [{"value": "Kyoto", "count": 3}, {"value": "Nara", "count": 1}],
+            "spot_type": [{"value": "shrine", "count": 3}, {"value": "temple", "count": 1}],
+        }
+
+        response = await test_client.get(
+            "/api/goshuin",
+            params={
+                "status": ["collected", "missed"],
+                "min_rating": 4,
+                "spot_type": "shrine",
+                "include_facets": "true",
+            },
+            headers=headers,
+        )
+        data = response.json()
+        assert [item["visit_date"] for item in data["items"]] == ["2024-04-01"]
+        assert data["facets"]["prefecture"] == [{"value": "Kyoto", "count": 1}]
+
+        response = await test_client.get(
+            "/api/goshuin",
+            params={
+                "prefecture": ["Nara"],
+                "acquisition_method": "event",
+                "include_total": "none",
+            },
+            headers=headers,
+        )
+        assert [item["status"] for item in response.json()["items"]] == ["missed"]
+        assert response.json()["facets"] is None
+
+        response = await test_client.get(
+            "/api/goshuin",
+            params={"visited_from": "2024-04-02", "visited_to": "2024-04-03", "size": 1},
+            headers=headers,
+        )
+        data = response.json()
+        assert data["total"] == 2
+        assert [item["visit_date"] for item in data["items"]] == ["2024-04-03"]
+        response = await test_client.get(
+            "/api/goshuin",
+            params={
+                "visited_from": "2024-04-02",
+                "visited_to": "2024-04-03",
+                "size": 1,
+                "cursor": data["next_cursor"],
+            },
+            headers=headers,
+        )
+        data = response.json()
+        assert [item["visit_date"] for item in data["items"]] == ["2024-04-02"]
+        assert data["next_cursor"] is None
+
+        for params in (
+            {"min_rating": 4, "max_rating": 2},
+            {"visited_from": "2024-05-01", "visited_to": "2024-04-01"},
+            {"status": "lost"},
+        ):
+            response = await test_client.get("/api/goshuin", params=params, headers=headers)
+            assert response.status_code == 422
+
     @pytest.mark.asyncio
     async def test_create_with_rating_and_cost(
         self, test_client: AsyncClient, authenticated_user, db_session
@@ -4,6 +4,7 @@ import pytest
 from datetime import date
 from uuid import uuid4
 from httpx import AsyncClient
+from sqlalchemy import delete, update
 
 from app.models import Spot, GoshuinRecord
 
@@ -332,3 +333,99 @@ class TestPrefectureStatistics:
         assert prefectures_dict["Osaka"]["goshuin_count"] == 1
         assert prefectures_dict["Nara"]["goshuin_count"] == 0
         assert prefectures_dict["Hiroshima"]["goshuin_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_prefecture_statistics_follow_changes(
+        self, test_client: AsyncClient, authenticated_user
+    ):
+        """Test that the counters follow spots and records created, moved and deleted."""
+        headers = authenticated_user["headers"]
+
+        async def stats():
+            response = await test_client.get("/api/prefectures/stats", headers=headers)
+            assert response.status_code == 200
+            data = response.json()
+            return {
+                item["prefecture"]: (item["spot_count"], item["goshuin_count"])
+                for item in data["by_prefecture"]
+            }
+
+        spot_ids = []
+        for slug in ("counted-temple", "counted-shrine"):
+            response = await test_client.post(
+                "/api/spots/",
+                json={"name": slug, "prefecture": "Kyoto", "spot_type": "temple", "slug": slug},
+                headers=headers,
+            )
+            assert response.status_code == 201
+            spot_ids.append(response.json()["id"])
+        record_ids = []
+        for day in ("2024-01-01", "2024-01-02"):
+            response = await test_client.post(
+                f"/api/spots/{spot_ids[0]}/goshuin",
+                json={"visit_date": day, "acquisition_method": "in_person", "status": "collected"},
+                headers=headers,
+            )
+            assert response.status_code == 201
+            record_ids.append(response.json()["id"])
+        assert await stats() == {"Kyoto": (2, 2)}
+
+        response = await test_client.patch(
+            f"/api/spots/{spot_ids[0]}", json={"prefecture": "Nara"}, headers=headers
+        )
+        assert response.status_code == 200
+        assert await stats() == {"Kyoto": (1, 0), "Nara": (1, 2)}
+
+        response = await test_client.delete(f"/api/goshuin/{record_ids[0]}", headers=headers)
+        assert response.status_code == 204
+        assert await stats() == {"Kyoto": (1, 0), "Nara": (1, 1)}
+
+        response = await test_client.delete(f"/api/spots/{spot_ids[0]}", headers=headers)
+        assert response.status_code == 204
+        assert await stats() == {"Kyoto": (1, 0)}
+
+    @pytest.mark.asyncio
+    async def test_prefecture_statistics_follow_core_statements(
+        self, test_client: AsyncClient, authenticated_user, db_session
+    ):
+        """Test that the counters follow records moved between spots and cascading deletes."""
+        user = authenticated_user["user"]
+        tokyo = Spot(
+            name="Tokyo Temple", prefecture="Tokyo", spot_type="temple",
+            slug="core-tokyo", user_id=user.id,
+        )
+        osaka = Spot(
+            name="Osaka Temple", prefecture="Osaka", spot_type="temple",
+            slug="core-osaka", user_id=user.id,
+        )
+        db_session.add_all([tokyo, osaka])
+        await db_session.commit()
+        for day in (1, 2, 3):
+            db_session.add(
+                GoshuinRecord(
+                    spot_id=tokyo.id,
+                    user_id=user.id,
+                    visit_date=date(2024, 1, day),
+                    acquisition_method="in_person",
+                    status="collected",
+                )
+            )
+        await db_session.commit()
+
+        await db_session.execute(
+            update(GoshuinRecord)
+            .where(GoshuinRecord.visit_date == date(2024, 1, 1))
+            .values(spot_id=osaka.id)
+        )
+        # The foreign key removes the remaining records together with the spot
+        await db_session.execute(delete(Spot).where(Spot.id == tokyo.id))
+        await db_session.commit()
+
+        response = await test_client.get(
+            "/api/prefectures/stats", headers=authenticated_user["headers"]
+        )
+        data = response.json()
+        assert data["by_prefecture"] == [
+            {"prefecture": "Osaka", "spot_count": 1, "goshuin_count": 1}
+        ]
+        assert data["total_goshuin"] == 1
@@ -65,6 +65,16 @@ class TestSpotImages:
         assert data[1]["image_url"] == "https://example.com/image2.jpg"
         assert data[1]["is_primary"] is False
 
+        response = await test_client.get(
+            f"/api/spots/{spot.id}/images?fields=is_primary",
+            headers=authenticated_user["headers"],
+        )
+        assert response.status_code == 200
+        assert response.json() == [
+            {"id": str(image1.id), "is_primary": True},
+            {"id": str(image2.id), "is_primary": False},
+        ]
+
     @pytest.mark.asyncio
     async def test_upload_spot_image(
         self, test_client: AsyncClient, authenticated_user, db_session, mock_storage
@@ -103,6 +113,51 @@ class TestSpotImages:
         assert "image_url" in data
         assert "thumbnail_url" in data
         assert data["image_url"].startswith("https://mock-storage.example.com/")
+        assert data["nearby_spots"] == []
+
+    @pytest.mark.asyncio
+    async def test_upload_suggests_spots_near_photo_gps(
+        self, test_client: AsyncClient, authenticated_user, db_session, mock_storage
+    ):
+        """Test that an upload with GPS EXIF returns the user's nearby spots."""
+        user = authenticated_user["user"]
+        locations = {
+            "Zojoji": (35.6575, 139.7481),
+            "Tokyo Tower": (35.6586, 139.7454),
+            "Meiji Jingu": (35.6764, 139.6993),
+        }
+        spots = {}
+        for index, (name, (latitude, longitude)) in enumerate(locations.items()):
+            spots[name] = Spot(
+                name=name,
+                prefecture="Tokyo",
+                spot_type="temple",
+                slug=f"gps-{index}",
+                latitude=latitude,
+                longitude=longitude,
+                user_id=user.id,
+            )
+            db_session.add(spots[name])
+        await db_session.commit()
+
+        # 35°39'31" N 139°44'43" E, right next to Tokyo Tower
+        exif = Image.Exif()
+        exif[0x8825] = {1: "N", 2: (35.0, 39.0, 31.0), 3: "E", 4: (139.0, 44.0, 43.0)}
+        img_bytes = BytesIO()
+        Image.new("RGB", (100, 100), color="red").save(img_bytes, format="JPEG", exif=exif)
+        img_bytes.seek(0)
+
+        response = await test_client.post(
+            f"/api/spots/{spots['Meiji Jingu'].id}/images/uploads",
+            headers=authenticated_user["headers"],
+            files={"file": ("gps.jpg", img_bytes, "image/jpeg")},
+        )
+
+        assert response.status_code == 201
+        nearby = response.json()["nearby_spots"]
+        assert [spot["name"] for spot in nearby] == ["Tokyo Tower", "Zojoji"]
+        assert nearby[0]["id"] == str(spots["Tokyo Tower"].id)
+        assert nearby[0]["distance_m"] < 50
 
     @pytest.mark.asyncio
     async def test_update_spot_image_metadata(
@@ -1,10 +1,12 @@
 """Tests for spots API endpoints."""
 
 import pytest
+from datetime import date
 from uuid import uuid4
 from httpx import AsyncClient
+from sqlalchemy import event
 
-from app.models import Spot
+from app.models import GoshuinRecord, Spot, SpotImage
 
 
 class TestSpots:
@@ -116,6 +118,501 @@ class TestSpots:
         for item in data["items"]:
             assert item["prefecture"] == "Tokyo"
 
+    @pytest.mark.asyncio
+    async def test_list_spots_cursor_pagination(
+        self, test_client: AsyncClient, authenticated_user, db_session
+    ):
+        """Test walking the spot list with next_cursor."""
+        user = authenticated_user["user"]
+        # Duplicate names make the id tie-breaker matter
+        names = ["Temple A", "Temple A", "Temple B", "Shrine C", "Shrine C"]
+        for index, name in enumerate(names):
+            db_session.add(
+                Spot(
+                    name=name,
+                    prefecture="Tokyo",
+                    spot_type="temple",
+                    slug=f"cursor-spot-{index}",
+                    user_id=user.id,
+                )
+            )
+        await db_session.commit()
+
+        response = await test_client.get(
+            "/api/spots/?size=2", headers=authenticated_user["headers"]
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 5
+        assert data["page"] == 1
+        seen = [item["id"] for item in data["items"]]
+        walked = [item["name"] for item in data["items"]]
+
+        while data["next_cursor"]:
+            response = await test_client.get(
+                "/api/spots/",
+                params={"size": 2, "cursor": data["next_cursor"]},
+                headers=authenticated_user["headers"],
+            )
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total"] is None
+            assert data["page"] is None
+            seen += [item["id"] for item in data["items"]]
+            walked += [item["name"] for item in data["items"]]
+
+        assert len(set(seen)) == 5
+        assert walked == sorted(names)
+
+        response = await test_client.get(
+            "/api/spots/?cursor=not-a-cursor", headers=authenticated_user["headers"]
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_spots_within_bbox_and_radius(
+        self, test_client: AsyncClient, authenticated_user, db_session
+    ):
+        """Test map area and radius lookups, nearest first."""
+        user = authenticated_user["user"]
+        locations = {
+            "Tokyo Tower": (35.6586, 139.7454),
+            "Tokyo Skytree": (35.7101, 139.8107),
+            "Kinkakuji": (35.0394, 135.7292),
+            "Date Line Shrine": (0.5, 179.9),
+            "Unmapped Temple": (None, None),
+        }
+        for index, (name, (latitude, longitude)) in enumerate(locations.items()):
+            db_session.add(
+                Spot(
+                    name=name,
+                    prefecture="Tokyo",
+                    spot_type="temple",
+                    slug=f"within-{index}",
+                    latitude=latitude,
+                    longitude=longitude,
+                    user_id=user.id,
+                )
+            )
+        await db_session.commit()
+        headers = authenticated_user["headers"]
+
+        response = await test_client.get(
+            "/api/spots/within?near=35.6812,139.7671&radius=10000", headers=headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["name"] for item in data["items"]] == ["Tokyo Tower", "Tokyo Skytree"]
+        assert 3000 < data["items"][0]["distance_m"] < 3500
+        assert data["truncated"] is False
+
+        response = await test_client.get(
+            "/api/spots/within?near=35.6812,139.7671&radius=4000", headers=headers
+        )
+        assert [item["name"] for item in response.json()["items"]] == ["Tokyo Tower"]
+
+        response = await test_client.get(
+            "/api/spots/within?bbox=135,34,140,36&limit=2", headers=headers
+        )
+        data = response.json()
+        assert len(data["items"]) == 2
+        assert data["truncated"] is True
+
+        response = await test_client.get(
+            "/api/spots/within?bbox=179,-1,-179,1", headers=headers
+        )
+        assert [item["name"] for item in response.json()["items"]] == ["Date Line Shrine"]
+
+        for query in ("", "near=35.6,139.7", "bbox=1,2,3", "bbox=0,10,1,5&near=1,1"):
+            response = await test_client.get(f"/api/spots/within?{query}", headers=headers)
+            assert response.status_code == 422, query
+
+    @pytest.mark.asyncio
+    async def test_spot_clusters(self, test_client: AsyncClient, authenticated_user, db_session):
+        """Test clustering spots per zoom and refreshing clusters after writes."""
+        user = authenticated_user["user"]
+        locations = [(35.6586, 139.7454), (35.7101, 139.8107), (35.0394, 135.7292)]
+        for index, (latitude, longitude) in enumerate(locations):
+            db_session.add(
+                Spot(
+                    name=f"Cluster Temple {index}",
+                    prefecture="Tokyo",
+                    spot_type="temple",
+                    slug=f"cluster-{index}",
+                    latitude=latitude,
+                    longitude=longitude,
+                    user_id=user.id,
+                )
+            )
+        await db_session.commit()
+        headers = authenticated_user["headers"]
+
+        response = await test_client.get(
+            "/api/spots/clusters?bbox=122,24,146,46&zoom=4", headers=headers
+        )
+        assert response.status_code == 200
+        clusters = response.json()["clusters"]
+        assert [cluster["count"] for cluster in clusters] == [3]
+        assert clusters[0]["bounds"] == [135.7292, 35.0394, 139.8107, 35.7101]
+
+        response = await test_client.get(
+            "/api/spots/clusters?bbox=122,24,146,46&zoom=8", headers=headers
+        )
+        clusters = response.json()["clusters"]
+        assert sorted(cluster["count"] for cluster in clusters) == [1, 2]
+        single = next(cluster for cluster in clusters if cluster["count"] == 1)
+        assert single["spot_id"] is not None
+        assert single["latitude"] == pytest.approx(35.0394)
+
+        response = await test_client.post(
+            "/api/spots/",
+            json={
+                "name": "Cluster Temple 3",
+                "prefecture": "Kyoto",
+                "spot_type": "temple",
+                "slug": "cluster-3",
+                "latitude": 35.0116,
+                "longitude": 135.7681,
+            },
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+        # Only the Kyoto cell is in this viewport, and it includes the new spot
+        for zoom in (8, 16):
+            response = await test_client.get(
+                f"/api/spots/clusters?bbox=135,34.5,136.5,35.5&zoom={zoom}", headers=headers
+            )
+            clusters = response.json()["clusters"]
+            assert sum(cluster["count"] for cluster in clusters) == 2
+
+        response = await test_client.get(
+            "/api/spots/clusters?bbox=1,2,3&zoom=4", headers=headers
+        )
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_list_spots_total_modes(
+        self, test_client: AsyncClient, authenticated_user, db_session
+    ):
+        """Test skipping and estimating the total of the spot list."""
+        user = authenticated_user["user"]
+        for index in range(3):
+            db_session.add(
+                Spot(
+                    name=f"Total Temple {index}",
+                    prefecture="Nara",
+                    spot_type="temple",
+                    slug=f"total-temple-{index}",
+                    user_id=user.id,
+                )
+            )
+        await db_session.commit()
+        headers = authenticated_user["headers"]
+
+        response = await test_client.get(
+            "/api/spots/?size=2&include_total=none", headers=headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] is None
+        assert len(data["items"]) == 2
+        assert data["next_cursor"] is not None
+
+        response = await test_client.get(
+            "/api/spots/?size=2&page=2&include_total=none", headers=headers
+        )
+        data = response.json()
+        assert len(data["items"]) == 1
+        assert data["next_cursor"] is None
+
+        response = await test_client.get(
+            "/api/spots/?prefecture=Nara&include_total=estimated", headers=headers
+        )
+        assert response.status_code == 200
+        assert response.json()["total"] == 3
+
+        # Writes through the API drop the cached estimate
+        response = await test_client.post(
+            "/api/spots/",
+            json={
+                "name": "Total Temple 3",
+                "prefecture": "Nara",
+                "spot_type": "temple",
+                "slug": "total-temple-3",
+            },
+            headers=headers,
+        )
+        assert response.status_code == 201
+        response = await test_client.get(
+            "/api/spots/?prefecture=Nara&include_total=estimated", headers=headers
+        )
+        assert response.json()["total"] == 4
+
+    @pytest.mark.asyncio
+    async def test_list_spots_with_summary(
+        self, test_client: AsyncClient, authenticated_user, db_session
+    ):
+        """Test embedding the primary image and visit history in the spot list."""
+        user = authenticated_user["user"]
+        visited = Spot(
+            name="Summary Shrine",
+            prefecture="Kyoto",
+            spot_type="shrine",
+            slug="summary-shrine",
+            user_id=user.id,
+        )
+        unvisited = Spot(
+            name="Summary Temple",
+            prefecture="Kyoto",
+            spot_type="temple",
+            slug="summary-temple",
+            user_id=user.id,
+        )
+        db_session.add_all([visited, unvisited])
+        await db_session.flush()
+        primary = SpotImage(
+            spot_id=visited.id,
+            image_url="https://example.com/primary.jpg",
+            thumbnail_url="https://example.com/primary_thumbnail.webp",
+            image_type="exterior",
+            is_primary=True,
+            display_order=1,
+        )
+        db_session.add_all(
+            [
+                primary,
+                SpotImage(
+                    spot_id=visited.id,
+                    image_url="https://example.com/other.jpg",
+                    image_type="interior",
+                    is_primary=False,
+                    display_order=0,
+                ),
+                *(
+                    GoshuinRecord(
+                        spot_id=visited.id,
+                        user_id=user.id,
+                        visit_date=visit_date,
+                        acquisition_method="in_person",
+                        status="collected",
+                    )
+                    for visit_date in (date(2024, 1, 15), date(2024, 5, 3))
+                ),
+            ]
+        )
+        await db_session.commit()
+        headers = authenticated_user["headers"]
+
+        response = await test_client.get("/api/spots/", headers=headers)
+        assert response.status_code == 200
+        assert all(item["summary"] is None for item in response.json()["items"])
+
+        for query in ("include_summary=true", "include_summary=true&include_total=none"):
+            response = await test_client.get(f"/api/spots/?{query}", headers=headers)
+            assert response.status_code == 200
+            summaries = {item["name"]: item["summary"] for item in response.json()["items"]}
+            assert summaries["Summary Shrine"] == {
+                "primary_image_id": str(primary.id),
+                "primary_image_url": "https://example.com/primary.jpg",
+                "primary_thumbnail_url": "https://example.com/primary_thumbnail.webp",
+                "goshuin_count": 2,
+                "last_visit_date": "2024-05-03",
+            }
+            assert summaries["Summary Temple"] == {
+                "primary_image_id": None,
+                "primary_image_url": None,
+                "primary_thumbnail_url": None,
+                "goshuin_count": 0,
+                "last_visit_date": None,
+            }
+
+        response = await test_client.get(
+            "/api/spots/?size=1&include_summary=true", headers=headers
+        )
+        cursor = response.json()["next_cursor"]
+        response = await test_client.get(
+            f"/api/spots/?size=1&include_summary=true&cursor={cursor}", headers=headers
+        )
+        assert response.status_code == 200
+        [item] = response.json()["items"]
+        assert item["name"] == "Summary Temple"
+        assert item["summary"]["goshuin_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_spot_sparse_fieldsets(
+        self, test_client: AsyncClient, authenticated_user, db_session, engine
+    ):
+        """Test narrowing the spot list and detail with fields."""
+        user = authenticated_user["user"]
+        spots = [
+            Spot(
+                name=f"Sparse Shrine {index}",
+                prefecture="Kyoto",
+                spot_type="shrine",
+                slug=f"sparse-shrine-{index}",
+                description="A long description nobody on the map needs",
+                latitude=35.0 + index,
+                longitude=135.7,
+                user_id=user.id,
+            )
+            for index in range(3)
+        ]
+        db_session.add_all(spots)
+        await db_session.commit()
+        headers = authenticated_user["headers"]
+
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", record)
+        try:
+            response = await test_client.get(
+                "/api/spots/?size=2&fields=name,latitude,longitude", headers=headers
+            )
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", record)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        assert data["items"][0] == {
+            "id": str(spots[0].id),
+            "name": "Sparse Shrine 0",
+            "latitude": 35.0,
+            "longitude": 135.7,
+        }
+        listing = next(sql for sql in statements if "LIMIT" in sql)
+        assert "spots.latitude" in listing
+        assert "spots.description" not in listing
+
+        response = await test_client.get(
+            "/api/spots/",
+            params={"size": 2, "fields": "name", "cursor": data["next_cursor"]},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["items"] == [{"id": str(spots[2].id), "name": "Sparse Shrine 2"}]
+
+        response = await test_client.get(
+            "/api/spots/?fields=slug&include_summary=true&include_total=none", headers=headers
+        )
+        assert response.status_code == 200
+        item = response.json()["items"][0]
+        assert set(item) == {"id", "slug", "summary"}
+        assert item["summary"]["goshuin_count"] == 0
+
+        response = await test_client.get(
+            f"/api/spots/{spots[1].id}?fields=slug,spot_type", headers=headers
+        )
+        assert response.status_code == 200
+        assert response.json() == {
+            "id": str(spots[1].id),
+            "slug": "sparse-shrine-1",
+            "spot_type": "shrine",
+        }
+
+        for url in (
+            "/api/spots/?fields=name,password",
+            "/api/spots/?fields=",
+            f"/api/spots/{spots[0].id}?fields=summary",
+        ):
+            response = await test_client.get(url, headers=headers)
+            assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_and_update_spots(
+        self, test_client: AsyncClient, authenticated_user, db_session
+    ):
+        """Test bulk spot writes reporting errors per item."""
+        user = authenticated_user["user"]
+        existing = Spot(
+            name="Existing Shrine",
+            prefecture="Kyoto",
+            spot_type="shrine",
+            slug="existing-shrine",
+            user_id=user.id,
+        )
+        db_session.add(existing)
+        await db_session.commit()
+        headers = authenticated_user["headers"]
+
+        def spot(slug: str, **extra):
+            return {
+                "name": slug.title(),
+                "prefecture": "Nara",
+                "spot_type": "temple",
+                "slug": slug,
+                **extra,
+            }
+
+        response = await test_client.post(
+            "/api/spots/bulk",
+            json={
+                "items": [
+                    spot("bulk-temple-a"),
+                    spot("existing-shrine"),
+                    spot("bulk-temple-b", latitude=34.7, longitude=135.8),
+                    {"prefecture": "Nara", "spot_type": "temple", "slug": "no-name"},
+                    spot("bulk-temple-a"),
+                    spot("no-prefecture", prefecture=None),
+                ]
+            },
+            headers=headers,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [(item["index"], item["slug"]) for item in data["items"]] == [
+            (0, "bulk-temple-a"),
+            (2, "bulk-temple-b"),
+        ]
+        assert data["items"][1]["latitude"] == 34.7
+        assert [(error["index"], error["code"]) for error in data["errors"]] == [
+            (1, "conflict"),
+            (3, "invalid"),
+            (4, "conflict"),
+            (5, "rejected"),
+        ]
+        assert "name" in data["errors"][1]["message"]
+        created = {item["slug"]: item["id"] for item in data["items"]}
+
+        response = await test_client.patch(
+            "/api/spots/bulk",
+            json={
+                "items": [
+                    {"id": created["bulk-temple-a"], "name": "Renamed Temple"},
+                    {"id": created["bulk-temple-b"], "slug": "existing-shrine"},
+                    {"id": str(uuid4()), "name": "Missing"},
+                    {"id": str(existing.id), "description": "Updated", "city": "Kyoto"},
+                    {"id": created["bulk-temple-a"], "city": "Nara"},
+                    {"id": str(existing.id)},
+                ]
+            },
+            headers=headers,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [(item["index"], item["name"]) for item in data["items"]] == [
+            (0, "Renamed Temple"),
+            (3, "Existing Shrine"),
+        ]
+        assert data["items"][1]["description"] == "Updated"
+        assert [(error["index"], error["code"]) for error in data["errors"]] == [
+            (1, "conflict"),
+            (2, "not_found"),
+            (4, "invalid"),
+            (5, "invalid"),
+        ]
+
+        response = await test_client.get(
+            f"/api/spots/{created['bulk-temple-b']}", headers=headers
+        )
+        assert response.json()["slug"] == "bulk-temple-b"
+
+        response = await test_client.post("/api/spots/bulk", json={"items": []}, headers=headers)
+        assert response.status_code == 422
+
     @pytest.mark.asyncio
     async def test_get_spot(self, test_client: AsyncClient, authenticated_user, db_session):
         """Test getting a specific spot."""
@@ -266,3 +763,156 @@ class TestSpots:
         # Should find the Meiji Shrine
         found = any(item["name"] == "Meiji Shrine" for item in data["items"])
         assert found
+
+    @pytest.mark.asyncio
+    async def test_search_spots_ranks_and_highlights_matches(
+        self, test_client: AsyncClient, authenticated_user, db_session
+    ):
+        """Keyword search should rank name matches first and return snippets."""
+        user = authenticated_user["user"]
+        db_session.add_all(
+            [
+                Spot(
+                    name="明治神宮",
+                    prefecture="東京都",
+                    address="渋谷区代々木神園町1-1",
+                    description="明治天皇を祀る神社。初詣の参拝者数は日本一です。",
+                    spot_type="shrine",
+                    slug="meiji-jingu",
+                    user_id=user.id,
+                ),
+                Spot(
+                    name="東郷神社",
+                    prefecture="東京都",
+                    address="渋谷区神宮前1-5-3",
+                    description="明治神宮の近くにある神社です。",
+                    spot_type="shrine",
+                    slug="togo-jinja",
+                    user_id=user.id,
+                ),
+                Spot(
+                    name="浅草寺",
+                    prefecture="東京都",
+                    address="台東区浅草2-3-1",
+                    spot_type="temple",
+                    slug="sensoji",
+                    user_id=user.id,
+                ),
+            ]
+        )
+        await db_session.commit()
+
+        response = await test_client.get(
+            "/api/spots/search",
+            params={"q": "明治神宮"},
+            headers=authenticated_user["headers"],
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        assert [item["name"] for item in data["items"]] == ["明治神宮", "東郷神社"]
+        assert data["items"][0]["rank"] > data["items"][1]["rank"]
+        assert data["items"][1]["snippet"] == "<mark>明治神宮</mark>の近くにある神社です。"
+
+        listed = await test_client.get(
+            "/api/spots/",
+            params={"keyword": "渋谷区"},
+            headers=authenticated_user["headers"],
+        )
+        assert {item["name"] for item in listed.json()["items"]} == {"明治神宮", "東郷神社"}
+
+    @pytest.mark.asyncio
+    async def test_search_spots_matches_words_and_escapes_wildcards(
+        self, test_client: AsyncClient, authenticated_user, db_session
+    ):
+        """Every term has to match and LIKE wildcards are taken literally."""
+        user = authenticated_user["user"]
+        db_session.add_all(
+            [
+                Spot(
+                    name="Meiji Shrine",
+                    prefecture="Tokyo",
+                    description="A shrine in a <forest> near Harajuku",
+                    spot_type="shrine",
+                    slug="meiji-shrine",
+                    user_id=user.id,
+                ),
+                Spot(
+                    name="Senso-ji Temple",
+                    prefecture="Tokyo",
+                    description="100% the oldest temple in Tokyo",
+                    spot_type="temple",
+                    slug="senso-ji-temple",
+                    user_id=user.id,
+                ),
+            ]
+        )
+        await db_session.commit()
+
+        response = await test_client.get(
+            "/api/spots/search",
+            params={"q": "forest shrine"},
+            headers=authenticated_user["headers"],
+        )
+        items = response.json()["items"]
+        assert [item["name"] for item in items] == ["Meiji Shrine"]
+        assert items[0]["snippet"] == (
+            "A <mark>shrine</mark> in a &lt;<mark>forest</mark>&gt; near Harajuku"
+        )
+
+        wildcard = await test_client.get(
+            "/api/spots/search", params={"q": "%"}, headers=authenticated_user["headers"]
+        )
+        assert [item["name"] for item in wildcard.json()["items"]] == ["Senso-ji Temple"]
+
+    @pytest.mark.asyncio
+    async def test_suggest_spots_prefers_prefix_matches(
+        self, test_client: AsyncClient, authenticated_user, db_session
+    ):
+        """Suggestions should list prefix matches before names containing the text."""
+        user = authenticated_user["user"]
+        for name, slug in (
+            ("Kanda Myojin", "kanda-myojin"),
+            ("Tokyo Daijingu", "tokyo-daijingu"),
+            ("Meiji Jingu", "meiji-jingu"),
+            ("Jindaiji", "jindaiji"),
+        ):
+            db_session.add(
+                Spot(name=name, slug=slug, prefecture="Tokyo", spot_type="shrine", user_id=user.id)
+            )
+        await db_session.commit()
+
+        response = await test_client.get(
+            "/api/spots/suggest", params={"q": "jin"}, headers=authenticated_user["headers"]
+        )
+        assert response.status_code == 200
+        assert [item["name"] for item in response.json()] == [
+            "Jindaiji",
+            "Kanda Myojin",
+            "Meiji Jingu",
+            "Tokyo Daijingu",
+        ]
+
+        by_slug = await test_client.get(
+            "/api/spots/suggest",
+            params={"q": "kanda-", "limit": 1},
+            headers=authenticated_user["headers"],
+        )
+        assert [item["slug"] for item in by_slug.json()] == ["kanda-myojin"]
+
+        created = await test_client.post(
+            "/api/spots/",
+            json={
+                "name": "Jingu Gaien",
+                "slug": "jingu-gaien",
+                "prefecture": "Tokyo",
+                "spot_type": "other",
+            },
+            headers=authenticated_user["headers"],
+        )
+        assert created.status_code == 201
+        refreshed = await test_client.get(
+            "/api/spots/suggest", params={"q": "jin"}, headers=authenticated_user["headers"]
+        )
+        assert [item["name"] for item in refreshed.json()][:2] == ["Jindaiji", "Jingu Gaien"]
@@ -0,0 +1,134 @@
+"""Tests for the sync change feed endpoint."""
+
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+
+from app.models import (
+    GoshuinAcquisitionMethod,
+    GoshuinRecord,
+    GoshuinStatus,
+    Spot,
+    SpotImage,
+    SpotImageType,
+    SpotType,
+)
+from app.services.sync import encode_sync_token
+
+
+async def _create_spot_with_children(db_session, user) -> Spot:
+    spot = Spot(
+        id=uuid4(),
+        user_id=user.id,
+        slug=f"sync-{uuid4()}",
+        name="Sync Spot",
+        spot_type=SpotType.SHRINE,
+        prefecture="Tokyo",
+    )
+    db_session.add(spot)
+    await db_session.flush()
+    db_session.add_all(
+        [
+            SpotImage(
+                id=uuid4(),
+                spot_id=spot.id,
+                image_url="https://example.com/sync.jpg",
+                image_type=SpotImageType.EXTERIOR,
+            ),
+            GoshuinRecord(
+                id=uuid4(),
+                user_id=user.id,
+                spot_id=spot.id,
+                visit_date=date(2024, 5, 5),
+                acquisition_method=GoshuinAcquisitionMethod.IN_PERSON,
+                status=GoshuinStatus.COLLECTED,
+            ),
+        ]
+    )
+    await db_session.commit()
+    return spot
+
+
+class TestSync:
+    """Test suite for the sync endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_initial_sync_returns_everything(
+        self, test_client: AsyncClient, authenticated_user, db_session
+    ):
+        spot = await _create_spot_with_children(db_session, authenticated_user["user"])
+
+        response = await test_client.get(
+            "/api/sync/changes", headers=authenticated_user["headers"]
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data["spots"]] == [str(spot.id)]
+        assert data["spot_images"][0]["spot_id"] == str(spot.id)
+        assert data["goshuin_records"][0]["spot_id"] == str(spot.id)
+        assert data["deleted"] == []
+        assert data["sync_token"]
+
+    @pytest.mark.asyncio
+    async def test_sync_only_returns_changes_after_token(
+        self, test_client: AsyncClient, authenticated_user, db_session
+    ):
+        await _create_spot_with_children(db_session, authenticated_user["user"])
+        now = datetime.now(timezone.utc)
+
+        later = await test_client.get(
+            "/api/sync/changes",
+            params={"since": encode_sync_token(now + timedelta(hours=1))},
+            headers=authenticated_user["headers"],
+        )
+        earlier = await test_client.get(
+            "/api/sync/changes",
+            params={"since": encode_sync_token(now - timedelta(hours=1))},
+            headers=authenticated_user["headers"],
+        )
+
+        assert later.json()["spots"] == []
+        assert later.json()["goshuin_records"] == []
+        assert len(earlier.json()["spots"]) == 1
+        assert len(earlier.json()["spot_images"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_sync_reports_deleted_entities(
+        self, test_client: AsyncClient, authenticated_user, db_session
+    ):
+        spot = await _create_spot_with_children(db_session, authenticated_user["user"])
+        initial = await test_client.get(
+            "/api/sync/changes", headers=authenticated_user["headers"]
+        )
+
+        deleted = await test_client.delete(
+            f"/api/spots/{spot.id}", headers=authenticated_user["headers"]
+        )
+        assert deleted.status_code == 204
+
+        response = await test_client.get(
+            "/api/sync/changes",
+            params={"since": initial.json()["sync_token"]},
+            headers=authenticated_user["headers"],
+        )
+
+        data = response.json()
+        assert data["spots"] == []
+        assert {"entity_type": "spot", "id": str(spot.id)} in [
+            {"entity_type": item["entity_type"], "id": item["id"]} for item in data["deleted"]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sync_rejects_invalid_token(
+        self, test_client: AsyncClient, authenticated_user
+    ):
+        response = await test_client.get(
+            "/api/sync/changes",
+            params={"since": "not-a-token"},
+            headers=authenticated_user["headers"],
+        )
+
+        assert response.status_code == 400
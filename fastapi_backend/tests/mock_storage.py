@@ -26,6 +26,13 @@ class MockStorageBackend:
         """Build a URL for the given key."""
         return f"{self.base_url}/{key}"
 
+    def download(self, *, key: str, byte_range: tuple[int, int] | None = None) -> bytes:
+        """Read data from in-memory storage, optionally limited to a byte range."""
+        data = self.storage[key]
+        if byte_range is None:
+            return data
+        return data[byte_range[0] : byte_range[1] + 1]
+
     @property
     def supports_deferred_upload(self) -> bool:
         """Mock backend supports deferred uploads."""
@@ -0,0 +1,74 @@
+"""Tests for the estimated total cache."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from sqlalchemy import select
+
+from app.models import Spot
+from app.services.counts import TotalCountService
+
+
+@pytest.mark.asyncio
+async def test_estimate_is_cached_per_user_and_key(authenticated_user, db_session) -> None:
+    now = [0.0]
+    service = TotalCountService(ttl=10, clock=lambda: now[0])
+    user = authenticated_user["user"]
+    query = select(Spot).where(Spot.user_id == user.id)
+    db_session.add(
+        Spot(
+            name="Cached Temple",
+            prefecture="Kyoto",
+            spot_type="temple",
+            slug="cached-temple",
+            user_id=user.id,
+        )
+    )
+    await db_session.commit()
+
+    assert await service.estimate(db_session, user.id, ("spots",), query) == 1
+
+    db_session.add(
+        Spot(
+            name="Later Temple",
+            prefecture="Kyoto",
+            spot_type="temple",
+            slug="later-temple",
+            user_id=user.id,
+        )
+    )
+    await db_session.commit()
+    assert await service.estimate(db_session, user.id, ("spots",), query) == 1
+    assert await service.estimate(db_session, user.id, ("spots", "other"), query) == 2
+    assert await service.estimate(db_session, uuid.uuid4(), ("spots",), query) == 2
+
+    now[0] = 11.0
+    assert await service.estimate(db_session, user.id, ("spots",), query) == 2
+
+    db_session.add(
+        Spot(
+            name="Third Temple",
+            prefecture="Kyoto",
+            spot_type="temple",
+            slug="third-temple",
+            user_id=user.id,
+        )
+    )
+    await db_session.commit()
+    service.invalidate(user.id)
+    assert await service.estimate(db_session, user.id, ("spots",), query) == 3
+
+
+@pytest.mark.asyncio
+async def test_large_sets_use_the_planner_estimate(authenticated_user, db_session) -> None:
+    service = TotalCountService(exact_below=0)
+    user = authenticated_user["user"]
+
+    estimate = await service.estimate(
+        db_session, user.id, ("spots",), select(Spot).where(Spot.user_id == user.id)
+    )
+
+    assert isinstance(estimate, int)
+    assert estimate >= 0
@@ -0,0 +1,174 @@
+"""Tests for the set-based import writer."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import select
+
+from app.models import GoshuinImage, GoshuinRecord, Spot, SpotImage, User
+from app.services import ExportBundle, ExportService, ImportWriter
+
+
+def _bundle(user: User, spot_id: uuid.UUID, record_id: uuid.UUID) -> ExportBundle:
+    now = datetime(2024, 1, 1, 12, 0)
+    return ExportBundle.model_validate(
+        {
+            "generated_at": now,
+            "user": {"id": user.id, "email": user.email},
+            "spots": [
+                {
+                    "id": spot_id,
+                    "user_id": user.id,
+                    "slug": f"import-{spot_id}",
+                    "name": "Imported Spot",
+                    "spot_type": "temple",
+                    "prefecture": "Tokyo",
+                    "city": None,
+                    "address": None,
+                    "latitude": None,
+                    "longitude": None,
+                    "description": None,
+                    "website_url": None,
+                    "phone_number": None,
+                    "created_at": now,
+                    "updated_at": now,
+                    "images": [
+                        {
+                            "id": uuid.uuid4(),
+                            "image_url": "https://example.com/spot.jpg",
+                            "image_type": "exterior",
+                            "is_primary": True,
+                            "display_order": 0,
+                            "created_at": now,
+                        }
+                    ],
+                    "goshuin_records": [
+                        {
+                            "id": record_id,
+                            "user_id": user.id,
+                            "spot_id": spot_id,
+                            "visit_date": date(2023, 3, 1),
+                            "acquisition_method": "in_person",
+                            "status": "collected",
+                            "rating": 3,
+                            "notes": "Imported",
+                            "created_at": now,
+                            "updated_at": now,
+                            "images": [
+                                {
+                                    "id": uuid.uuid4(),
+                                    "image_url": "https://example.com/stamp.jpg",
+                                    "image_type": "stamp_front",
+                                    "display_order": 0,
+                                    "created_at": now,
+                                }
+                            ],
+                        }
+                    ],
+                }
+            ],
+        }
+    )
+
+
+async def _create_user(db_session, email: str) -> User:
+    user = User(
+        id=uuid.uuid4(),
+        email=email,
+        hashed_password="x",
+        is_active=True,
+        is_superuser=False,
+        is_verified=True,
+    )
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+@pytest.mark.asyncio
+async def test_import_from_bundle_upserts_all_entities(db_session):
+    user = await _create_user(db_session, "importer@example.com")
+    spot_id, record_id = uuid.uuid4(), uuid.uuid4()
+    bundle = _bundle(user, spot_id, record_id)
+    service = ExportService()
+
+    result = await service.import_from_bundle(db_session, user, bundle)
+    assert result.as_dict() == {
+        "spots": 1,
+        "goshuin_records": 1,
+        "spot_images": 1,
+        "goshuin_images": 1,
+    }
+
+    bundle.spots[0].name = "Renamed Spot"
+    bundle.spots[0].goshuin_records[0].notes = "Updated"
+    second = await service.import_from_bundle(db_session, user, bundle)
+    assert second.spots == 1
+
+    db_session.expire_all()
+    spot = (await db_session.execute(select(Spot).where(Spot.id == spot_id))).scalar_one()
+    record = (
+        await db_session.execute(select(GoshuinRecord).where(GoshuinRecord.id == record_id))
+    ).scalar_one()
+    assert spot.name == "Renamed Spot"
+    assert record.notes == "Updated"
+    assert len((await db_session.execute(select(SpotImage))).scalars().all()) == 1
+    assert len((await db_session.execute(select(GoshuinImage))).scalars().all()) == 1
+
+
+@pytest.mark.asyncio
+async def test_import_writer_skips_rows_owned_by_other_users(db_session):
+    owner = await _create_user(db_session, "owner@example.com")
+    intruder = await _create_user(db_session, "intruder@example.com")
+    spot_id, record_id = uuid.uuid4(), uuid.uuid4()
+    await ExportService().import_from_bundle(
+        db_session, owner, _bundle(owner, spot_id, record_id)
+    )
+
+    hostile = _bundle(intruder, spot_id, record_id)
+    hostile.spots[0].name = "Hijacked"
+    writer = ImportWriter(db_session, intruder)
+    exported_spot = hostile.spots[0]
+    writer.add_spot(exported_spot.model_dump(exclude={"images", "goshuin_records", "user_id"}))
+    record = exported_spot.goshuin_records[0]
+    writer.add_goshuin_record(
+        record.model_dump(exclude={"images", "user_id"}), exported_spot.id
+    )
+    result = await writer.flush()
+    await db_session.commit()
+
+    assert result.spots == 0
+    assert result.goshuin_records == 0
+    owner_id = owner.id
+    db_session.expire_all()
+    spot = (await db_session.execute(select(Spot).where(Spot.id == spot_id))).scalar_one()
+    assert spot.name == "Imported Spot"
+    assert spot.user_id == owner_id
+
+
+@pytest.mark.asyncio
+async def test_import_writer_keeps_last_duplicate_row(db_session):
+    user = await _create_user(db_session, "duplicates@example.com")
+    spot_id = uuid.uuid4()
+    exported_spot = _bundle(user, spot_id, uuid.uuid4()).spots[0]
+    row = exported_spot.model_dump(exclude={"images", "goshuin_records", "user_id"})
+    image = exported_spot.images[0].model_dump()
+
+    writer = ImportWriter(db_session, user, batch_size=1)
+    writer.add_spot({**row, "name": "First"})
+    writer.add_spot({**row, "name": "Second"})
+    writer.add_spot_image(image, spot_id)
+    writer.add_spot_image({**image, "image_url": "https://example.com/last.jpg"}, spot_id)
+    result = await writer.flush()
+    await db_session.commit()
+
+    assert result.spots == 1
+    assert result.spot_images == 1
+    db_session.expire_all()
+    spot = (await db_session.execute(select(Spot).where(Spot.id == spot_id))).scalar_one()
+    image_url = (await db_session.execute(select(SpotImage.image_url))).scalar_one()
+    assert spot.name == "Second"
+    assert image_url == "https://example.com/last.jpg"
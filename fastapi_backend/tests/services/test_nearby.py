@@ -0,0 +1,40 @@
+"""Tests for the in-memory spot location grid."""
+
+from __future__ import annotations
+
+import uuid
+
+from app.services.nearby import SpotLocationGrid, _LocatedSpot
+
+
+def _spot(name: str, latitude: float, longitude: float) -> _LocatedSpot:
+    return _LocatedSpot(
+        id=uuid.uuid4(), name=name, slug=name.lower(), latitude=latitude, longitude=longitude
+    )
+
+
+def test_nearest_orders_by_distance_across_cells() -> None:
+    grid = SpotLocationGrid(
+        [
+            _spot("East", 35.0, 135.0046),
+            _spot("North", 35.0018, 135.0),
+            _spot("Far", 35.05, 135.0),
+        ]
+    )
+
+    found = grid.nearest(35.0, 135.0, radius_m=500, limit=5)
+
+    assert [spot.name for _, spot in found] == ["North", "East"]
+    assert 190 < found[0][0] < 210
+    assert [spot.name for _, spot in grid.nearest(35.0, 135.0, radius_m=500, limit=1)] == [
+        "North"
+    ]
+    assert len(grid) == 3
+
+
+def test_nearest_wraps_the_antimeridian() -> None:
+    grid = SpotLocationGrid([_spot("West", 0.0, -179.9995), _spot("East", 0.0, 179.9995)])
+
+    found = grid.nearest(0.0, 179.9999, radius_m=300, limit=5)
+
+    assert sorted(spot.name for _, spot in found) == ["East", "West"]
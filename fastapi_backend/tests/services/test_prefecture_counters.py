@@ -0,0 +1,69 @@
+"""Tests for the prefecture counter rebuild."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from sqlalchemy import select, update
+
+from app.models import GoshuinRecord, PrefectureCounter, Spot
+from app.services.prefecture_counters import rebuild_prefecture_counters
+
+
+async def _counters(db_session, user_id):
+    rows = await db_session.execute(
+        select(
+            PrefectureCounter.prefecture,
+            PrefectureCounter.spot_count,
+            PrefectureCounter.goshuin_count,
+        )
+        .where(PrefectureCounter.user_id == user_id)
+        .order_by(PrefectureCounter.prefecture)
+    )
+    return [tuple(row) for row in rows]
+
+
+@pytest.mark.asyncio
+async def test_rebuild_repairs_drifted_counters(authenticated_user, db_session) -> None:
+    user = authenticated_user["user"]
+    spots = [
+        Spot(
+            name=f"{prefecture} Temple",
+            prefecture=prefecture,
+            spot_type="temple",
+            slug=f"rebuild-{index}",
+            user_id=user.id,
+        )
+        for index, prefecture in enumerate(("Kyoto", "Nara", "Kyoto"))
+    ]
+    db_session.add_all(spots)
+    await db_session.commit()
+    db_session.add_all(
+        GoshuinRecord(
+            spot_id=spot.id,
+            user_id=user.id,
+            visit_date=date(2024, 3, 1),
+            acquisition_method="in_person",
+            status="collected",
+        )
+        for spot in spots
+    )
+    await db_session.commit()
+    expected = [("Kyoto", 2, 2), ("Nara", 1, 1)]
+    assert await _counters(db_session, user.id) == expected
+
+    await db_session.execute(
+        update(PrefectureCounter)
+        .where(PrefectureCounter.user_id == user.id)
+        .values(spot_count=7, goshuin_count=0)
+    )
+    await db_session.commit()
+
+    assert await rebuild_prefecture_counters(db_session, user.id) == 2
+    await db_session.commit()
+    assert await _counters(db_session, user.id) == expected
+
+    assert await rebuild_prefecture_counters(db_session) >= 2
+    await db_session.commit()
+    assert await _counters(db_session, user.id) == expected
@@ -0,0 +1,56 @@
+"""Tests for the spot suggestion cache."""
+
+from __future__ import annotations
+
+import uuid
+
+from app.schemas import SpotSuggestion
+from app.services.suggest import SpotSuggestionCache
+
+
+def _suggestion(name: str, slug: str) -> SpotSuggestion:
+    return SpotSuggestion(id=uuid.uuid4(), name=name, slug=slug)
+
+
+def test_cache_narrows_complete_shorter_prefix() -> None:
+    cache = SpotSuggestionCache()
+    user_id = uuid.uuid4()
+    cache.set(
+        user_id,
+        "me",
+        5,
+        [
+            _suggestion("Meiji Jingu", "meiji-jingu"),
+            _suggestion("Meoto Iwa", "meoto-iwa"),
+            _suggestion("Hachimangu", "me-hachiman"),
+            _suggestion("Tokyo Meiji Kinenkan", "kinenkan"),
+        ],
+    )
+
+    narrowed = cache.get(user_id, "mei", 5)
+
+    assert narrowed is not None
+    assert [suggestion.name for suggestion in narrowed] == [
+        "Meiji Jingu",
+        "Tokyo Meiji Kinenkan",
+    ]
+    assert cache.get(user_id, "meiji", 1) is not None
+
+
+def test_cache_misses_when_shorter_prefix_was_truncated_or_expired() -> None:
+    now = [0.0]
+    cache = SpotSuggestionCache(ttl=10, clock=lambda: now[0])
+    user_id = uuid.uuid4()
+    cache.set(user_id, "a", 1, [_suggestion("Atsuta Jingu", "atsuta-jingu")])
+    cache.set(user_id, "i", 5, [_suggestion("Ise Jingu", "ise-jingu")])
+
+    assert cache.get(user_id, "at", 1) is None
+    assert cache.get(user_id, "is", 5) is not None
+
+    now[0] = 11.0
+    assert cache.get(user_id, "i", 5) is None
+    assert cache.get(user_id, "ise", 5) is None
+
+    cache.set(user_id, "i", 5, [])
+    cache.invalidate(user_id)
+    assert cache.get(user_id, "i", 5) is None
@@ -0,0 +1,133 @@
+"""Query plan regression tests for the hot list and detail routes.
+
+Each route is called against seeded collections while its SQL is recorded,
+then every recorded ``SELECT`` is run again under ``EXPLAIN`` with sequential
+scans disabled. The planner still picks a sequential scan when no index can
+serve a query, so one showing up on a large table means an access path lost
+its index.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from urllib.parse import quote
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, select, text
+
+from app.models import GoshuinRecord, Spot
+from app.users import get_jwt_strategy
+from benchmarks.seed import PREFECTURES, SeedProfile, seed_user
+
+HOT_TABLES = {
+    "spots",
+    "goshuin_records",
+    "spot_images",
+    "goshuin_images",
+    "prefecture_counters",
+}
+
+ROUTES = [
+    "/api/spots/",
+    "/api/spots/?page=3&size=20",
+    "/api/spots/?prefecture={prefecture}",
+    "/api/spots/?include_total=none",
+    "/api/spots/?include_summary=true",
+    "/api/spots/?cursor={spot_cursor}",
+    "/api/spots/{spot_id}",
+    "/api/spots/within?bbox=135,34,136,35",
+    "/api/spots/within?near=35.0,135.5&radius=20000",
+    "/api/spots/clusters?bbox=122,24,146,46&zoom=5",
+    "/api/spots/clusters?bbox=135,34,136,35&zoom=14",
+    "/api/goshuin",
+    "/api/goshuin?sort_order=asc",
+    "/api/goshuin?spot_id={spot_id}",
+    "/api/goshuin?cursor={goshuin_cursor}",
+    "/api/goshuin?status=collected&include_facets=true",
+    "/api/goshuin?visited_from=2024-01-01&min_rating=3&prefecture={prefecture}&spot_type=temple",
+    "/api/goshuin/{record_id}",
+    "/api/prefectures/stats",
+]
+
+
+def _seq_scans(plan: dict[str, Any]) -> list[str]:
+    scans = []
+    if plan["Node Type"] == "Seq Scan" and plan.get("Relation Name") in HOT_TABLES:
+        scans.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        scans += _seq_scans(child)
+    return scans
+
+
+@pytest_asyncio.fixture
+async def seeded(test_client, db_session):
+    """Seed a few users, return the first one's auth headers and route arguments."""
+
+    users = [
+        await seed_user(
+            db_session,
+            SeedProfile(
+                spots=400, records_per_spot=2, images_per_spot=1, images_per_record=1, seed=seed
+            ),
+        )
+        for seed in range(3)
+    ]
+    await db_session.commit()
+    await db_session.execute(text("ANALYZE"))
+    user = users[0]
+    headers = {"Authorization": f"Bearer {await get_jwt_strategy().write_token(user)}"}
+
+    spot_id = (
+        await db_session.execute(select(Spot.id).where(Spot.user_id == user.id).limit(1))
+    ).scalar_one()
+    record_id = (
+        await db_session.execute(
+            select(GoshuinRecord.id).where(GoshuinRecord.user_id == user.id).limit(1)
+        )
+    ).scalar_one()
+    spot_cursor = (await test_client.get("/api/spots/", headers=headers)).json()["next_cursor"]
+    goshuin_cursor = (await test_client.get("/api/goshuin", headers=headers)).json()[
+        "next_cursor"
+    ]
+
+    return headers, {
+        "prefecture": quote(PREFECTURES[0]),
+        "spot_id": spot_id,
+        "record_id": record_id,
+        "spot_cursor": spot_cursor,
+        "goshuin_cursor": goshuin_cursor,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("route", ROUTES)
+async def test_route_queries_use_indexes(route, seeded, test_client, db_session, engine):
+    headers, arguments = seeded
+    statements: list[tuple[str, Any]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        response = await test_client.get(route.format(**arguments), headers=headers)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+    assert response.status_code == 200, response.text
+    assert statements
+
+    connection = await db_session.connection()
+    await connection.exec_driver_sql("SET enable_seqscan = off")
+    try:
+        for statement, parameters in statements:
+            plan = (
+                await connection.exec_driver_sql(
+                    f"EXPLAIN (FORMAT JSON) {statement}", parameters
+                )
+            ).scalar_one()
+            scans = _seq_scans(plan[0]["Plan"])
+            assert not scans, f"{route} scans {scans} sequentially:\n{statement}"
+    finally:
+        await connection.exec_driver_sql("RESET enable_seqscan")
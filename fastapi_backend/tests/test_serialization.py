@@ -0,0 +1,58 @@
+import json
+import logging
+from datetime import date, datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app import serialization
+from app.models import SpotType
+from app.serialization import FastJSONResponse, get_json_dumps
+
+
+@pytest.mark.parametrize("backend", ["orjson", "msgspec", "json"])
+def test_json_dumps_handles_domain_types(backend):
+    if backend != "json":
+        pytest.importorskip(backend)
+    dumps = get_json_dumps(backend)
+    identifier = uuid4()
+    payload = {
+        "id": identifier,
+        "spot_type": SpotType.TEMPLE,
+        "visit_date": date(2024, 4, 1),
+        "created_at": datetime(2024, 4, 1, 9, 30),
+        "updated_at": datetime(2024, 4, 2, 12, 0, tzinfo=timezone.utc),
+        "name": "浅草寺",
+    }
+
+    decoded = json.loads(dumps(payload))
+
+    assert decoded == {
+        "id": str(identifier),
+        "spot_type": "temple",
+        "visit_date": "2024-04-01",
+        "created_at": "2024-04-01T09:30:00",
+        "updated_at": "2024-04-02T12:00:00Z",
+        "name": "浅草寺",
+    }
+
+
+def test_unavailable_backend_falls_back_with_warning(monkeypatch, caplog):
+    monkeypatch.setattr(serialization, "msgspec", None)
+
+    with caplog.at_level(logging.WARNING, logger="app.serialization"):
+        dumps = get_json_dumps("msgspec")
+
+    assert dumps is serialization._stdlib_dumps
+    assert "falling back to the stdlib encoder" in caplog.text
+
+
+def test_json_dumps_keeps_non_ascii_unescaped():
+    assert "御朱印".encode("utf-8") in get_json_dumps("json")({"notes": "御朱印"})
+
+
+def test_fast_json_response_renders_bytes():
+    response = FastJSONResponse({"items": [1, 2, 3]})
+
+    assert json.loads(response.body) == {"items": [1, 2, 3]}
+    assert response.media_type == "application/json"